@@ -6,25 +6,20 @@ Debug script to see what KPIs are being calculated
 
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 import json
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
 from database import DatabaseService
+from sync_common import DEFAULT_DB_PATH, load_config
 from kpi_calculator_db import KPICalculatorDB
 
 
 def main():
     """Check KPI data"""
 
-    load_dotenv()
-
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    db = DatabaseService("./data/kpi_data.db")
+    config = load_config()
+    db = DatabaseService(DEFAULT_DB_PATH)
     calculator = KPICalculatorDB(db, config)
 
     print("\n" + "="*60)
@@ -35,7 +35,7 @@ def main():
 
         print("\nCurrent projects:")
         projects_to_delete = []
-        for row in cursor.fetchall():
+        for row in cursor:
             project = row['project']
             count = row['count']
             status = ""
@@ -83,7 +83,7 @@ def main():
         """)
 
         print("\nRemaining projects:")
-        for row in cursor.fetchall():
+        for row in cursor:
             print(f"  {row['project']}: {row['count']} issues")
 
     print(f"\nTotal Issues:  {stats['issues_count']}")
@@ -6,48 +6,17 @@ Discovers available JIRA projects and recent issues
 
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
+from sync_common import connect_jira, load_config
 
 
 def main():
     """Discover available projects"""
 
-    load_dotenv()
-
-    # Load configuration
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    # Initialize JIRA client
-    jira_config = config.get("jira", {})
-    jira_urls = jira_config.get("urls", [])
-
-    if not jira_urls:
-        print("\n❌ No JIRA URLs configured!")
-        sys.exit(1)
-
-    jira_url = jira_urls[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
-
-    print("\n" + "="*60)
-    print("JIRA PROJECT DISCOVERY")
-    print("="*60)
-    print(f"\nJIRA URL: {jira_url}")
-
-    # Test connection
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
-
-    print("\n✓ Connected to JIRA")
+    jira_client = connect_jira("JIRA PROJECT DISCOVERY", load_config())
+    print(f"JIRA URL: {jira_client.jira_url}")
 
     # Try to get all boards first
     print("\n📋 Boards you have access to:")
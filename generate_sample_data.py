@@ -57,6 +57,10 @@ def main():
         []
     ]
 
+    # Collected first and written in bulk below
+    issues = []
+    changelogs = {}
+
     issue_count = 0
     for project in projects:
         for i in range(1, 101):  # 100 issues per project
@@ -99,13 +103,15 @@ def main():
                 }
             }
 
-            db.upsert_issue(issue_data)
+            issues.append(issue_data)
 
             # Add some changelog entries for completed issues
             if resolved_date and random.random() < 0.7:  # 70% of completed issues have changelog
+                histories = changelogs.setdefault(key, [])
+
                 # In Progress transition
                 in_progress_date = created_date + timedelta(days=random.randint(1, 5))
-                db.insert_changelog_entry(key, {
+                histories.append({
                     'created': in_progress_date.isoformat(),
                     'author': {'displayName': f'User {random.randint(1, 10)}'},
                     'items': [{
@@ -116,7 +122,7 @@ def main():
                 })
 
                 # Done transition
-                db.insert_changelog_entry(key, {
+                histories.append({
                     'created': resolved_date.isoformat(),
                     'author': {'displayName': f'User {random.randint(1, 10)}'},
                     'items': [{
@@ -129,7 +135,7 @@ def main():
                 # Some issues were reopened
                 if random.random() < 0.15:  # 15% reopened
                     reopen_date = resolved_date + timedelta(days=random.randint(1, 3))
-                    db.insert_changelog_entry(key, {
+                    histories.append({
                         'created': reopen_date.isoformat(),
                         'author': {'displayName': f'User {random.randint(1, 10)}'},
                         'items': [{
@@ -139,7 +145,11 @@ def main():
                         }]
                     })
 
-            issues_synced += 1
+    # One transaction for the issues, one for all changelog entries
+    issues_synced = db.upsert_issues_bulk(issues)
+    with db.get_connection():
+        for key, histories in changelogs.items():
+            db.insert_changelog_entries(key, histories)
 
     print(f"✓ Generated {issues_synced} sample issues")
 
@@ -7,13 +7,14 @@ __version__ = "1.0.0"
 __author__ = "Platform Engineering Team"
 __description__ = "JIRA-based KPI Dashboard for Platform Engineering"
 
-from .jira_client import JiraClient
+from .jira_client import JiraClient, get_client
 from .kpi_calculator import KPICalculator
 from .dashboard import KPIDashboard
 from .config_loader import ConfigLoader
 
 __all__ = [
     "JiraClient",
+    "get_client",
     "KPICalculator",
     "KPIDashboard",
     "ConfigLoader"
@@ -100,6 +100,17 @@ class ConfigLoader:
                 self.config["dashboard"] = {}
             self.config["dashboard"]["debug"] = os.getenv("DASHBOARD_DEBUG").lower() == "true"
 
+        # Cache settings
+        if os.getenv("CACHE_DIR"):
+            if "cache" not in self.config:
+                self.config["cache"] = {}
+            self.config["cache"]["cache_dir"] = os.getenv("CACHE_DIR")
+
+        if os.getenv("CACHE_TTL"):
+            if "cache" not in self.config:
+                self.config["cache"] = {}
+            self.config["cache"]["ttl_minutes"] = int(os.getenv("CACHE_TTL"))
+
     def _validate(self):
         """Validate configuration"""
         errors = []
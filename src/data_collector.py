@@ -112,8 +112,8 @@ class DataCollector:
         for project in self.projects:
             try:
                 boards = self.jira.get_boards(project_key=project)
+                self.db.upsert_boards_bulk(boards)
                 for board in boards:
-                    self.db.upsert_board(board)
                     all_boards.append(board)
                     self.logger.info(f"Synced board: {board.get('name')} (ID: {board.get('id')})")
             except Exception as e:
@@ -123,9 +123,8 @@ class DataCollector:
         if not all_boards:
             try:
                 boards = self.jira.get_boards()
-                for board in boards:
-                    self.db.upsert_board(board)
-                    all_boards.append(board)
+                self.db.upsert_boards_bulk(boards)
+                all_boards.extend(boards)
             except Exception as e:
                 self.logger.warning(f"Could not fetch boards: {e}")
 
@@ -152,8 +151,8 @@ class DataCollector:
                 for sprint in sprints:
                     # Add board name to sprint data
                     sprint['originBoardName'] = board_name
-                    self.db.upsert_sprint(sprint)
-                    sprint_count += 1
+                sprint_count += self.db.upsert_sprints_bulk(sprints)
+                for sprint in sprints:
                     self.logger.info(f"Synced sprint: {sprint.get('name')} (Board: {board_name})")
             except Exception as e:
                 self.logger.warning(f"Could not fetch sprints for board {board_name}: {e}")
@@ -192,12 +191,7 @@ class DataCollector:
 
                 if issues:
                     print(f"Found {len(issues)} issues in project {project}...")
-                    for issue in tqdm(issues, desc=f"Syncing {project}"):
-                        try:
-                            self.db.upsert_issue(issue)
-                            issue_count += 1
-                        except Exception as e:
-                            self.logger.error(f"Error syncing issue {issue.get('key')}: {e}")
+                    issue_count += self.db.upsert_issues_bulk(issues, on_error=self._log_issue_error)
                 else:
                     print(f"No issues found in project {project}")
 
@@ -212,12 +206,7 @@ class DataCollector:
 
                     if issues:
                         print(f"Found {len(issues)} issues in {project} (simple query)...")
-                        for issue in tqdm(issues, desc=f"Syncing {project}"):
-                            try:
-                                self.db.upsert_issue(issue)
-                                issue_count += 1
-                            except Exception as e:
-                                self.logger.error(f"Error syncing issue {issue.get('key')}: {e}")
+                        issue_count += self.db.upsert_issues_bulk(issues, on_error=self._log_issue_error)
 
                 except Exception as e:
                     self.logger.error(f"All queries failed for project {project}: {e}")
@@ -233,18 +222,17 @@ class DataCollector:
 
                 if issues:
                     print(f"Found {len(issues)} issues (global search)...")
-                    for issue in tqdm(issues, desc="Syncing issues"):
-                        try:
-                            self.db.upsert_issue(issue)
-                            issue_count += 1
-                        except Exception as e:
-                            self.logger.error(f"Error syncing issue {issue.get('key')}: {e}")
+                    issue_count += self.db.upsert_issues_bulk(issues, on_error=self._log_issue_error)
 
             except Exception as e:
                 self.logger.error(f"Global search also failed: {e}")
 
         return issue_count
 
+    def _log_issue_error(self, issue: Dict, error: Exception):
+        """Log an issue that could not be stored (used as upsert_issues_bulk's on_error)"""
+        self.logger.error(f"Error syncing issue {issue.get('key')}: {error}")
+
     def _sync_changelog(self):
         """
         Sync changelog for all issues in database
@@ -260,8 +248,8 @@ class DataCollector:
                 issue_key = issue['key']
                 changelog = self.jira.get_issue_changelog(issue_key)
 
-                for entry in changelog:
-                    self.db.insert_changelog_entry(issue_key, entry)
+                if changelog:
+                    self.db.insert_changelog_entries(issue_key, changelog, replace=True)
 
             except Exception as e:
                 self.logger.warning(f"Could not fetch changelog for {issue_key}: {e}")
@@ -290,9 +278,7 @@ class DataCollector:
 
             issues = self.jira.search_issues(jql, max_results=1000)
 
-            for issue in issues:
-                self.db.upsert_issue(issue)
-                issues_synced += 1
+            issues_synced = self.db.upsert_issues_bulk(issues)
 
             self.db.complete_sync(sync_id, issues_synced, 0)
 
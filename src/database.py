@@ -3,14 +3,134 @@ Database service for storing and retrieving JIRA data
 Uses SQLite for simple, local data persistence
 """
 
+import atexit
 import sqlite3
 import logging
 import json
+import queue
+import threading
+import time
+import zlib
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, Iterator, List, Dict, Any, Optional
 from contextlib import contextmanager
 
+try:
+    # Faster serialization of the raw issue payloads stored on every upsert
+    import orjson
+except ImportError:
+    orjson = None
+
+SECONDS_PER_DAY = 86400
+
+# Idle read-only connections kept for reuse (matches the KPI worker count)
+READ_POOL_SIZE = 6
+# Page cache per connection, in KiB (negative cache_size means KiB)
+CACHE_KIB = 65536
+
+# Stay under SQLite's default limit of 999 bound parameters per statement
+SQLITE_MAX_PARAMS = 900
+
+# How long get_stats() answers from memory before counting rows again
+STATS_TTL_SECONDS = 30
+
+# Statuses counted as completed and labels (lowercase) marking unplanned
+# work in the sprint roll-up
+DONE_STATUSES = frozenset({'Done', 'Closed', 'Resolved'})
+UNPLANNED_LABELS = frozenset({'unplanned', 'interrupt', 'urgent', 'incident'})
+
+# Statuses marking the start of work, for issues.first_in_progress_*
+IN_PROGRESS_STATUSES = frozenset({'In Progress', 'In Development'})
+
+# Columns written by upsert_issues_bulk, in _issue_row order
+ISSUE_COLUMNS = (
+    'key', 'project', 'summary', 'description', 'issue_type', 'status', 'priority',
+    'assignee', 'reporter', 'created', 'updated', 'resolved', 'resolution',
+    'labels', 'components', 'sprint_ids', 'story_points', 'raw_data', 'synced_at',
+    'created_epoch', 'updated_epoch', 'resolved_epoch', 'primary_label', 'has_unplanned_label',
+)
+
+# Columns returned by issue reads: everything except raw_data, the full
+# payload, which no reader needs and which dominates row size
+ISSUE_READ_COLUMNS = tuple(c for c in ISSUE_COLUMNS if c != 'raw_data') + (
+    'first_in_progress_at', 'first_in_progress_epoch',
+)
+ISSUE_SELECT = ', '.join(ISSUE_READ_COLUMNS)
+
+# JIRA fields _issue_row reads; fetches that only feed upserts can request
+# just these instead of every field
+ISSUE_FIELDS = (
+    'summary', 'description', 'issuetype', 'status', 'priority', 'assignee', 'reporter',
+    'created', 'updated', 'resolutiondate', 'resolution', 'labels', 'components', 'project',
+    'customfield_10016',  # story points
+    'sprint',  # Agile API sprint field, preferred by _issue_row when present
+    'customfield_10020',  # sprint field
+)
+
+# Issue upsert, built once; conflicting rows are updated in place rather than
+# deleted and re-inserted like INSERT OR REPLACE
+UPSERT_ISSUE_SQL = f"""
+    INSERT INTO issues ({', '.join(ISSUE_COLUMNS)})
+    VALUES ({', '.join('?' * len(ISSUE_COLUMNS))})
+    ON CONFLICT(key) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in ISSUE_COLUMNS[1:])}
+"""
+
+# First move into an in-progress status, from the changelog; also built once
+# so every batch reuses the same prepared statement
+FIRST_IN_PROGRESS_SQL = f"""
+    UPDATE issues SET (first_in_progress_at, first_in_progress_epoch) = (
+        SELECT created, created_epoch FROM issue_changelog
+        WHERE issue_key = issues.key AND field = 'status'
+        AND to_value IN ({', '.join('?' * len(IN_PROGRESS_STATUSES))})
+        ORDER BY created
+        LIMIT 1
+    )
+"""
+FIRST_IN_PROGRESS_BY_KEY_SQL = FIRST_IN_PROGRESS_SQL + " WHERE key = ?"
+FIRST_IN_PROGRESS_PARAMS = tuple(IN_PROGRESS_STATUSES)
+
+# Integer copies of timestamp columns (UNIX seconds), kept alongside the ISO strings
+EPOCH_COLUMNS = {
+    'issues': (('created', 'created_epoch'), ('updated', 'updated_epoch'), ('resolved', 'resolved_epoch')),
+    'issue_changelog': (('created', 'created_epoch'),),
+}
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to a compact JSON string, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(',', ':'))
+
+
+# Parses the JSON columns of every row read; orjson when available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def to_epoch(value: Optional[str]) -> Optional[int]:
+    """
+    Convert a JIRA/ISO timestamp to UNIX seconds
+
+    Args:
+        value: Timestamp such as '2024-01-31T12:00:00.000+0000'; naive
+            timestamps are taken as local time
+
+    Returns:
+        Seconds since the epoch, or None if missing or unparseable
+    """
+    if not value:
+        return None
+    text = value.replace('Z', '+00:00')
+    # JIRA writes offsets as +0000; fromisoformat before 3.11 needs +00:00
+    if len(text) > 5 and text[-5] in '+-' and text[-4:].isdigit():
+        text = f"{text[:-2]}:{text[-2:]}"
+    try:
+        return int(datetime.fromisoformat(text).timestamp())
+    except ValueError:
+        return None
+
 
 class DatabaseService:
     """Service for managing JIRA data in SQLite database"""
@@ -24,6 +144,18 @@ class DatabaseService:
         """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        # Reused read-only connections, most recently returned first so the
+        # warmest page cache is handed out next
+        self._read_pool = queue.LifoQueue(maxsize=READ_POOL_SIZE)
+        # One write connection per thread, kept open for the service's
+        # lifetime; all of them are tracked so close() can reach them
+        self._local = threading.local()
+        self._write_conns = []
+        self._write_conns_lock = threading.Lock()
+        atexit.register(self.close)
+        # (monotonic time, stats) from the last get_stats(); dropped whenever
+        # a write block ends
+        self._stats_cache = None
 
         # Ensure data directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -33,23 +165,108 @@ class DatabaseService:
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        """
+        Context manager for the calling thread's write connection
+
+        The connection stays open between calls, so small writes don't pay
+        for connecting and setting pragmas each time. The outermost block
+        commits (or rolls back on error); nested blocks join its transaction.
+        """
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = local.conn = self._open_write_connection()
+            local.depth = 0
+
+        local.depth += 1
         try:
             yield conn
-            conn.commit()
+            if local.depth == 1:
+                conn.commit()
         except Exception:
-            conn.rollback()
+            if local.depth == 1:
+                conn.rollback()
             raise
         finally:
+            local.depth -= 1
+            # Every write goes through here, so cached counts may be stale
+            self._stats_cache = None
+
+    def _open_write_connection(self) -> sqlite3.Connection:
+        """Open a write connection for the calling thread"""
+        # Only the owning thread uses it; close() may run on another thread
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        # Per-connection settings; WAL itself is persistent (see _init_schema).
+        # In WAL mode NORMAL cannot corrupt the database and skips most fsyncs
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_KIB}")
+        with self._write_conns_lock:
+            self._write_conns.append(conn)
+        return conn
+
+    @contextmanager
+    def get_read_connection(self):
+        """
+        Context manager for pooled read-only connections
+
+        Connections are opened with mode=ro and query_only, so writes fail.
+        They are returned to a small pool instead of closed, which keeps
+        their page caches warm across KPI queries. Under WAL each statement
+        still sees the latest committed data.
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_read_connection()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def _open_read_connection(self) -> sqlite3.Connection:
+        """Open a read-only connection for the pool"""
+        # Pooled connections move between worker threads, one at a time
+        conn = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_KIB}")
+        return conn
+
+    def close_read_connections(self):
+        """Close all pooled read-only connections"""
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def close(self):
+        """Close every connection held by the service (also run at exit)"""
+        self.close_read_connections()
+        with self._write_conns_lock:
+            conns, self._write_conns = self._write_conns, []
+        for conn in conns:
             conn.close()
+        # Threads that wrote before will open a fresh connection next time
+        self._local = threading.local()
 
     def _init_schema(self):
         """Initialize database schema"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
+            # WAL lets KPI reads run concurrently with each other and with a sync.
+            # The mode is persistent, so setting it once per open is enough.
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             # Issues table - stores all JIRA issues
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS issues (
@@ -71,7 +288,14 @@ class DatabaseService:
                     sprint_ids TEXT,  -- JSON array of sprint IDs
                     story_points REAL,
                     raw_data TEXT,  -- Full JSON of issue
-                    synced_at TEXT NOT NULL
+                    synced_at TEXT NOT NULL,
+                    created_epoch INTEGER,
+                    updated_epoch INTEGER,
+                    resolved_epoch INTEGER,
+                    first_in_progress_at TEXT,  -- Earliest move to an in-progress status
+                    first_in_progress_epoch INTEGER,
+                    primary_label TEXT DEFAULT 'unlabeled',  -- First label, the work mix category
+                    has_unplanned_label INTEGER NOT NULL DEFAULT 0  -- Any label in UNPLANNED_LABELS
                 )
             """)
 
@@ -102,10 +326,34 @@ class DatabaseService:
                     field TEXT,
                     from_value TEXT,
                     to_value TEXT,
+                    created_epoch INTEGER,
+                    FOREIGN KEY (issue_key) REFERENCES issues (key)
+                )
+            """)
+
+            # Issue/sprint membership - one row per sprint an issue has been in
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS issue_sprints (
+                    issue_key TEXT NOT NULL,
+                    sprint_id INTEGER NOT NULL,
+                    PRIMARY KEY (issue_key, sprint_id),
                     FOREIGN KEY (issue_key) REFERENCES issues (key)
                 )
             """)
 
+            # Sprint roll-up - per sprint and project issue counts, rebuilt after each sync
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sprint_rollup (
+                    sprint_id INTEGER NOT NULL,
+                    project TEXT NOT NULL,
+                    committed INTEGER NOT NULL,
+                    completed INTEGER NOT NULL,
+                    unplanned INTEGER NOT NULL,
+                    refreshed_at TEXT NOT NULL,
+                    PRIMARY KEY (sprint_id, project)
+                )
+            """)
+
             # Boards table - stores board information
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS boards (
@@ -133,17 +381,154 @@ class DatabaseService:
                 )
             """)
 
+            # The issue 'updated' value each changelog was last fetched at;
+            # an issue that hasn't been updated since has the same changelog
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS changelog_sync_state (
+                    issue_key TEXT PRIMARY KEY,
+                    updated TEXT
+                )
+            """)
+
+            # Per-sprint cursor for incremental issue syncs: when the
+            # sprint's issues were last fetched successfully
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sprint_sync_cursors (
+                    sprint_id INTEGER PRIMARY KEY,
+                    synced_epoch INTEGER NOT NULL
+                )
+            """)
+
+            # Per-project cursor for incremental project searches
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS project_sync_cursors (
+                    project TEXT PRIMARY KEY,
+                    synced_epoch INTEGER NOT NULL
+                )
+            """)
+
+            # Committed vs completed counts from greenhopper sprint reports,
+            # written by sync_sprint_reports.py; report_data is the
+            # zlib-compressed report JSON (see get_sprint_report)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sprint_reports (
+                    sprint_id INTEGER PRIMARY KEY,
+                    board_id INTEGER,
+                    sprint_name TEXT,
+                    project TEXT,
+                    committed_count INTEGER,
+                    completed_count INTEGER,
+                    punted_count INTEGER,
+                    completion_rate REAL,
+                    report_data BLOB,
+                    synced_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            self._add_epoch_columns(cursor)
+            self._add_first_in_progress_columns(cursor)
+            self._add_label_columns(cursor)
+
             # Create indexes for performance
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_project ON issues(project)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_status ON issues(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_project_status ON issues(project, status)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_created ON issues(created)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_resolved ON issues(resolved)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_sprints_board ON sprints(board_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_sprints_state ON sprints(state)")
+            # Most recently ended sprints of a state, read in index order
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sprints_state_end ON sprints(state, end_date)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_changelog_issue ON issue_changelog(issue_key)")
+            # Covers "issues that ever moved to status X" lookups
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_changelog_field_to_value ON issue_changelog(field, to_value, issue_key)")
+            # Newest changes to a field, without sorting the field's history
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_changelog_field_created ON issue_changelog(field, created)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_issue_sprints_sprint ON issue_sprints(sprint_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_unplanned ON issues(key) WHERE has_unplanned_label")
+            # Composite indexes matching the KPI filters in query_issues
+            for old_index in ("idx_issues_status_type_resolved", "idx_issues_type_created", "idx_issues_type_updated"):
+                cursor.execute(f"DROP INDEX IF EXISTS {old_index}")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_status_type_resolved_epoch ON issues(status, issue_type, resolved_epoch)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_type_created_epoch ON issues(issue_type, created_epoch)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_type_updated_epoch ON issues(issue_type, updated_epoch)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_issues_project_type ON issues(project, issue_type)")
+
+            # Backfill membership for databases synced before issue_sprints existed
+            if cursor.execute("SELECT 1 FROM issue_sprints LIMIT 1").fetchone() is None:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO issue_sprints (issue_key, sprint_id)
+                    SELECT i.key, j.value FROM issues i, json_each(i.sprint_ids) j
+                    WHERE i.sprint_ids IS NOT NULL AND i.sprint_ids != '[]' AND j.value IS NOT NULL
+                """)
+
+            # Build the roll-up for databases synced before sprint_rollup existed
+            if (cursor.execute("SELECT 1 FROM sprint_rollup LIMIT 1").fetchone() is None
+                    and cursor.execute("SELECT 1 FROM issue_sprints LIMIT 1").fetchone() is not None):
+                self._refresh_sprint_rollup(cursor)
 
             self.logger.info(f"Database initialized at {self.db_path}")
 
+    def _add_epoch_columns(self, cursor: sqlite3.Cursor):
+        """Add and backfill epoch columns on databases created before they existed"""
+        for table, columns in EPOCH_COLUMNS.items():
+            existing = {row['name'] for row in cursor.execute(f"PRAGMA table_info({table})")}
+            missing = [(source, target) for source, target in columns if target not in existing]
+            if not missing:
+                continue
+
+            for _, target in missing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {target} INTEGER")
+
+            key_column = 'key' if table == 'issues' else 'id'
+            sources = ', '.join(source for source, _ in missing)
+            rows = cursor.execute(f"SELECT {key_column}, {sources} FROM {table}").fetchall()
+            assignments = ', '.join(f"{target} = ?" for _, target in missing)
+            cursor.executemany(
+                f"UPDATE {table} SET {assignments} WHERE {key_column} = ?",
+                [tuple(to_epoch(row[source]) for source, _ in missing) + (row[key_column],) for row in rows]
+            )
+            self.logger.info(f"Backfilled {len(missing)} epoch column(s) on {len(rows)} {table} rows")
+
+    def _add_first_in_progress_columns(self, cursor: sqlite3.Cursor):
+        """Add and backfill issues.first_in_progress_* on databases created before they existed"""
+        existing = {row['name'] for row in cursor.execute("PRAGMA table_info(issues)")}
+        if 'first_in_progress_epoch' in existing:
+            return
+
+        cursor.execute("ALTER TABLE issues ADD COLUMN first_in_progress_at TEXT")
+        cursor.execute("ALTER TABLE issues ADD COLUMN first_in_progress_epoch INTEGER")
+        self._update_first_in_progress(cursor)
+        self.logger.info("Backfilled first in-progress timestamps from issue_changelog")
+
+    def _add_label_columns(self, cursor: sqlite3.Cursor):
+        """Add and backfill the columns derived from labels on databases created before them"""
+        existing = {row['name'] for row in cursor.execute("PRAGMA table_info(issues)")}
+
+        if 'primary_label' not in existing:
+            cursor.execute("ALTER TABLE issues ADD COLUMN primary_label TEXT DEFAULT 'unlabeled'")
+            cursor.execute("""
+                UPDATE issues SET primary_label = COALESCE(json_extract(labels, '$[0]'), 'unlabeled')
+            """)
+
+        if 'has_unplanned_label' not in existing:
+            cursor.execute("ALTER TABLE issues ADD COLUMN has_unplanned_label INTEGER NOT NULL DEFAULT 0")
+            cursor.execute(f"""
+                UPDATE issues SET has_unplanned_label = EXISTS (
+                    SELECT 1 FROM json_each(issues.labels)
+                    WHERE lower(value) IN ({', '.join('?' * len(UNPLANNED_LABELS))})
+                )
+                WHERE labels IS NOT NULL AND labels != '[]'
+            """, tuple(UNPLANNED_LABELS))
+
+    def _update_first_in_progress(self, cursor: sqlite3.Cursor, issue_keys: List[str] = None):
+        """Recompute first_in_progress_* from the changelog for the given issues (or all)"""
+        if issue_keys is None:
+            cursor.execute(FIRST_IN_PROGRESS_SQL, FIRST_IN_PROGRESS_PARAMS)
+        else:
+            cursor.executemany(FIRST_IN_PROGRESS_BY_KEY_SQL,
+                               [FIRST_IN_PROGRESS_PARAMS + (key,) for key in issue_keys])
+
     def start_sync(self, sync_type: str, projects: List[str]) -> int:
         """
         Start a new sync operation
@@ -182,6 +567,31 @@ class DatabaseService:
                 WHERE id = ?
             """, (datetime.now().isoformat(), status, issues_synced, sprints_synced, error, sync_id))
 
+            # Every sync pipeline ends here, so the roll-up tracks the synced data
+            self._refresh_sprint_rollup(cursor)
+
+    def refresh_sprint_rollup(self):
+        """Rebuild the sprint roll-up from issues and issue_sprints"""
+        with self.get_connection() as conn:
+            self._refresh_sprint_rollup(conn.cursor())
+
+    def _refresh_sprint_rollup(self, cursor: sqlite3.Cursor):
+        """Rebuild the sprint roll-up using an open cursor"""
+        cursor.execute("DELETE FROM sprint_rollup")
+        cursor.execute(f"""
+            INSERT INTO sprint_rollup (sprint_id, project, committed, completed, unplanned, refreshed_at)
+            SELECT
+                s.sprint_id,
+                COALESCE(i.project, ''),
+                COUNT(*),
+                SUM(i.status IN ({', '.join('?' * len(DONE_STATUSES))})),
+                SUM(i.has_unplanned_label),
+                ?
+            FROM issue_sprints s
+            JOIN issues i ON i.key = s.issue_key
+            GROUP BY s.sprint_id, i.project
+        """, (*DONE_STATUSES, datetime.now().isoformat()))
+
     def upsert_issue(self, issue_data: Dict):
         """
         Insert or update an issue
@@ -189,48 +599,127 @@ class DatabaseService:
         Args:
             issue_data: Issue data dictionary from JIRA
         """
+        self.upsert_issues_bulk([issue_data])
+
+    def upsert_issues_bulk(self, issues: List[Dict],
+                           on_error: Callable[[Dict, Exception], None] = None) -> int:
+        """
+        Insert or update many issues in one transaction
+
+        Args:
+            issues: Issue data dictionaries from JIRA
+            on_error: If given, a failed batch is retried one issue at a time
+                and on_error(issue, exception) is called for each issue that
+                still fails; otherwise the exception propagates
+
+        Returns:
+            Number of issues stored
+        """
+        if not issues:
+            return 0
+
+        try:
+            self._write_issues(issues)
+            return len(issues)
+        except Exception:
+            if on_error is None:
+                raise
+
+        stored = 0
+        for issue in issues:
+            try:
+                self._write_issues([issue])
+                stored += 1
+            except Exception as e:
+                on_error(issue, e)
+        return stored
+
+    def _write_issues(self, issues: List[Dict]):
+        """Upsert issues and their sprint membership in one transaction"""
+        rows = []
+        memberships = []
+        synced_at = datetime.now().isoformat()
+        for issue_data in issues:
+            row, sprint_ids = self._issue_row(issue_data, synced_at)
+            rows.append(row)
+            memberships.append((row[0], sprint_ids))
+        keys = [key for key, _ in memberships]
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            fields = issue_data.get('fields', {})
-            key = issue_data.get('key')
+            cursor.executemany(UPSERT_ISSUE_SQL, rows)
 
-            # Extract sprint IDs
-            sprint_field = fields.get('sprint') or fields.get('customfield_10020', [])
-            sprint_ids = []
-            if sprint_field:
-                if isinstance(sprint_field, list):
-                    sprint_ids = [s.get('id') for s in sprint_field if isinstance(s, dict) and s.get('id')]
-                elif isinstance(sprint_field, dict):
-                    sprint_ids = [sprint_field.get('id')]
+            # New issues may already have changelog entries
+            self._update_first_in_progress(cursor, keys)
 
-            cursor.execute("""
-                INSERT OR REPLACE INTO issues (
-                    key, project, summary, description, issue_type, status, priority,
-                    assignee, reporter, created, updated, resolved, resolution,
-                    labels, components, sprint_ids, story_points, raw_data, synced_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                key,
-                issue_data.get('fields', {}).get('project', {}).get('key'),
-                fields.get('summary'),
-                fields.get('description'),
-                fields.get('issuetype', {}).get('name'),
-                fields.get('status', {}).get('name'),
-                fields.get('priority', {}).get('name') if fields.get('priority') else None,
-                fields.get('assignee', {}).get('displayName') if fields.get('assignee') else None,
-                fields.get('reporter', {}).get('displayName') if fields.get('reporter') else None,
-                fields.get('created'),
-                fields.get('updated'),
-                fields.get('resolutiondate'),
-                fields.get('resolution', {}).get('name') if fields.get('resolution') else None,
-                json.dumps(fields.get('labels', [])),
-                json.dumps([c.get('name') for c in fields.get('components', [])]),
-                json.dumps(sprint_ids),
-                fields.get('customfield_10016'),  # Story points field
-                json.dumps(issue_data),
-                datetime.now().isoformat()
-            ))
+            # Keep the normalized sprint membership in step with sprint_ids
+            cursor.executemany("DELETE FROM issue_sprints WHERE issue_key = ?", [(key,) for key in keys])
+            cursor.executemany(
+                "INSERT OR IGNORE INTO issue_sprints (issue_key, sprint_id) VALUES (?, ?)",
+                [(key, sprint_id) for key, sprint_ids in memberships
+                 for sprint_id in sprint_ids if sprint_id is not None]
+            )
+
+    @staticmethod
+    def _issue_row(issue_data: Dict, synced_at: str) -> tuple:
+        """
+        Flatten a JIRA issue into an issues row
+
+        Args:
+            issue_data: Issue data dictionary from JIRA
+            synced_at: Timestamp recorded for the whole batch
+
+        Returns:
+            Tuple of (row values in ISSUE_COLUMNS order, sprint IDs)
+        """
+        fields = issue_data.get('fields', {})
+        # Bound once; the row below does a couple of dozen lookups
+        get = fields.get
+        labels = get('labels') or []
+
+        # Extract sprint IDs
+        sprint_field = get('sprint') or get('customfield_10020', [])
+        sprint_ids = []
+        if sprint_field:
+            if isinstance(sprint_field, list):
+                sprint_ids = [s.get('id') for s in sprint_field if isinstance(s, dict) and s.get('id')]
+            elif isinstance(sprint_field, dict):
+                sprint_ids = [sprint_field.get('id')]
+
+        created = get('created')
+        updated = get('updated')
+        resolved = get('resolutiondate')
+        updated_epoch = to_epoch(updated)
+        row = (
+            issue_data.get('key'),
+            get('project', {}).get('key'),
+            get('summary'),
+            get('description'),
+            get('issuetype', {}).get('name'),
+            get('status', {}).get('name'),
+            (get('priority') or {}).get('name'),
+            (get('assignee') or {}).get('displayName'),
+            (get('reporter') or {}).get('displayName'),
+            created,
+            updated,
+            resolved,
+            (get('resolution') or {}).get('name'),
+            _json_dumps(labels),
+            _json_dumps([c.get('name') for c in get('components', [])]),
+            _json_dumps(sprint_ids),
+            get('customfield_10016'),  # Story points field
+            # The raw payload dominates row building; see _json_dumps
+            _json_dumps(issue_data),
+            synced_at,
+            to_epoch(created),
+            updated_epoch,
+            # Resolving an issue is usually its last update
+            updated_epoch if resolved == updated else to_epoch(resolved),
+            labels[0] if labels else 'unlabeled',
+            any(str(label).lower() in UNPLANNED_LABELS for label in labels)
+        )
+        return row, sprint_ids
 
     def upsert_sprint(self, sprint_data: Dict):
         """
@@ -239,14 +728,24 @@ class DatabaseService:
         Args:
             sprint_data: Sprint data dictionary from JIRA
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO sprints (
-                    id, name, board_id, board_name, state, start_date, end_date,
-                    complete_date, goal, raw_data, synced_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        self.upsert_sprints_bulk([sprint_data])
+
+    def upsert_sprints_bulk(self, sprints: List[Dict]) -> int:
+        """
+        Insert or update many sprints in one transaction
+
+        Args:
+            sprints: Sprint data dictionaries from JIRA
+
+        Returns:
+            Number of sprints stored
+        """
+        if not sprints:
+            return 0
+
+        synced_at = datetime.now().isoformat()
+        rows = [
+            (
                 sprint_data.get('id'),
                 sprint_data.get('name'),
                 sprint_data.get('originBoardId'),
@@ -257,8 +756,18 @@ class DatabaseService:
                 sprint_data.get('completeDate'),
                 sprint_data.get('goal'),
                 json.dumps(sprint_data),
-                datetime.now().isoformat()
-            ))
+                synced_at
+            )
+            for sprint_data in sprints
+        ]
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO sprints (
+                    id, name, board_id, board_name, state, start_date, end_date,
+                    complete_date, goal, raw_data, synced_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        return len(rows)
 
     def upsert_board(self, board_data: Dict):
         """
@@ -267,21 +776,40 @@ class DatabaseService:
         Args:
             board_data: Board data dictionary from JIRA
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.upsert_boards_bulk([board_data])
+
+    def upsert_boards_bulk(self, boards: List[Dict]) -> int:
+        """
+        Insert or update many boards in one transaction
+
+        Args:
+            boards: Board data dictionaries from JIRA
+
+        Returns:
+            Number of boards stored
+        """
+        if not boards:
+            return 0
+
+        synced_at = datetime.now().isoformat()
+        rows = []
+        for board_data in boards:
             location = board_data.get('location', {})
-            cursor.execute("""
-                INSERT OR REPLACE INTO boards (
-                    id, name, type, location_type, location_name, synced_at
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+            rows.append((
                 board_data.get('id'),
                 board_data.get('name'),
                 board_data.get('type'),
                 location.get('projectKeyOrId'),
                 location.get('displayName'),
-                datetime.now().isoformat()
+                synced_at
             ))
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO boards (
+                    id, name, type, location_type, location_name, synced_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+        return len(rows)
 
     def insert_changelog_entry(self, issue_key: str, changelog_item: Dict):
         """
@@ -291,25 +819,49 @@ class DatabaseService:
             issue_key: JIRA issue key
             changelog_item: Changelog item from JIRA
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.insert_changelog_entries(issue_key, [changelog_item])
 
-            for item in changelog_item.get('items', []):
-                cursor.execute("""
-                    INSERT INTO issue_changelog (
-                        issue_key, created, author, field, from_value, to_value
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    issue_key,
-                    changelog_item.get('created'),
-                    changelog_item.get('author', {}).get('displayName'),
-                    item.get('field'),
-                    item.get('fromString'),
-                    item.get('toString')
+    def insert_changelog_entries(self, issue_key: str, histories: List[Dict], replace: bool = False):
+        """
+        Insert an issue's changelog entries in one transaction
+
+        Args:
+            issue_key: JIRA issue key
+            histories: Changelog items from JIRA
+            replace: The histories are the issue's whole changelog; drop
+                previously stored entries so re-syncs don't duplicate them
+        """
+        rows = []
+        starts_work = False
+        for history in histories:
+            created = history.get('created')
+            created_epoch = to_epoch(created)
+            author = (history.get('author') or {}).get('displayName')
+            for item in history.get('items', []):
+                if item.get('field') == 'status' and item.get('toString') in IN_PROGRESS_STATUSES:
+                    starts_work = True
+                rows.append((
+                    issue_key, created, author, item.get('field'),
+                    item.get('fromString'), item.get('toString'), created_epoch
                 ))
 
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if replace:
+                cursor.execute("DELETE FROM issue_changelog WHERE issue_key = ?", (issue_key,))
+            cursor.executemany("""
+                INSERT INTO issue_changelog (
+                    issue_key, created, author, field, from_value, to_value, created_epoch
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+            # Replacing can also remove the entry the derived value came from
+            if starts_work or replace:
+                self._update_first_in_progress(cursor, [issue_key])
+
     def get_issues(self, project: str = None, status: str = None,
-                   issue_type: str = None, limit: int = None) -> List[Dict]:
+                   issue_type: str = None, limit: int = None,
+                   include_raw: bool = False) -> List[Dict]:
         """
         Get issues from database
 
@@ -318,14 +870,16 @@ class DatabaseService:
             status: Filter by status
             issue_type: Filter by issue type
             limit: Maximum number of results
+            include_raw: Also return raw_data, the stored JIRA payload
 
         Returns:
             List of issue dictionaries
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
 
-            query = "SELECT * FROM issues WHERE 1=1"
+            columns = f"{ISSUE_SELECT}, raw_data" if include_raw else ISSUE_SELECT
+            query = f"SELECT {columns} FROM issues WHERE 1=1"
             params = []
 
             if project:
@@ -345,31 +899,220 @@ class DatabaseService:
                 params.append(limit)
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
+            return [self._row_to_issue(row) for row in cursor.fetchall()]
 
-            # Convert rows to dictionaries and parse JSON fields
-            issues = []
-            for row in rows:
-                issue = dict(row)
-                issue['labels'] = json.loads(issue['labels']) if issue['labels'] else []
-                issue['components'] = json.loads(issue['components']) if issue['components'] else []
-                issue['sprint_ids'] = json.loads(issue['sprint_ids']) if issue['sprint_ids'] else []
-                issues.append(issue)
+    def query_issues(self, statuses: List[str] = None, types: List[str] = None,
+                     projects: List[str] = None, resolved_after: int = None,
+                     created_after: int = None, updated_after: int = None) -> List[Dict]:
+        """
+        Get issues matching all given filters, evaluated in SQL
+
+        Args:
+            statuses: Only issues in one of these statuses
+            types: Only issues of one of these types
+            projects: Only issues in one of these projects
+            resolved_after: Only issues resolved at or after this UNIX time
+            created_after: Only issues created at or after this UNIX time
+            updated_after: Only issues updated at or after this UNIX time
+
+        Returns:
+            List of issue dictionaries, newest first (same shape as get_issues)
+        """
+        return list(self.iter_issues(statuses, types, projects, resolved_after,
+                                     created_after, updated_after))
+
+    def iter_issues(self, statuses: List[str] = None, types: List[str] = None,
+                    projects: List[str] = None, resolved_after: int = None,
+                    created_after: int = None, updated_after: int = None) -> Iterator[Dict]:
+        """
+        Stream issues matching all given filters, one row at a time
+
+        Takes the same filters as query_issues. The connection stays open
+        until the generator is exhausted or closed, so consume it promptly.
+
+        Yields:
+            Issue dictionaries, newest first (same shape as get_issues)
+        """
+        where, params = self._issue_filters(statuses, types, projects, resolved_after,
+                                            created_after, updated_after)
+        query = f"SELECT {ISSUE_SELECT} FROM issues WHERE {where} ORDER BY created DESC"
+
+        with self.get_read_connection() as conn:
+            for row in conn.execute(query, params):
+                yield self._row_to_issue(row)
+
+    def count_issues_by_primary_label(self, types: List[str] = None, projects: List[str] = None,
+                                      created_after: int = None) -> List[tuple]:
+        """
+        Count issues per primary (first) label
+
+        Args:
+            types: Only issues of one of these types
+            projects: Only issues in one of these projects
+            created_after: Only issues created at or after this UNIX time
+
+        Returns:
+            List of (label, count) tuples, most common first; issues without
+            labels count under 'unlabeled'
+        """
+        where, params = self._issue_filters(types=types, projects=projects, created_after=created_after)
+        query = f"""
+            SELECT primary_label, COUNT(*) AS count FROM issues
+            WHERE {where}
+            GROUP BY primary_label
+            ORDER BY count DESC, primary_label
+        """
+
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [(row['primary_label'], row['count']) for row in cursor.fetchall()]
+
+    def get_cycle_times(self, statuses: List[str] = None, types: List[str] = None,
+                        projects: List[str] = None, resolved_after: int = None) -> List[tuple]:
+        """
+        Get cycle times of resolved issues, computed in SQL
+
+        Cycle time runs from the first move to an in-progress status (or
+        creation, if the issue never had one) to resolution, in whole days.
+        Issues resolved before they started are left out.
+
+        Args:
+            statuses: Only issues in one of these statuses
+            types: Only issues of one of these types
+            projects: Only issues in one of these projects
+            resolved_after: Only issues resolved at or after this UNIX time
+
+        Returns:
+            List of (issue_key, cycle_time_days) tuples, newest issue first
+        """
+        where, params = self._issue_filters(statuses, types, projects, resolved_after)
+        query = f"""
+            SELECT key, (resolved_epoch - start_epoch) / {SECONDS_PER_DAY} AS cycle_time_days
+            FROM (
+                SELECT key, created, resolved_epoch,
+                       COALESCE(first_in_progress_epoch, created_epoch) AS start_epoch
+                FROM issues
+                WHERE {where}
+            )
+            WHERE resolved_epoch >= start_epoch
+            ORDER BY created DESC
+        """
+
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [(row['key'], row['cycle_time_days']) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _issue_filters(statuses: List[str] = None, types: List[str] = None,
+                       projects: List[str] = None, resolved_after: int = None,
+                       created_after: int = None, updated_after: int = None) -> tuple:
+        """Build the WHERE clause and parameters for the issue filters"""
+        where = "1=1"
+        params = []
+
+        for column, values in (("status", statuses), ("issue_type", types), ("project", projects)):
+            if values:
+                where += f" AND {column} IN ({', '.join('?' * len(values))})"
+                params.extend(values)
+
+        for column, value in (("resolved_epoch", resolved_after), ("created_epoch", created_after),
+                              ("updated_epoch", updated_after)):
+            if value is not None:
+                where += f" AND {column} >= ?"
+                params.append(value)
+
+        return where, params
+
+    def get_sprint_issues(self, sprint_id: int, project: str = None) -> List[Dict]:
+        """
+        Get issues that have been in a sprint
+
+        Args:
+            sprint_id: Sprint ID
+            project: Filter by project key
 
-            return issues
+        Returns:
+            List of issue dictionaries (same shape as get_issues)
+        """
+        query = f"""
+            SELECT {', '.join(f'i.{column}' for column in ISSUE_READ_COLUMNS)} FROM issues i
+            JOIN issue_sprints s ON i.key = s.issue_key
+            WHERE s.sprint_id = ?
+        """
+        params = [sprint_id]
+        if project:
+            query += " AND i.project = ?"
+            params.append(project)
 
-    def get_sprints(self, board_id: int = None, state: str = None) -> List[Dict]:
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [self._row_to_issue(row) for row in cursor.fetchall()]
+
+    def get_sprint_rollup(self, sprint_ids: List[int], project: str = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Get roll-up issue counts per sprint
+
+        Args:
+            sprint_ids: Sprint IDs to look up
+            project: Only count issues of this project
+
+        Returns:
+            Dictionary mapping sprint ID to committed, completed and unplanned
+            counts plus refreshed_at; sprints without issues are absent
+        """
+        if not sprint_ids:
+            return {}
+
+        query = f"""
+            SELECT sprint_id, SUM(committed) AS committed, SUM(completed) AS completed,
+                   SUM(unplanned) AS unplanned, MAX(refreshed_at) AS refreshed_at
+            FROM sprint_rollup
+            WHERE sprint_id IN ({', '.join('?' * len(sprint_ids))})
+        """
+        params = list(sprint_ids)
+        if project:
+            query += " AND project = ?"
+            params.append(project)
+        query += " GROUP BY sprint_id"
+
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return {row['sprint_id']: dict(row) for row in cursor.fetchall()}
+
+    @staticmethod
+    def _row_to_issue(row: sqlite3.Row) -> Dict:
+        """
+        Convert an issues row to a dictionary with JSON fields parsed
+
+        sprint_ids becomes a frozenset so sprint membership tests are hash
+        lookups rather than list scans
+        """
+        issue = dict(row)
+        issue['labels'] = _json_loads(issue['labels']) if issue['labels'] else []
+        issue['components'] = _json_loads(issue['components']) if issue['components'] else []
+        issue['sprint_ids'] = frozenset(_json_loads(issue['sprint_ids'])) if issue['sprint_ids'] else frozenset()
+        return issue
+
+    def get_sprints(self, board_id: int = None, state: str = None, name_contains: str = None,
+                    order_by: str = "start_date", limit: int = None) -> List[Dict]:
         """
         Get sprints from database
 
         Args:
             board_id: Filter by board ID
             state: Filter by state (active, closed, future)
+            name_contains: Filter to names containing this text (case-insensitive)
+            order_by: Date column to sort on, newest first (start_date or end_date)
+            limit: Maximum number of sprints (None = all)
 
         Returns:
             List of sprint dictionaries
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
 
             query = "SELECT * FROM sprints WHERE 1=1"
@@ -381,14 +1124,49 @@ class DatabaseService:
             if state:
                 query += " AND state = ?"
                 params.append(state)
-
-            query += " ORDER BY start_date DESC"
+            if name_contains:
+                # LIKE is case-insensitive for ASCII; escape its wildcards
+                escaped = name_contains.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                query += " AND name LIKE ? ESCAPE '\\'"
+                params.append(f"%{escaped}%")
+
+            if order_by not in ("start_date", "end_date"):
+                raise ValueError(f"Cannot order sprints by {order_by!r}")
+            query += f" ORDER BY {order_by} DESC"
+            if limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
 
             cursor.execute(query, params)
             rows = cursor.fetchall()
 
             return [dict(row) for row in rows]
 
+    def get_sprint_report(self, sprint_id: int) -> Optional[Dict]:
+        """
+        Get the stored greenhopper sprint report payload for a sprint
+
+        Reports written by sync_sprint_reports.py are zlib-compressed JSON;
+        rows from before that are plain JSON text.
+
+        Args:
+            sprint_id: Sprint ID
+
+        Returns:
+            Report dictionary, or None if no report is stored
+        """
+        with self.get_read_connection() as conn:
+            row = conn.execute(
+                "SELECT report_data FROM sprint_reports WHERE sprint_id = ?", (sprint_id,)
+            ).fetchone()
+
+        if row is None or row['report_data'] is None:
+            return None
+        data = row['report_data']
+        if isinstance(data, bytes):
+            data = zlib.decompress(data)
+        return _json_loads(data)
+
     def get_issue_changelog(self, issue_key: str) -> List[Dict]:
         """
         Get changelog for an issue
@@ -399,7 +1177,7 @@ class DatabaseService:
         Returns:
             List of changelog entries
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM issue_changelog
@@ -409,6 +1187,135 @@ class DatabaseService:
 
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_changelogs_for_keys(self, issue_keys: List[str], field: str = 'status',
+                                reached_statuses: List[str] = None) -> Dict[str, List[Dict]]:
+        """
+        Get changelogs for many issues in bulk
+
+        Args:
+            issue_keys: JIRA issue keys
+            field: Only return entries for this field (None = all fields)
+            reached_statuses: Only return issues that moved to one of these
+                statuses at some point (None = all issues)
+
+        Returns:
+            Dictionary mapping issue key to its changelog entries, oldest first
+        """
+        changelogs = defaultdict(list)
+        keys = list(dict.fromkeys(issue_keys))
+
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+
+            # Leave room for the field and status parameters
+            chunk_size = SQLITE_MAX_PARAMS - len(reached_statuses or ())
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start:start + chunk_size]
+                query = f"""
+                    SELECT * FROM issue_changelog
+                    WHERE issue_key IN ({', '.join('?' * len(chunk))})
+                """
+                params = list(chunk)
+                if field:
+                    query += " AND field = ?"
+                    params.append(field)
+                if reached_statuses:
+                    query += f"""
+                        AND issue_key IN (
+                            SELECT issue_key FROM issue_changelog
+                            WHERE field = 'status' AND to_value IN ({', '.join('?' * len(reached_statuses))})
+                        )
+                    """
+                    params.extend(reached_statuses)
+                query += " ORDER BY issue_key, created, id"
+
+                cursor.execute(query, params)
+                for row in cursor.fetchall():
+                    changelogs[row['issue_key']].append(dict(row))
+
+        return changelogs
+
+    def get_changelog_sync_state(self) -> Dict[str, str]:
+        """
+        Get the issue 'updated' value each changelog was last synced at
+
+        Returns:
+            Dictionary of issue key to JIRA 'updated' timestamp
+        """
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT issue_key, updated FROM changelog_sync_state")
+            return {row['issue_key']: row['updated'] for row in cursor.fetchall()}
+
+    def mark_changelogs_synced(self, synced: Dict[str, str]):
+        """
+        Record issues whose changelogs were fetched
+
+        Args:
+            synced: Dictionary of issue key to the issue's 'updated' value
+        """
+        if not synced:
+            return
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO changelog_sync_state (issue_key, updated) VALUES (?, ?)
+                ON CONFLICT(issue_key) DO UPDATE SET updated = excluded.updated
+            """, synced.items())
+
+    def get_sprint_sync_cursors(self) -> Dict[int, int]:
+        """
+        Get when each sprint's issues were last fetched
+
+        Returns:
+            Dictionary of sprint ID to epoch seconds
+        """
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT sprint_id, synced_epoch FROM sprint_sync_cursors")
+            return {row['sprint_id']: row['synced_epoch'] for row in cursor.fetchall()}
+
+    def set_sprint_sync_cursors(self, cursors: Dict[int, int]):
+        """
+        Record sprints whose issues were fetched successfully
+
+        Args:
+            cursors: Dictionary of sprint ID to the epoch the fetch started
+        """
+        if not cursors:
+            return
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO sprint_sync_cursors (sprint_id, synced_epoch) VALUES (?, ?)
+                ON CONFLICT(sprint_id) DO UPDATE SET synced_epoch = excluded.synced_epoch
+            """, cursors.items())
+
+    def get_project_sync_cursors(self) -> Dict[str, int]:
+        """
+        Get when each project's issues were last searched
+
+        Returns:
+            Dictionary of project key to epoch seconds
+        """
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT project, synced_epoch FROM project_sync_cursors")
+            return {row['project']: row['synced_epoch'] for row in cursor.fetchall()}
+
+    def set_project_sync_cursors(self, cursors: Dict[str, int]):
+        """
+        Record projects whose issues were searched successfully
+
+        Args:
+            cursors: Dictionary of project key to the epoch the search started
+        """
+        if not cursors:
+            return
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO project_sync_cursors (project, synced_epoch) VALUES (?, ?)
+                ON CONFLICT(project) DO UPDATE SET synced_epoch = excluded.synced_epoch
+            """, cursors.items())
+
     def get_sync_history(self, limit: int = 10) -> List[Dict]:
         """
         Get sync history
@@ -419,7 +1326,7 @@ class DatabaseService:
         Returns:
             List of sync metadata dictionaries
         """
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM sync_metadata
@@ -436,6 +1343,26 @@ class DatabaseService:
 
             return syncs
 
+    def get_last_sync_epoch(self, sync_type: str) -> Optional[int]:
+        """
+        Get when the latest completed sync of a type started
+
+        Args:
+            sync_type: Type recorded by start_sync
+
+        Returns:
+            Epoch seconds, or None if no such sync has completed
+        """
+        with self.get_read_connection() as conn:
+            row = conn.execute("""
+                SELECT MAX(started_at) as started_at FROM sync_metadata
+                WHERE sync_type = ? AND status = 'completed'
+            """, (sync_type,)).fetchone()
+        if row['started_at'] is None:
+            return None
+        # started_at is local time from start_sync
+        return int(datetime.fromisoformat(row['started_at']).timestamp())
+
     def get_last_sync(self) -> Optional[Dict]:
         """
         Get last successful sync
@@ -450,30 +1377,28 @@ class DatabaseService:
         """
         Get database statistics
 
+        The counts are full table scans, so results are reused for
+        STATS_TTL_SECONDS unless a write connection has been used since.
+
         Returns:
             Dictionary with database stats
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) as count FROM issues")
-            issues_count = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(*) as count FROM sprints")
-            sprints_count = cursor.fetchone()['count']
+        cached = self._stats_cache
+        if cached is not None and time.monotonic() - cached[0] < STATS_TTL_SECONDS:
+            return dict(cached[1])
 
-            cursor.execute("SELECT COUNT(*) as count FROM boards")
-            boards_count = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(DISTINCT project) as count FROM issues")
-            projects_count = cursor.fetchone()['count']
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
 
-            last_sync = self.get_last_sync()
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM issues) as issues_count,
+                    (SELECT COUNT(*) FROM sprints) as sprints_count,
+                    (SELECT COUNT(*) FROM boards) as boards_count,
+                    (SELECT COUNT(DISTINCT project) FROM issues) as projects_count
+            """)
+            stats = dict(cursor.fetchone())
 
-            return {
-                'issues_count': issues_count,
-                'sprints_count': sprints_count,
-                'boards_count': boards_count,
-                'projects_count': projects_count,
-                'last_sync': last_sync
-            }
+        stats['last_sync'] = self.get_last_sync()
+        self._stats_cache = (time.monotonic(), stats)
+        return dict(stats)
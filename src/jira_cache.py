@@ -0,0 +1,318 @@
+"""
+Disk cache for JIRA search results and metadata
+Re-runs fetch only issues updated since the previous run and merge them in;
+boards and sprint lists are served from a TTL cache
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from jira_client import JiraClient
+
+try:
+    # Faster (de)serialization of cached search results
+    import orjson
+except ImportError:
+    orjson = None
+
+_ORDER_BY = re.compile(r"\border\s+by\b", re.IGNORECASE)
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to a compact JSON string, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(',', ':'))
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+class SearchCache:
+    """SQLite-backed store of search results keyed by query"""
+
+    def __init__(self, cache_dir: str = "./data/cache"):
+        """
+        Initialize search cache
+
+        Args:
+            cache_dir: Directory holding the cache database
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "jira_search_cache.db"
+        self._init_schema()
+
+    @contextmanager
+    def get_connection(self):
+        """Get database connection with context manager"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_schema(self):
+        """Create cache table if it does not exist"""
+        with self.get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    high_water TEXT,
+                    fetched_at REAL,
+                    issues TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS metadata_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    fetched_at REAL,
+                    value TEXT
+                )
+            """)
+
+    def get(self, cache_key: str) -> Optional[Tuple[Optional[str], float, List[Dict]]]:
+        """
+        Look up a cached result
+
+        Returns:
+            Tuple of (high_water, fetched_at, issues) or None
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT high_water, fetched_at, issues FROM search_cache WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], _json_loads(row[2])
+
+    def put(self, cache_key: str, high_water: Optional[str], issues: List[Dict]):
+        """Store a result, replacing any previous entry"""
+        with self.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (cache_key, high_water, fetched_at, issues) "
+                "VALUES (?, ?, ?, ?)",
+                (cache_key, high_water, time.time(), _json_dumps(issues))
+            )
+
+    def get_metadata_entry(self, cache_key: str, max_age: float) -> Optional[Tuple[float, Any]]:
+        """Return (fetched_at, value) for a cached metadata value younger than max_age seconds"""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT fetched_at, value FROM metadata_cache WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+        if row is None or time.time() - row[0] >= max_age:
+            return None
+        return row[0], _json_loads(row[1])
+
+    def put_metadata(self, cache_key: str, value: Any):
+        """Store a metadata value"""
+        with self.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata_cache (cache_key, fetched_at, value) VALUES (?, ?, ?)",
+                (cache_key, time.time(), _json_dumps(value))
+            )
+
+
+class CachedJiraClient(JiraClient):
+    """
+    JiraClient whose search_issues results are cached on disk
+
+    Within the TTL a repeated search only asks JIRA for issues updated since
+    the newest 'updated' timestamp in the cached result, merges them by key,
+    and checks the merged size against a count query. Any mismatch (issues
+    that left the result set, hit max_results, ...) triggers a full refetch,
+    as does an expired entry.
+
+    Board and sprint listings change on the order of hours and are cached
+    for the same TTL without any revalidation; repeats within one process
+    are served from memory, and callers share the returned objects. Issue lists of closed
+    sprints no longer change membership and are kept for the longer
+    closed-sprint TTL.
+    """
+
+    def __init__(self, jira_url: str, email: str, api_token: str,
+                 cache_dir: str = "./data/cache", ttl_minutes: int = 30,
+                 closed_sprint_ttl_hours: float = 12, requests_per_second: float = None,
+                 burst: float = None):
+        """
+        Initialize cached JIRA client
+
+        Args:
+            jira_url: Base URL of JIRA instance
+            email: User email for authentication
+            api_token: JIRA API token
+            cache_dir: Directory for the cache database
+            ttl_minutes: Age after which a cached result is fully refetched
+            closed_sprint_ttl_hours: Age after which a closed sprint's issues
+                are refetched (their fields can still be edited)
+            requests_per_second: Cap on requests across threads (None = unlimited)
+            burst: Requests allowed back to back before the cap applies
+        """
+        super().__init__(jira_url, email, api_token, requests_per_second, burst)
+        self.cache = SearchCache(cache_dir)
+        self.ttl_seconds = ttl_minutes * 60
+        self.closed_sprint_ttl_seconds = closed_sprint_ttl_hours * 3600
+        # Metadata already read this run: cache key -> (fetched_at, value)
+        self._memo = {}
+        self._memo_lock = threading.Lock()
+
+    def invalidate_cache(self):
+        """Forget the metadata held in memory; the disk cache is kept"""
+        with self._memo_lock:
+            self._memo.clear()
+
+    def _cache_key(self, *parts) -> str:
+        """Hash the instance, user and query parameters into a cache key"""
+        raw = "|".join(str(p) for p in (self.jira_url, self.email) + parts)
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _cached_metadata(self, name: str, loader: Callable[[], Any], *args,
+                         max_age: float = None) -> Any:
+        """Serve a metadata call from the TTL cache (or max_age seconds), loading it on a miss"""
+        cache_key = self._cache_key("meta", name, *args)
+        if max_age is None:
+            max_age = self.ttl_seconds
+
+        # Memory first, so repeats skip the cache database and JSON parse
+        with self._memo_lock:
+            memo = self._memo.get(cache_key)
+        if memo is not None and time.time() - memo[0] < max_age:
+            return memo[1]
+
+        # Aged from when it was fetched from JIRA, as on disk
+        memo = self.cache.get_metadata_entry(cache_key, max_age)
+        if memo is None or memo[1] is None:
+            memo = (time.time(), loader())
+            self.cache.put_metadata(cache_key, memo[1])
+        with self._memo_lock:
+            self._memo[cache_key] = memo
+        return memo[1]
+
+    def get_boards(self, project_key: str = None) -> List[Dict]:
+        """Get boards, cached for the TTL"""
+        return self._cached_metadata(
+            "boards", lambda: super(CachedJiraClient, self).get_boards(project_key), project_key
+        )
+
+    def get_sprints(self, board_id: int) -> List[Dict]:
+        """Get sprints for a board, cached for the TTL"""
+        return self._cached_metadata(
+            "sprints", lambda: super(CachedJiraClient, self).get_sprints(board_id), board_id
+        )
+
+    def get_closed_sprints(self, board_id: int, count: int = 3) -> List[Dict]:
+        """Get recently closed sprints for a board, cached for the TTL"""
+        return self._cached_metadata(
+            "closed_sprints",
+            lambda: super(CachedJiraClient, self).get_closed_sprints(board_id, count),
+            board_id, count
+        )
+
+    def get_agile_sprint_issues(self, sprint_id: int, closed: bool = False,
+                                page_size: int = 100, updated_since: int = None) -> List[Dict]:
+        """
+        Get a sprint's issues; closed sprints are cached for the closed-sprint TTL
+
+        Incremental (updated_since) fetches are small and bypass the cache.
+        """
+        def load():
+            return super(CachedJiraClient, self).get_agile_sprint_issues(
+                sprint_id, closed, page_size, updated_since
+            )
+
+        if not closed or updated_since is not None:
+            return load()
+        return self._cached_metadata("sprint_issues", load, sprint_id,
+                                     max_age=self.closed_sprint_ttl_seconds)
+
+    def get_statuses(self) -> List[Dict]:
+        """Get all available statuses, cached for the TTL"""
+        return self._cached_metadata("statuses", lambda: super(CachedJiraClient, self).get_statuses())
+
+    @staticmethod
+    def _high_water(issues: List[Dict]) -> Optional[str]:
+        """Newest 'updated' value as a JQL datetime (minute resolution)"""
+        updated = [i.get("fields", {}).get("updated") or "" for i in issues]
+        newest = max(updated, default="")
+        if not newest:
+            return None
+        return newest[:16].replace("T", " ")
+
+    def search_issues(self, jql: str, fields: List[str] = None, max_results: int = 1000,
+                      expand: List[str] = None, page_size: int = 100, workers: int = 1) -> List[Dict]:
+        """
+        Search JIRA issues using JQL, serving repeated queries from the cache
+
+        Args:
+            jql: JQL query string
+            fields: List of fields to return (None = all fields)
+            max_results: Maximum number of results to return
+            expand: Optional entities to expand (e.g., ['changelog'])
+            page_size: Issues requested per page
+            workers: Threads used to fetch pages after the first
+
+        Returns:
+            List of issue dictionaries
+        """
+        # Ordered queries can't be merged without re-sorting; pass through
+        if _ORDER_BY.search(jql):
+            return super().search_issues(jql, fields, max_results, expand, page_size, workers)
+
+        # 'updated' is needed to compute the high-water mark
+        if fields is not None and "*all" not in fields and "updated" not in fields:
+            fields = list(fields) + ["updated"]
+
+        cache_key = self._cache_key(jql, sorted(fields or []), sorted(expand or []), max_results)
+        entry = self.cache.get(cache_key)
+
+        if entry is not None:
+            high_water, fetched_at, cached = entry
+            if high_water and time.time() - fetched_at < self.ttl_seconds:
+                merged = self._refresh(jql, cached, high_water, fields, max_results, expand, page_size, workers)
+                if merged is not None:
+                    self.cache.put(cache_key, self._high_water(merged), merged)
+                    return merged
+
+        issues = super().search_issues(jql, fields, max_results, expand, page_size, workers)
+        self.cache.put(cache_key, self._high_water(issues), issues)
+        return issues
+
+    def _refresh(self, jql: str, cached: List[Dict], high_water: str, fields: List[str],
+                 max_results: int, expand: List[str], page_size: int,
+                 workers: int) -> Optional[List[Dict]]:
+        """
+        Merge issues updated since high_water into a cached result
+
+        Returns:
+            Merged issue list, or None if the result must be refetched
+        """
+        delta = super().search_issues(
+            f'({jql}) AND updated >= "{high_water}"', fields, max_results, expand, page_size, workers
+        )
+
+        by_key = {issue.get("key"): issue for issue in cached}
+        for issue in delta:
+            by_key[issue.get("key")] = issue
+        merged = list(by_key.values())
+
+        expected = self.get_issue_count(jql)
+        if len(merged) != expected or len(merged) >= max_results:
+            self.logger.debug(
+                "Cache refresh mismatch for %s (%d merged vs %d expected); refetching",
+                jql, len(merged), expected
+            )
+            return None
+
+        self.logger.info("Search served from cache with %d updated issues", len(delta))
+        return merged
@@ -3,19 +3,97 @@ JIRA API Client for Platform Engineering KPI Dashboard
 Handles authentication, API calls, and data retrieval from JIRA
 """
 
+import base64
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import requests
-from requests.auth import HTTPBasicAuth
-import json
-from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rate_limit import TokenBucket
+
+try:
+    # urllib3 only decodes brotli responses when one of these is installed
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    # Faster decoding of large search pages when available
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Incremental fetches look this much further back than the stored cursor,
+# covering clock skew between this host and JIRA
+UPDATED_SINCE_OVERLAP_SECONDS = 600
+
+# Requests answered 429 (rate limited) or with a gateway error are retried
+# this many times, waiting for Retry-After when JIRA sends it and backing off
+# exponentially otherwise
+RATE_LIMIT_RETRIES = 4
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class _PausingRetry(Retry):
+    """
+    Retry policy that reports Retry-After waits to a callback
+
+    urllib3 only sleeps the thread that was rate limited; the callback lets
+    the client hold back every other thread sharing its quota too.
+    """
+
+    def __init__(self, *args, on_retry_after=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_retry_after = on_retry_after
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.on_retry_after = self.on_retry_after
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.on_retry_after is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after:
+                self.on_retry_after(retry_after)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def updated_since_jql(since_epoch: int) -> str:
+    """
+    JQL clause matching issues updated since an epoch timestamp
+
+    A relative "-Nm" offset is used because absolute JQL dates are read in
+    the JIRA user's timezone.
+    """
+    minutes = int(time.time() - since_epoch + UPDATED_SINCE_OVERLAP_SECONDS) // 60 + 1
+    return f'updated >= "-{minutes}m"'
 
 
 class JiraClient:
-    """Client for interacting with JIRA REST API"""
+    """
+    Client for interacting with JIRA REST API
 
-    def __init__(self, jira_url: str, email: str, api_token: str):
+    Instances are safe to share between threads: the underlying session is
+    configured once in __init__ and not mutated afterwards. Prefer
+    get_client() over constructing a client per call so the connection
+    pool is reused.
+    """
+
+    def __init__(self, jira_url: str, email: str, api_token: str,
+                 requests_per_second: float = None, burst: float = None):
         """
         Initialize JIRA client
 
@@ -23,18 +101,55 @@ class JiraClient:
             jira_url: Base URL of JIRA instance
             email: User email for authentication
             api_token: JIRA API token
+            requests_per_second: Cap on requests across all threads using
+                this client (None = unlimited); lowered to the rate JIRA
+                advertises in its X-RateLimit headers when that is less
+            burst: Requests allowed back to back before the cap applies
+                (default: one second's worth)
         """
         self.jira_url = jira_url.rstrip('/')
         self.email = email
         self.api_token = api_token
-        self.auth = HTTPBasicAuth(email, api_token)
+        # Pre-encode Basic auth once instead of per request via HTTPBasicAuth
+        token = base64.b64encode(f"{email}:{api_token}".encode()).decode()
         self.headers = {
+            "Authorization": f"Basic {token}",
             "Accept": "application/json",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING
         }
+        # Shared session keeps connections alive across paginated calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.requests_per_second = requests_per_second
+        self.rate_limiter = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        # Retried for every method: the only POST is the read-only search,
+        # and JIRA did not process a rate-limited request at all
+        retry = _PausingRetry(
+            total=RATE_LIMIT_RETRIES, connect=0, read=0, other=0, status=RATE_LIMIT_RETRIES,
+            status_forcelist=RETRY_STATUSES, allowed_methods=None, backoff_factor=1,
+            respect_retry_after_header=True, raise_on_status=False,
+            on_retry_after=self.rate_limiter.pause if self.rate_limiter is not None else None
+        )
+        # Size the pool for concurrent KPI/board fan-out so threads don't
+        # discard and reopen connections
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.logger = logging.getLogger(__name__)
 
-    def _make_request(self, endpoint: str, method: str = "GET", params: Dict = None, data: Dict = None, timeout: int = 30) -> Dict:
+    def close(self):
+        """Close the session's pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _make_request(self, endpoint: str, method: str = "GET", params: Dict = None, data: Dict = None,
+                      timeout: int = 30, return_raw: bool = False) -> Dict:
         """
         Make HTTP request to JIRA API
 
@@ -42,31 +157,69 @@ class JiraClient:
             endpoint: API endpoint (e.g., '/rest/api/3/search')
             method: HTTP method (GET, POST, etc.)
             params: Query parameters
-            data: Request body data
+            data: Request body, sent as JSON (used by POST /rest/api/3/search)
             timeout: Request timeout in seconds (default: 30)
+            return_raw: Also return the response body text, for callers that
+                store the JSON as received instead of re-serializing it
 
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary, or (dictionary, body text) when
+            return_raw is set
         """
         url = f"{self.jira_url}{endpoint}"
 
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=self.headers,
                 params=params,
                 json=data,
-                auth=self.auth,
                 timeout=timeout
             )
+            self._adapt_rate(response.headers)
             response.raise_for_status()
-            return response.json()
+            self.logger.debug(
+                "%s %s -> %s (Content-Encoding: %s)",
+                method, endpoint, response.status_code,
+                response.headers.get("Content-Encoding")
+            )
+            if orjson is not None and response.content:
+                result = orjson.loads(response.content)
+            else:
+                result = response.json()
+            if return_raw:
+                return result, response.content.decode(response.encoding or "utf-8")
+            return result
         except requests.exceptions.RequestException as e:
             self.logger.error(f"JIRA API request failed: {e}")
             raise
 
-    def search_issues(self, jql: str, fields: List[str] = None, max_results: int = 1000) -> List[Dict]:
+    def _adapt_rate(self, headers):
+        """
+        Follow the request rate JIRA advertises in its rate-limit headers
+
+        JIRA reports X-RateLimit-FillRate requests per
+        X-RateLimit-Interval-Seconds; the limiter runs at that rate, never
+        above the configured requests_per_second.
+        """
+        if self.rate_limiter is None:
+            return
+        fill_rate = headers.get("X-RateLimit-FillRate")
+        interval = headers.get("X-RateLimit-Interval-Seconds")
+        if not fill_rate or not interval:
+            return
+        try:
+            rate = min(float(fill_rate) / float(interval), self.requests_per_second)
+        except (ValueError, ZeroDivisionError):
+            return
+        if rate > 0 and rate != self.rate_limiter.rate:
+            self.rate_limiter.set_rate(rate)
+
+    def search_issues(self, jql: str, fields: List[str] = None, max_results: int = 1000,
+                      expand: List[str] = None, page_size: int = 100, workers: int = 1) -> List[Dict]:
         """
         Search JIRA issues using JQL
 
@@ -74,38 +227,86 @@ class JiraClient:
             jql: JQL query string
             fields: List of fields to return (None = all fields)
             max_results: Maximum number of results to return
+            expand: Optional entities to expand (e.g., ['changelog'])
+            page_size: Issues requested per page; JIRA may return fewer for
+                wide field lists, which pagination handles
+            workers: Fetch pages after the first concurrently with this many
+                threads (1 = sequential)
 
         Returns:
             List of issue dictionaries
         """
-        all_issues = []
-        start_at = 0
-        batch_size = 100  # JIRA API pagination limit
-
         if fields is None:
             fields = ["*all"]
 
-        while start_at < max_results:
-            params = {
-                "jql": jql,
-                "startAt": start_at,
-                "maxResults": min(batch_size, max_results - start_at),
-                "fields": ",".join(fields)
-            }
+        # Loop-invariant part of the query, built once. Sent as a POST body
+        # so long JQL and field lists are not bound by URL length limits.
+        base_body = {"jql": jql, "fields": list(fields)}
+        if expand:
+            base_body["expand"] = list(expand)
+
+        if workers <= 1:
+            all_issues = self._search_range(base_body, 0, max_results, page_size)
+        else:
+            # The first page reveals the total and the page size JIRA honours
+            result = self._search_page(base_body, 0, min(page_size, max_results))
+            all_issues = result.get("issues", [])
+            step = len(all_issues)
+            end = min(result.get("total", 0), max_results)
+
+            if 0 < step < end:
+                if step < page_size:
+                    self.logger.warning(
+                        "JIRA capped search page size at %d (requested %d)", step, page_size
+                    )
+                offsets = range(step, end, step)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    pages = executor.map(
+                        lambda offset: self._search_range(base_body, offset, min(offset + step, end), step),
+                        offsets
+                    )
+                    for issues in pages:
+                        all_issues.extend(issues)
+
+        self.logger.info("Retrieved %d issues from JIRA", len(all_issues))
+        return all_issues
+
+    def _search_page(self, base_body: Dict, start_at: int, max_results: int) -> Dict:
+        """Fetch a single page of search results"""
+        body = {**base_body, "startAt": start_at, "maxResults": max_results}
+        self.logger.debug("Searching JIRA with JQL: %s (startAt: %s)", base_body["jql"], start_at)
+        return self._make_request("/rest/api/3/search", method="POST", data=body)
+
+    def _search_range(self, base_body: Dict, start_at: int, end: int, batch_size: int) -> List[Dict]:
+        """
+        Fetch search results from start_at up to (not including) end
+
+        Args:
+            base_body: Request body without paging keys
+            start_at: First result offset
+            end: Offset to stop at
+            batch_size: Issues requested per page
+
+        Returns:
+            List of issue dictionaries
+        """
+        all_issues = []
 
-            self.logger.debug(f"Searching JIRA with JQL: {jql} (startAt: {start_at})")
-            result = self._make_request("/rest/api/3/search", params=params)
+        while start_at < end:
+            result = self._search_page(base_body, start_at, min(batch_size, end - start_at))
 
             issues = result.get("issues", [])
             all_issues.extend(issues)
 
+            # Advance by what the server actually returned so a short page
+            # ends the loop without another round trip
+            got = len(issues)
             total = result.get("total", 0)
-            if start_at + batch_size >= total:
+            if got == 0 or start_at + got >= total:
                 break
 
-            start_at += batch_size
+            start_at += got
 
-        self.logger.info(f"Retrieved {len(all_issues)} issues from JIRA")
         return all_issues
 
     def get_sprints(self, board_id: int) -> List[Dict]:
@@ -122,6 +323,109 @@ class JiraClient:
         result = self._make_request(endpoint)
         return result.get("values", [])
 
+    def get_agile_sprint_issues(self, sprint_id: int, closed: bool = False,
+                                page_size: int = 100, updated_since: int = None) -> List[Dict]:
+        """
+        Get all issues in a sprint via the Agile API, following pagination
+
+        Args:
+            sprint_id: Sprint ID
+            closed: The sprint is closed; caching clients may then reuse an
+                earlier result (ignored here)
+            page_size: Issues requested per page
+            updated_since: Only return issues updated since this epoch
+                (see updated_since_jql)
+
+        Returns:
+            List of issue dictionaries
+        """
+        params = {"jql": updated_since_jql(updated_since)} if updated_since is not None else None
+        all_issues = []
+        for issues in self.iter_agile_pages(f"/rest/agile/1.0/sprint/{sprint_id}/issue", page_size,
+                                            params=params):
+            all_issues.extend(issues)
+        return all_issues
+
+    def iter_agile_pages(self, endpoint: str, page_size: int = 100, params: Dict = None,
+                         timeout: int = 30, limit: int = None, workers: int = 1) -> Iterator[List[Dict]]:
+        """
+        Page through an Agile API issue listing (board or sprint issues)
+
+        Pages are requested over the shared keep-alive session, one at a
+        time, so callers can store each page before the next is fetched.
+        With workers > 1 the first page's total is used to request the
+        remaining offsets concurrently; pages are still yielded in order.
+
+        Args:
+            endpoint: Agile API endpoint returning {"issues", "total"}
+            page_size: Issues requested per page
+            params: Extra query parameters (e.g., fields, jql)
+            timeout: Request timeout in seconds
+            limit: Stop once this many issues have been returned
+            workers: Threads fetching pages after the first (1 = sequential)
+
+        Yields:
+            Lists of issue dictionaries, one per page
+        """
+        if limit is not None:
+            page_size = min(page_size, limit)
+        if workers > 1:
+            yield from self._iter_agile_pages_parallel(endpoint, page_size, params, timeout, limit, workers)
+            return
+
+        start_at = 0
+
+        while True:
+            page_params = {**(params or {}), "startAt": start_at, "maxResults": page_size}
+            result = self._make_request(endpoint, params=page_params, timeout=timeout)
+            issues = result.get("issues", [])
+            if not issues:
+                return
+            if start_at == 0:
+                self._warn_page_cap(endpoint, result, len(issues), page_size)
+
+            yield issues
+
+            # Advance by what the server returned; JIRA may cap the page size
+            start_at += len(issues)
+            if start_at >= result.get("total", 0) or (limit is not None and start_at >= limit):
+                return
+
+    def _iter_agile_pages_parallel(self, endpoint: str, page_size: int, params: Optional[Dict],
+                                   timeout: int, limit: Optional[int], workers: int) -> Iterator[List[Dict]]:
+        """Concurrent variant of iter_agile_pages (see there)"""
+        def fetch(start_at: int) -> List[Dict]:
+            page_params = {**(params or {}), "startAt": start_at, "maxResults": step}
+            return self._make_request(endpoint, params=page_params, timeout=timeout).get("issues", [])
+
+        first = self._make_request(endpoint, params={**(params or {}), "startAt": 0, "maxResults": page_size},
+                                   timeout=timeout)
+        issues = first.get("issues", [])
+        if not issues:
+            return
+        self._warn_page_cap(endpoint, first, len(issues), page_size)
+        yield issues
+
+        # Step by what JIRA actually returned, which may be less than asked for
+        step = len(issues)
+        end = first.get("total", 0)
+        if limit is not None:
+            end = min(end, limit)
+        if step >= end:
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for issues in executor.map(fetch, range(step, end, step)):
+                if issues:
+                    yield issues
+
+    def _warn_page_cap(self, endpoint: str, result: Dict, got: int, requested: int):
+        """Warn when JIRA returned a short first page although more results exist"""
+        if got < requested and got < result.get("total", 0):
+            self.logger.warning(
+                "JIRA capped %s page size at %d (requested %d)", endpoint, got, requested
+            )
+
     def get_boards(self, project_key: str = None) -> List[Dict]:
         """
         Get all boards (optionally filtered by project)
@@ -140,19 +444,31 @@ class JiraClient:
         result = self._make_request(endpoint, params=params)
         return result.get("values", [])
 
-    def get_issue_changelog(self, issue_key: str) -> List[Dict]:
+    def get_issue_changelog(self, issue_key: str, page_size: int = 100) -> List[Dict]:
         """
-        Get changelog for an issue
+        Get the full changelog for an issue, following every page
 
         Args:
             issue_key: JIRA issue key (e.g., 'PLATFORM-123')
+            page_size: Entries requested per page
 
         Returns:
-            List of changelog entries
+            List of changelog entries, oldest first
         """
         endpoint = f"/rest/api/3/issue/{issue_key}/changelog"
-        result = self._make_request(endpoint)
-        return result.get("values", [])
+        params = {"startAt": 0, "maxResults": page_size}
+
+        entries = []
+        while True:
+            result = self._make_request(endpoint, params=params)
+            values = result.get("values", [])
+            entries.extend(values)
+
+            # Advance by what the server returned; JIRA may cap the page size.
+            # isLast decides when present, otherwise the reported total does
+            params["startAt"] += len(values)
+            if not values or result.get("isLast", params["startAt"] >= result.get("total", 0)):
+                return entries
 
     def test_connection(self) -> bool:
         """
@@ -202,11 +518,11 @@ class JiraClient:
         Returns:
             Number of matching issues
         """
-        params = {
+        body = {
             "jql": jql,
             "maxResults": 0  # We only want the count
         }
-        result = self._make_request("/rest/api/3/search", params=params)
+        result = self._make_request("/rest/api/3/search", method="POST", data=body)
         return result.get("total", 0)
 
     def get_sprint_issues(self, sprint_id: int, fields: List[str] = None) -> List[Dict]:
@@ -235,10 +551,54 @@ class JiraClient:
             List of sprint dictionaries
         """
         endpoint = f"/rest/agile/1.0/board/{board_id}/sprint"
-        params = {"state": "closed"}
-        result = self._make_request(endpoint, params=params)
+        page_size = 50
+        params = {"state": "closed", "startAt": 0, "maxResults": page_size}
+        sort_key = lambda x: x.get("endDate", "")
+
+        recent = []
+        while True:
+            result = self._make_request(endpoint, params=params)
+            values = result.get("values", [])
+            # Only the most recent `count` sprints are ever needed
+            recent = heapq.nlargest(count, recent + values, key=sort_key)
+
+            if result.get("isLast", True) or not values:
+                break
 
-        sprints = result.get("values", [])
-        # Sort by end date descending and take the most recent
-        sprints.sort(key=lambda x: x.get("endDate", ""), reverse=True)
-        return sprints[:count]
+            next_start = params["startAt"] + len(values)
+            total = result.get("total")
+            if total is not None:
+                # Sprints come back in creation order, so the newest ones
+                # are on the last page; jump straight to it when possible
+                next_start = max(next_start, total - max(count, page_size))
+            params["startAt"] = next_start
+
+        return recent
+
+
+_CLIENTS: Dict[tuple, JiraClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(jira_url: str, email: str, api_token: str,
+               requests_per_second: float = None, burst: float = None) -> JiraClient:
+    """
+    Get a process-wide JiraClient for the given instance and user
+
+    Args:
+        jira_url: Base URL of JIRA instance
+        email: User email for authentication
+        api_token: JIRA API token
+        requests_per_second: Rate cap applied when the client is created
+        burst: Burst size applied when the client is created
+
+    Returns:
+        Shared JiraClient, created on first use
+    """
+    key = (jira_url.rstrip('/'), email)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = JiraClient(jira_url, email, api_token, requests_per_second, burst)
+            _CLIENTS[key] = client
+        return client
@@ -3,11 +3,192 @@ KPI Calculator for Platform Engineering Dashboard
 Contains all JQL queries and calculation logic for each KPI
 """
 
+import copy
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any, Tuple
-from datetime import datetime, timedelta
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Iterator, Optional, Set, Tuple
+from datetime import datetime, timedelta, timezone
 from collections import defaultdict, Counter
+from itertools import chain
 import statistics
+from functools import cached_property, partial
+
+# Upper bound on concurrent JIRA calls when fanning out over projects/boards
+MAX_CONCURRENT_REQUESTS = int(os.getenv("JIRA_MAX_CONCURRENT_REQUESTS", "8"))
+
+# Seconds a calculate_all_kpis result is reused for the same config
+RESULT_CACHE_TTL_SECONDS = int(os.getenv("KPI_RESULT_CACHE_TTL", "300"))
+
+# Status names (lowercased) that mark an issue as finished
+DONE_STATES = frozenset({"done", "closed", "resolved"})
+
+# Status names that mark work as started (In Progress, In Development, ...)
+IN_PROGRESS_RE = re.compile(r"in progress|development", re.IGNORECASE)
+
+# Issue fields each KPI reads; requests never ask for more than this
+_FIELDS_PREDICTABILITY = ("status",)
+_FIELDS_SPILLOVER = ("summary", "status", "sprint", "customfield_10020")
+_FIELDS_CYCLE_TIME = ("status", "resolutiondate")
+_FIELDS_WORK_MIX = ("labels",)
+_FIELDS_UNPLANNED = ("labels",)
+_FIELDS_REOPENED = ("summary", "status", "updated")
+
+# Fields the shared rolling-window dataset needs per KPI: what the KPI reads
+# plus what _select_issues filters on (type and the KPI's date field)
+_WINDOW_KPI_FIELDS = {
+    "story_spillover": _FIELDS_SPILLOVER + ("issuetype", "updated"),
+    "cycle_time": _FIELDS_CYCLE_TIME + ("issuetype",),
+    "work_mix": _FIELDS_WORK_MIX + ("issuetype", "created"),
+    "reopened_stories": _FIELDS_REOPENED + ("issuetype", "resolutiondate"),
+}
+
+# KPIs that scan changelogs (the only reason to expand=changelog)
+_CHANGELOG_KPIS = frozenset({"cycle_time", "reopened_stories"})
+
+# Placeholder result data when work mix is enabled but no labels are configured
+_WORK_MIX_SKIPPED = {
+    "reason": "No labels configured. To enable, add labels in config/config.yaml"
+}
+
+# KPIs run by calculate_all_kpis, in output order:
+# (config key, method name, kwargs builder, requires labels).
+# Builders take the KPI's own config section and the run's shared params.
+_KPI_REGISTRY = [
+    # KPI 1: Sprint Predictability
+    ("sprint_predictability", "calculate_sprint_predictability",
+     lambda c, p: {"sprint_lookback": p["sprint_lookback"], "board_sprints": p["sprint_dataset"]},
+     False),
+    # KPI 2: Story Spillover
+    ("story_spillover", "calculate_story_spillover",
+     lambda c, p: {"max_sprints": c.get("max_sprints", 2), "issues": p["dataset"]},
+     False),
+    # KPI 3: Cycle Time
+    ("cycle_time", "calculate_cycle_time",
+     lambda c, p: {"days_back": p["rolling_days"], "issues": p["dataset"]},
+     False),
+    # KPI 4: Work Mix (skipped if no labels are configured)
+    ("work_mix", "calculate_work_mix",
+     lambda c, p: {"days_back": p["rolling_days"], "issues": p["dataset"]},
+     True),
+    # KPI 5: Unplanned Work (works without labels but shows 0%)
+    ("unplanned_work", "calculate_unplanned_work",
+     lambda c, p: {"sprint_lookback": p["sprint_lookback"], "board_sprints": p["sprint_dataset"]},
+     False),
+    # KPI 6: Reopened Stories
+    ("reopened_stories", "calculate_reopened_stories",
+     lambda c, p: {"days_back": p["rolling_days"], "issues": p["dataset"]},
+     False),
+]
+
+
+def _scan_status_transitions(changelog: List[Dict]) -> Tuple[Any, Any]:
+    """
+    Find the first In Progress and the last Done transition in a changelog
+
+    Args:
+        changelog: Changelog histories in chronological order
+
+    Returns:
+        Tuple of (in_progress_date, done_date); either may be None
+    """
+    in_progress_date = None
+    done_date = None
+
+    for history in changelog:
+        created_dt = None
+        for item in history.get("items", ()):
+            if item.get("field") != "status":
+                continue
+
+            to_status = item.get("toString") or ""
+            is_in_progress = not in_progress_date and IN_PROGRESS_RE.search(to_status)
+            is_done = to_status.lower() in DONE_STATES
+            if not (is_in_progress or is_done):
+                continue
+
+            # Parse the history timestamp only when a transition needs it; a
+            # history without a usable timestamp is skipped
+            if created_dt is None:
+                try:
+                    created_dt = datetime.fromisoformat((history.get("created") or "")[:19])
+                except ValueError:
+                    break
+
+            # In Progress, Development, etc.
+            if is_in_progress:
+                in_progress_date = created_dt
+
+            # Done, Closed, Resolved, etc. (keep the last one)
+            if is_done:
+                done_date = created_dt
+
+    return in_progress_date, done_date
+
+
+def _reopened_since(changelog: List[Dict], cutoff: str) -> bool:
+    """
+    Check whether a changelog has a done -> non-done status transition
+
+    Done, Closed and Resolved (DONE_STATES) all count as done.
+
+    Args:
+        changelog: Changelog histories
+        cutoff: ISO timestamp (YYYY-MM-DDTHH:MM:SS); older transitions are ignored
+
+    Returns:
+        True if the issue was reopened at or after the cutoff
+    """
+    for history in changelog:
+        if (history.get("created") or "")[:19] < cutoff:
+            continue
+        for item in history.get("items", []):
+            if item.get("field") != "status":
+                continue
+            from_status = (item.get("fromString") or "").lower()
+            to_status = (item.get("toString") or "").lower()
+            if from_status in DONE_STATES and to_status not in DONE_STATES:
+                return True
+    return False
+
+
+class KpiResult:
+    """
+    Result of a single KPI calculation
+
+    Slotted so each result avoids a per-instance __dict__; converted to the
+    plain dictionary the dashboard and JSON output expect by to_dict().
+    """
+
+    __slots__ = ("kpi_name", "description", "data", "error", "skipped")
+
+    def __init__(self, kpi_name: str, description: str, data: Dict[str, Any] = None,
+                 error: Optional[str] = None, skipped: bool = False):
+        self.kpi_name = kpi_name
+        self.description = description
+        self.data = data if data is not None else {}
+        self.error = error
+        self.skipped = skipped
+
+    def __repr__(self) -> str:
+        return f"KpiResult({self.kpi_name!r}, error={self.error!r}, skipped={self.skipped!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flatten into a result dictionary, omitting unset name/error/skip fields"""
+        result = {}
+        if self.kpi_name:
+            result["kpi_name"] = self.kpi_name
+            result["description"] = self.description
+        if self.skipped:
+            result["skipped"] = True
+        result.update(self.data)
+        if self.error is not None:
+            result["error"] = self.error
+        return result
 
 
 class KPICalculator:
@@ -26,14 +207,35 @@ class KPICalculator:
         self.logger = logging.getLogger(__name__)
         self.projects = config.get("projects", {}).get("project_keys", [])
 
+        # JQL project clause, built once and appended to every KPI query
+        self._project_filter = f"project in ({', '.join(self.projects)})" if self.projects else ""
+        self._project_suffix = f" AND {self._project_filter}" if self._project_filter else ""
+
         # Parse label configuration (supports global and space-specific labels)
         self.labels_config = config.get("labels", {})
+        self._labels_cache: Dict[Tuple[str, ...], List[str]] = {}
         self._parse_label_configuration()
 
+        # calculate_all_kpis results keyed by config hash and time bucket
+        self._result_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Board listings are the first JIRA round trip of the sprint KPIs;
+        # start fetching them now so they're ready by calculate_all_kpis.
+        # Only the error-tolerant listing is prefetched, which sprint
+        # predictability consumes when it runs without unplanned work; the
+        # sprint pre-pass shared with unplanned work lists boards strictly
+        enabled = self._enabled_kpis()
+        self._boards_future = None
+        if self.projects and enabled["sprint_predictability"] and not enabled["unplanned_work"]:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._boards_future = executor.submit(self._fetch_boards, True)
+            executor.shutdown(wait=False)
+
     def _parse_label_configuration(self):
         """Parse label configuration to support global and space-specific labels"""
-        self.global_labels = []
-        self.space_labels = {}
+        # Sets throughout: labels are only ever unioned and membership-tested
+        self.global_labels: Set[str] = set()
+        self.space_labels: Dict[str, Set[str]] = {}
         self.project_to_space = {}
 
         # Parse global labels
@@ -41,11 +243,9 @@ class KPICalculator:
         if global_config.get("enabled", True):
             work_categories = global_config.get("work_categories", [])
             # Support both old format (list of strings) and new format (list of dicts)
-            for cat in work_categories:
-                if isinstance(cat, dict):
-                    self.global_labels.append(cat.get("label"))
-                else:
-                    self.global_labels.append(cat)
+            self.global_labels.update(
+                cat.get("label") if isinstance(cat, dict) else cat for cat in work_categories
+            )
 
         # Parse space-specific labels
         spaces = self.labels_config.get("spaces", [])
@@ -55,12 +255,9 @@ class KPICalculator:
             work_categories = space.get("work_categories", [])
 
             # Extract label names
-            labels = []
-            for cat in work_categories:
-                if isinstance(cat, dict):
-                    labels.append(cat.get("label"))
-                else:
-                    labels.append(cat)
+            labels = {
+                cat.get("label") if isinstance(cat, dict) else cat for cat in work_categories
+            }
 
             # Map projects to this space
             for project in space_projects:
@@ -70,11 +267,9 @@ class KPICalculator:
         # Fallback to old config format if no new format found
         if not self.global_labels and not self.space_labels:
             old_labels = self.labels_config.get("work_categories", [])
-            for label in old_labels:
-                if isinstance(label, dict):
-                    self.global_labels.append(label.get("label"))
-                else:
-                    self.global_labels.append(label)
+            self.global_labels.update(
+                label.get("label") if isinstance(label, dict) else label for label in old_labels
+            )
 
         self.logger.info(f"Label configuration: Global={len(self.global_labels)}, Spaces={len(self.space_labels)}")
 
@@ -91,6 +286,15 @@ class KPICalculator:
         if projects is None:
             projects = self.projects
 
+        # Label config is fixed for the lifetime of the calculator
+        cache_key = tuple(projects)
+        cached = self._labels_cache.get(cache_key)
+        if cached is None:
+            cached = self._labels_cache[cache_key] = self._resolve_labels(cache_key)
+        return list(cached)
+
+    def _resolve_labels(self, projects: Tuple[str, ...]) -> List[str]:
+        """Resolve the unique work category labels for a tuple of projects"""
         # Collect all unique labels for the given projects
         all_labels = set()
 
@@ -98,8 +302,7 @@ class KPICalculator:
             # Check if project has space-specific labels
             if project in self.project_to_space:
                 space_name = self.project_to_space[project]
-                space_labels = self.space_labels.get(space_name, [])
-                all_labels.update(space_labels)
+                all_labels.update(self.space_labels.get(space_name, ()))
             else:
                 # Use global labels
                 all_labels.update(self.global_labels)
@@ -117,6 +320,21 @@ class KPICalculator:
         Returns:
             Dictionary mapping label strings to their metadata
         """
+        return self._label_mapping
+
+    @cached_property
+    def _work_labels(self) -> Tuple[str, ...]:
+        """Work category labels for the configured projects, resolved once"""
+        return tuple(self.get_labels_for_projects(self.projects))
+
+    @cached_property
+    def _kpi_config(self) -> Dict[str, Any]:
+        """The 'kpis' section of the configuration"""
+        return self.config.get("kpis", {})
+
+    @cached_property
+    def _label_mapping(self) -> Dict[str, Dict]:
+        """Label mapping built once from the label configuration"""
         mapping = {}
 
         # Add global labels
@@ -146,14 +364,220 @@ class KPICalculator:
 
     def get_project_filter(self) -> str:
         """Generate JQL project filter"""
-        if not self.projects:
-            return ""
-        project_list = ", ".join(self.projects)
-        return f"project in ({project_list})"
+        return self._project_filter
+
+    # ==================== Sprint Issue Batching ====================
+
+    @staticmethod
+    def _issue_sprint_ids(fields: Dict) -> List[int]:
+        """Extract sprint ids from an issue's sprint field"""
+        sprints = fields.get("customfield_10020") or fields.get("sprint") or []
+        if not isinstance(sprints, list):
+            sprints = [sprints]
+        ids = []
+        for sprint in sprints:
+            if isinstance(sprint, dict):
+                if sprint.get("id") is not None:
+                    ids.append(sprint["id"])
+            elif isinstance(sprint, int):
+                ids.append(sprint)
+        return ids
+
+    @staticmethod
+    def _is_done(fields: Dict) -> bool:
+        """Check whether an issue's status is in the Done category"""
+        status = fields.get("status") or {}
+        return (status.get("statusCategory") or {}).get("key") == "done"
+
+    def _fetch_issues_by_sprint(self, sprint_ids: List[int], fields: List[str]) -> Dict[int, List[Dict]]:
+        """
+        Fetch issues for several sprints with one JQL and bucket them by sprint
+
+        Args:
+            sprint_ids: Sprint IDs to fetch issues for
+            fields: Issue fields to return (sprint field is always included)
+
+        Returns:
+            Dictionary mapping sprint id to the issues that were in it
+        """
+        by_sprint = defaultdict(list)
+        if not sprint_ids:
+            return by_sprint
+
+        jql = f"sprint in ({', '.join(map(str, sprint_ids))}) AND type in (Story, Task, Bug){self._project_suffix}"
+
+        wanted = set(sprint_ids)
+        issues = self.jira.search_issues(
+            jql,
+            fields=list(fields) + ["customfield_10020"],
+            max_results=5000
+        )
+        for issue in issues:
+            for sprint_id in self._issue_sprint_ids(issue.get("fields", {})):
+                if sprint_id in wanted:
+                    by_sprint[sprint_id].append(issue)
+
+        return by_sprint
+
+    def _get_boards(self, skip_errors: bool = True) -> List[Dict]:
+        """
+        Get boards for all configured projects
+
+        The first call with skip_errors uses the listing prefetched in
+        __init__; later calls fetch again.
+
+        Args:
+            skip_errors: Log and skip projects whose boards cannot be fetched
+
+        Returns:
+            List of board dictionaries in project order
+        """
+        future = None
+        if skip_errors:
+            future, self._boards_future = self._boards_future, None
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                self.logger.warning(f"Board prefetch failed, fetching again: {e}")
+        return self._fetch_boards(skip_errors)
+
+    def _fetch_boards(self, skip_errors: bool = True) -> List[Dict]:
+        """
+        Fetch boards for all configured projects, fetching projects concurrently
+
+        Args:
+            skip_errors: Log and skip projects whose boards cannot be fetched
+
+        Returns:
+            List of board dictionaries in project order
+        """
+        def fetch(project):
+            try:
+                return self.jira.get_boards(project_key=project)
+            except Exception as board_error:
+                if not skip_errors:
+                    raise
+                self.logger.warning(f"Could not get boards for {project}: {board_error}. Continuing without this project.")
+                return []
+
+        boards = []
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            for project_boards in executor.map(fetch, self.projects):
+                boards.extend(project_boards)
+        return boards
+
+    def _collect_closed_sprint_issues(self, boards: List[Dict], sprint_lookback: int,
+                                      fields: List[str]) -> List[Tuple[Dict, List[Tuple[Dict, List[Dict]]]]]:
+        """
+        Fetch recent closed sprints and their issues for each board concurrently
+
+        Args:
+            boards: Boards to process
+            sprint_lookback: Number of closed sprints per board
+            fields: Issue fields needed by the caller (key is always returned)
+
+        Returns:
+            List of (board, [(sprint, issues), ...]) in board order
+        """
+        def fetch(board):
+            closed_sprints = self.jira.get_closed_sprints(board.get("id"), count=sprint_lookback)
+            # One search per board, bucketed by sprint in memory
+            issues_by_sprint = self._fetch_issues_by_sprint(
+                [s.get("id") for s in closed_sprints],
+                fields=fields
+            )
+            return board, [(s, issues_by_sprint.get(s.get("id"), [])) for s in closed_sprints]
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(fetch, boards))
+
+    # ==================== Shared Issue Dataset ====================
+
+    def _fetch_unified_dataset(self, days_back: int, kpis: List[str]) -> List[Dict]:
+        """
+        Fetch one issue set covering the rolling-window KPIs
+
+        Story spillover, cycle time, work mix and reopened stories all query
+        subsets of "issues updated in the last N days", so a single search
+        serves them all and each KPI filters it in memory.
+
+        Args:
+            days_back: Window size; must cover the largest KPI window
+            kpis: Names of the enabled KPIs that will consume the dataset
+
+        Returns:
+            List of issue dictionaries (changelog expanded only if needed)
+        """
+        fields = sorted({f for name in kpis for f in _WINDOW_KPI_FIELDS[name]})
+        expand = ["changelog"] if _CHANGELOG_KPIS.intersection(kpis) else None
+
+        jql = f"updated >= -{days_back}d AND type in (Epic, Story, Task, Bug){self._project_suffix}"
+        return self.jira.search_issues(
+            jql,
+            fields=fields,
+            max_results=10000,
+            expand=expand,
+            page_size=500,
+            workers=MAX_CONCURRENT_REQUESTS
+        )
+
+    def _fetch_sprint_dataset(self, sprint_lookback: int) -> List[Tuple[Dict, List[Tuple[Dict, List[Dict]]]]]:
+        """
+        Fetch recent closed sprints and their issues once for KPIs 1 and 5
+
+        Boards are listed strictly, as KPI 5 does on its own: if any project's
+        boards cannot be listed the pre-pass fails, and each KPI then queries
+        with its own error policy.
+
+        Args:
+            sprint_lookback: Number of closed sprints per board
+
+        Returns:
+            List of (board, [(sprint, issues), ...]) with status and labels
+        """
+        boards = self._get_boards(skip_errors=False)
+        return self._collect_closed_sprint_issues(
+            boards, sprint_lookback, fields=sorted(set(_FIELDS_PREDICTABILITY + _FIELDS_UNPLANNED))
+        )
+
+    @staticmethod
+    def _select_issues(issues: List[Dict], issue_types: Set[str], done: bool = None,
+                       date_field: str = None, days_back: int = None) -> List[Dict]:
+        """
+        Filter a shared dataset the way a KPI's own JQL would
+
+        Args:
+            issues: Issues from _fetch_unified_dataset
+            issue_types: Issue type names to keep
+            done: If set, keep only issues whose Done-category state matches
+            date_field: Date field that must fall inside the window
+            days_back: Window size in days for date_field
+
+        Returns:
+            Matching issues
+        """
+        cutoff = None
+        if date_field and days_back is not None:
+            cutoff = (datetime.now() - timedelta(days=days_back)).isoformat()[:19]
+
+        selected = []
+        selected_append = selected.append
+        for issue in issues:
+            fields = issue.get("fields", {})
+            if (fields.get("issuetype") or {}).get("name") not in issue_types:
+                continue
+            if done is not None and KPICalculator._is_done(fields) != done:
+                continue
+            if cutoff is not None and (fields.get(date_field) or "")[:19] < cutoff:
+                continue
+            selected_append(issue)
+        return selected
 
     # ==================== KPI 1: Sprint Predictability ====================
 
-    def calculate_sprint_predictability(self, sprint_lookback: int = 3) -> Dict[str, Any]:
+    def calculate_sprint_predictability(self, sprint_lookback: int = 3,
+                                        board_sprints: List = None) -> KpiResult:
         """
         KPI 1: Sprint Predictability
         Measures % of committed stories completed within sprint
@@ -163,69 +587,52 @@ class KPICalculator:
         - For each sprint, find committed vs completed stories
         - Calculate completion rate
 
+        Args:
+            sprint_lookback: Number of closed sprints per board
+            board_sprints: Optional shared sprint dataset (see _fetch_sprint_dataset)
+
         Returns:
-            Dictionary with sprint predictability metrics
+            KpiResult with sprint predictability metrics
         """
         self.logger.info("Calculating KPI 1: Sprint Predictability")
 
 
-        project_filter = self.get_project_filter()
         results = {
-            "kpi_name": "Sprint Predictability",
-            "description": "% of committed stories completed within sprint",
             "sprints": [],
             "overall_average": 0,
             "team_breakdown": {}
         }
 
         try:
-            # Get boards for projects (with error handling for agile API)
-            boards = []
-            for project in self.projects:
-                try:
-                    project_boards = self.jira.get_boards(project_key=project)
-                    boards.extend(project_boards)
-                except Exception as board_error:
-                    self.logger.warning(f"Could not get boards for {project}: {board_error}. Continuing without this project.")
-                    continue
-
-            for board in boards:
-                board_id = board.get("id")
-                board_name = board.get("name")
+            if board_sprints is None:
+                # Get boards for projects (with error handling for agile API)
+                boards = self._get_boards(skip_errors=True)
+                board_sprints = self._collect_closed_sprint_issues(
+                    boards, sprint_lookback, fields=list(_FIELDS_PREDICTABILITY)
+                )
 
-                # Get closed sprints
-                closed_sprints = self.jira.get_closed_sprints(board_id, count=sprint_lookback)
+            sprints_append = results["sprints"].append
+            for board, sprint_rows in board_sprints:
+                board_name = board.get("name")
 
-                for sprint in closed_sprints:
+                for sprint, committed_issues in sprint_rows:
                     sprint_id = sprint.get("id")
                     sprint_name = sprint.get("name")
 
-                    # JQL: Get all issues that were in this sprint at any point
-                    jql_committed = f"sprint = {sprint_id} AND type in (Story, Task, Bug)"
-                    if project_filter:
-                        jql_committed += f" AND {project_filter}"
-
-                    committed_issues = self.jira.search_issues(
-                        jql_committed,
-                        fields=["key", "status", "resolution"]
-                    )
+                    # Equivalent per-sprint JQL (kept for reference)
+                    jql_committed = f"sprint = {sprint_id} AND type in (Story, Task, Bug){self._project_suffix}"
 
-                    # JQL: Get completed issues in this sprint
                     jql_completed = (
                         f"sprint = {sprint_id} AND "
                         f"statusCategory = Done AND "
-                        f"type in (Story, Task, Bug)"
-                    )
-                    if project_filter:
-                        jql_completed += f" AND {project_filter}"
-
-                    completed_issues = self.jira.search_issues(
-                        jql_completed,
-                        fields=["key", "status"]
+                        f"type in (Story, Task, Bug){self._project_suffix}"
                     )
 
                     committed_count = len(committed_issues)
-                    completed_count = len(completed_issues)
+                    completed_count = sum(
+                        1 for issue in committed_issues
+                        if self._is_done(issue.get("fields", {}))
+                    )
 
                     if committed_count > 0:
                         completion_rate = (completed_count / committed_count) * 100
@@ -242,7 +649,7 @@ class KPICalculator:
                         "jql_completed": jql_completed
                     }
 
-                    results["sprints"].append(sprint_data)
+                    sprints_append(sprint_data)
 
             # If no boards found via agile API, try fallback approach
             if not results["sprints"]:
@@ -259,11 +666,11 @@ class KPICalculator:
             results["error"] = str(e)
             results["note"] = "Sprint Predictability requires Jira Agile/Scrum boards. Please ensure your projects are configured with Scrum boards in Jira."
 
-        return results
+        return KpiResult("Sprint Predictability", "% of committed stories completed within sprint", results)
 
     # ==================== KPI 2: Story Spillover ====================
 
-    def calculate_story_spillover(self, max_sprints: int = 2) -> Dict[str, Any]:
+    def calculate_story_spillover(self, max_sprints: int = 2, issues: List[Dict] = None) -> KpiResult:
         """
         KPI 2: Story Spillover
         Measures % of stories spanning more than N sprints
@@ -271,15 +678,16 @@ class KPICalculator:
         JQL: Stories that have been in multiple sprints
         Complex calculation - need to analyze sprint history per issue
 
+        Args:
+            max_sprints: Sprint count above which a story counts as spillover
+            issues: Optional shared dataset (see _fetch_unified_dataset)
+
         Returns:
-            Dictionary with spillover metrics
+            KpiResult with spillover metrics
         """
         self.logger.info("Calculating KPI 2: Story Spillover")
 
-        project_filter = self.get_project_filter()
         results = {
-            "kpi_name": "Story Spillover",
-            "description": f"% of stories spanning more than {max_sprints} sprints",
             "spillover_percentage": 0,
             "spillover_issues": [],
             "total_analyzed": 0,
@@ -291,10 +699,8 @@ class KPICalculator:
             # Use a time-based query as fallback since closedSprints() may not work
             jql_base = (
                 f"statusCategory = Done AND type in (Story, Task) AND "
-                f"updated >= -90d"
+                f"updated >= -90d{self._project_suffix}"
             )
-            if project_filter:
-                jql_base += f" AND {project_filter}"
 
             results["jql_queries"].append({
                 "purpose": "Get completed stories from past 90 days",
@@ -302,11 +708,16 @@ class KPICalculator:
             })
 
             try:
-                # Try the standard approach first
-                issues = self.jira.search_issues(
-                    jql_base,
-                    fields=["key", "summary", "sprint", "status"]
-                )
+                if issues is not None:
+                    issues = self._select_issues(
+                        issues, {"Story", "Task"}, done=True, date_field="updated", days_back=90
+                    )
+                else:
+                    # Try the standard approach first
+                    issues = self.jira.search_issues(
+                        jql_base,
+                        fields=list(_FIELDS_SPILLOVER)
+                    )
             except Exception as e:
                 self.logger.warning(f"Error with story spillover query: {e}. Returning minimal data.")
                 issues = []
@@ -317,15 +728,15 @@ class KPICalculator:
                 issue_key = issue.get("key")
                 fields = issue.get("fields", {})
 
-                # Get sprint field (customfield - typically customfield_10020 or similar)
-                # Sprint data shows all sprints this issue has been in
-                sprints = fields.get("sprint", [])
+                # Sprint data shows all sprints this issue has been in; search
+                # only returns it as customfield_10020, the Agile API as sprint
+                sprints = fields.get("sprint") or fields.get("customfield_10020") or []
 
                 # If sprint is not a list, make it one
                 if not isinstance(sprints, list):
                     sprints = [sprints] if sprints else []
 
-                sprint_count = len([s for s in sprints if s is not None])
+                sprint_count = sum(s is not None for s in sprints)
 
                 if sprint_count > max_sprints:
                     spillover_issues.append({
@@ -349,10 +760,8 @@ class KPICalculator:
             jql_spillover_example = (
                 f"sprint in closedSprints() AND "
                 f"type in (Story, Task) AND "
-                f"sprint is not EMPTY"
+                f"sprint is not EMPTY{self._project_suffix}"
             )
-            if project_filter:
-                jql_spillover_example += f" AND {project_filter}"
 
             results["jql_queries"].append({
                 "purpose": "Alternative query - needs post-processing",
@@ -364,29 +773,32 @@ class KPICalculator:
             self.logger.error(f"Error calculating story spillover: {e}")
             results["error"] = str(e)
 
-        return results
+        return KpiResult(
+            "Story Spillover", f"% of stories spanning more than {max_sprints} sprints", results
+        )
 
     # ==================== KPI 3: Average Story Cycle Time ====================
 
-    def calculate_cycle_time(self, days_back: int = 90) -> Dict[str, Any]:
+    def calculate_cycle_time(self, days_back: int = 90, issues: List[Dict] = None) -> KpiResult:
         """
         KPI 3: Average Story Cycle Time
         Measures avg time from "In Progress" → "Done"
 
         Calculation: Analyze changelog to find status transitions
 
+        Args:
+            days_back: Rolling window in days
+            issues: Optional shared dataset (see _fetch_unified_dataset)
+
         Returns:
-            Dictionary with cycle time metrics
+            KpiResult with cycle time metrics
         """
         self.logger.info("Calculating KPI 3: Average Story Cycle Time")
 
-        project_filter = self.get_project_filter()
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
 
         results = {
-            "kpi_name": "Average Story Cycle Time",
-            "description": "Avg time from In Progress → Done",
             "average_cycle_time_days": 0,
             "median_cycle_time_days": 0,
             "min_cycle_time_days": 0,
@@ -401,105 +813,97 @@ class KPICalculator:
             jql = (
                 f"statusCategory = Done AND "
                 f"type in (Story, Task) AND "
-                f"resolved >= -{days_back}d"
+                f"resolved >= -{days_back}d{self._project_suffix}"
             )
-            if project_filter:
-                jql += f" AND {project_filter}"
 
             results["jql_queries"].append({
                 "purpose": "Get completed stories for cycle time analysis",
                 "jql": jql
             })
 
-            issues = self.jira.search_issues(
-                jql,
-                fields=["key", "created", "resolutiondate", "status", "changelog"]
-            )
+            if issues is not None:
+                issues = self._select_issues(
+                    issues, {"Story", "Task"}, done=True,
+                    date_field="resolutiondate", days_back=days_back
+                )
+            else:
+                # Changelogs come back inline with the paginated search
+                issues = self.jira.search_issues(
+                    jql,
+                    fields=list(_FIELDS_CYCLE_TIME),
+                    expand=["changelog"]
+                )
 
             cycle_times = []
+            cycle_times_append = cycle_times.append
 
             for issue in issues:
                 issue_key = issue.get("key")
-                fields = issue.get("fields", {})
-
-                # Get changelog to find when issue moved to "In Progress"
-                try:
-                    changelog = self.jira.get_issue_changelog(issue_key)
-
-                    in_progress_date = None
-                    done_date = None
-
-                    # Find first transition to "In Progress" or similar status
-                    for history in changelog:
-                        for item in history.get("items", []):
-                            if item.get("field") == "status":
-                                to_status = item.get("toString", "").lower()
-                                created = history.get("created")
-
-                                # In Progress, Development, etc.
-                                if "in progress" in to_status or "development" in to_status:
-                                    if not in_progress_date:
-                                        in_progress_date = datetime.strptime(
-                                            created.split(".")[0], "%Y-%m-%dT%H:%M:%S"
-                                        )
-
-                                # Done, Closed, Resolved, etc.
-                                if to_status in ["done", "closed", "resolved"]:
-                                    done_date = datetime.strptime(
-                                        created.split(".")[0], "%Y-%m-%dT%H:%M:%S"
-                                    )
-
-                    # Calculate cycle time
-                    if in_progress_date and done_date and done_date > in_progress_date:
-                        cycle_time_days = (done_date - in_progress_date).days
-                        cycle_times.append({
-                            "key": issue_key,
-                            "cycle_time_days": cycle_time_days
-                        })
-
-                except Exception as e:
-                    self.logger.warning(f"Error analyzing changelog for {issue_key}: {e}")
-                    continue
+                changelog_page = issue.get("changelog") or {}
+                changelog = changelog_page.get("histories", [])
+
+                # Inline changelogs are capped; fetch the full history only
+                # for issues that have more entries than were returned
+                if changelog_page.get("total", 0) > len(changelog):
+                    try:
+                        changelog = self.jira.get_issue_changelog(issue_key)
+                    except Exception as e:
+                        self.logger.warning(f"Error fetching changelog for {issue_key}: {e}")
+                        continue
+
+                in_progress_date, done_date = _scan_status_transitions(changelog)
+
+                # Calculate cycle time
+                if in_progress_date and done_date and done_date > in_progress_date:
+                    cycle_time_days = (done_date - in_progress_date).days
+                    cycle_times_append({
+                        "key": issue_key,
+                        "cycle_time_days": cycle_time_days
+                    })
 
             results["issues_analyzed"] = len(cycle_times)
             results["cycle_times"] = cycle_times
 
             if cycle_times:
-                times = [ct["cycle_time_days"] for ct in cycle_times]
-                results["average_cycle_time_days"] = round(statistics.mean(times), 2)
+                # Sort once: min/max are the ends and the median's own sort
+                # is linear on sorted input. Cycle times are whole days, so
+                # sum()/len() is exact and avoids statistics.mean's Fraction
+                # arithmetic per element.
+                times = sorted(ct["cycle_time_days"] for ct in cycle_times)
+                results["average_cycle_time_days"] = round(sum(times) / len(times), 2)
                 results["median_cycle_time_days"] = round(statistics.median(times), 2)
-                results["min_cycle_time_days"] = min(times)
-                results["max_cycle_time_days"] = max(times)
+                results["min_cycle_time_days"] = times[0]
+                results["max_cycle_time_days"] = times[-1]
 
         except Exception as e:
             self.logger.error(f"Error calculating cycle time: {e}")
             results["error"] = str(e)
 
-        return results
+        return KpiResult("Average Story Cycle Time", "Avg time from In Progress → Done", results)
 
     # ==================== KPI 4: Work Mix Distribution ====================
 
-    def calculate_work_mix(self, days_back: int = 90) -> Dict[str, Any]:
+    def calculate_work_mix(self, days_back: int = 90, issues: List[Dict] = None) -> KpiResult:
         """
         KPI 4: Work Mix Distribution
         Measures % of work by label category
 
         JQL: Group epics/stories by label
 
+        Args:
+            days_back: Rolling window in days
+            issues: Optional shared dataset (see _fetch_unified_dataset)
+
         Returns:
-            Dictionary with work mix distribution
+            KpiResult with work mix distribution
         """
         self.logger.info("Calculating KPI 4: Work Mix Distribution")
 
-        project_filter = self.get_project_filter()
-
         # Get labels for the projects being analyzed
-        work_labels = self.get_labels_for_projects(self.projects)
+        work_labels = list(self._work_labels)
         label_mapping = self.get_label_mapping()
 
         results = {
-            "kpi_name": "Work Mix Distribution",
-            "description": "% of work by category (labels)",
             "distribution": {},
             "total_issues": 0,
             "issues_by_label": {},
@@ -513,57 +917,66 @@ class KPICalculator:
             # JQL: Get all epics and stories from the period
             jql_base = (
                 f"type in (Epic, Story, Task) AND "
-                f"created >= -{days_back}d"
+                f"created >= -{days_back}d{self._project_suffix}"
             )
-            if project_filter:
-                jql_base += f" AND {project_filter}"
 
             results["jql_queries"].append({
                 "purpose": "Get all work items for distribution analysis",
                 "jql": jql_base
             })
 
-            issues = self.jira.search_issues(
-                jql_base,
-                fields=["key", "labels", "issuetype", "project"]
-            )
+            if issues is not None:
+                issues = self._select_issues(
+                    issues, {"Epic", "Story", "Task"},
+                    date_field="created", days_back=days_back
+                )
+            else:
+                # Only labels are counted; a narrow field list lets JIRA return
+                # larger pages
+                issues = self.jira.search_issues(
+                    jql_base,
+                    fields=list(_FIELDS_WORK_MIX),
+                    page_size=1000
+                )
 
-            label_counts = Counter()
-            unlabeled = 0
+            work_labels_set = frozenset(work_labels)
 
-            for issue in issues:
-                fields = issue.get("fields", {})
-                labels = fields.get("labels", [])
+            # Work category labels per issue (now supports space-specific labels)
+            issue_work_labels = [
+                work_labels_set.intersection(issue.get("fields", {}).get("labels") or ())
+                for issue in issues
+            ]
 
-                # Check for work category labels (now supports space-specific labels)
-                issue_work_labels = [l for l in labels if l in work_labels]
-
-                if issue_work_labels:
-                    for label in issue_work_labels:
-                        label_counts[label] += 1
-                else:
-                    unlabeled += 1
+            # Counting over one flattened iterable keeps the loop in C; empty
+            # intersections (unlabeled issues) are counted by list.count
+            label_counts = Counter(chain.from_iterable(issue_work_labels))
+            unlabeled = issue_work_labels.count(frozenset())
 
             results["total_issues"] = len(issues)
             results["unlabeled_count"] = unlabeled
 
-            # Calculate distribution percentages
-            total_labeled = sum(label_counts.values())
+            # Calculate distribution percentages (locals avoid repeated
+            # results[...] lookups per label)
+            total_issues = results["total_issues"]
+            distribution = results["distribution"]
+            issues_by_label = results["issues_by_label"]
+            counts_get = label_counts.get
+            mapping_get = label_mapping.get
             for label in work_labels:
-                count = label_counts.get(label, 0)
-                if results["total_issues"] > 0:
-                    percentage = (count / results["total_issues"]) * 100
+                count = counts_get(label, 0)
+                if total_issues > 0:
+                    percentage = (count / total_issues) * 100
                 else:
                     percentage = 0
 
-                label_info = label_mapping.get(label, {})
-                results["distribution"][label] = {
+                label_info = mapping_get(label, {})
+                distribution[label] = {
                     "count": count,
                     "percentage": round(percentage, 2),
                     "name": label_info.get("name", label),
                     "space": label_info.get("space", "Unknown")
                 }
-                results["issues_by_label"][label] = count
+                issues_by_label[label] = count
 
             # Add unlabeled percentage
             if results["total_issues"] > 0:
@@ -579,83 +992,76 @@ class KPICalculator:
             }
 
             # Individual JQL queries for each label (for reference/debugging)
-            for label in work_labels:
-                jql_label = (
-                    f"type in (Epic, Story, Task) AND "
-                    f"labels = {label} AND "
-                    f"created >= -{days_back}d"
-                )
-                if project_filter:
-                    jql_label += f" AND {project_filter}"
-
-                results["jql_queries"].append({
+            results["jql_queries"].extend([
+                {
                     "purpose": f"Count issues with label: {label}",
-                    "jql": jql_label
-                })
+                    "jql": f"type in (Epic, Story, Task) AND labels = {label} AND created >= -{days_back}d{self._project_suffix}"
+                }
+                for label in work_labels
+            ])
 
         except Exception as e:
             self.logger.error(f"Error calculating work mix: {e}")
             results["error"] = str(e)
 
-        return results
+        return KpiResult("Work Mix Distribution", "% of work by category (labels)", results)
 
     # ==================== KPI 5: Unplanned Work Load ====================
 
-    def calculate_unplanned_work(self, sprint_lookback: int = 3) -> Dict[str, Any]:
+    def calculate_unplanned_work(self, sprint_lookback: int = 3,
+                                 board_sprints: List = None) -> KpiResult:
         """
         KPI 5: Unplanned Work Load
         Measures % of stories labeled as unplanned per sprint
 
         JQL: Count issues with 'unplanned' label per sprint
 
+        Args:
+            sprint_lookback: Number of closed sprints per board
+            board_sprints: Optional shared sprint dataset (see _fetch_sprint_dataset)
+
         Returns:
-            Dictionary with unplanned work metrics
+            KpiResult with unplanned work metrics
         """
         self.logger.info("Calculating KPI 5: Unplanned Work Load")
 
-        project_filter = self.get_project_filter()
         results = {
-            "kpi_name": "Unplanned Work Load",
-            "description": "% of stories labeled as unplanned",
             "sprints": [],
             "overall_average": 0,
             "jql_queries": []
         }
 
         try:
-            # Get boards for projects
-            boards = []
-            for project in self.projects:
-                project_boards = self.jira.get_boards(project_key=project)
-                boards.extend(project_boards)
+            if board_sprints is None:
+                # Get boards for projects
+                boards = self._get_boards(skip_errors=False)
+                board_sprints = self._collect_closed_sprint_issues(
+                    boards, sprint_lookback, fields=list(_FIELDS_UNPLANNED)
+                )
 
-            for board in boards:
-                board_id = board.get("id")
+            sprints_append = results["sprints"].append
+            for board, sprint_rows in board_sprints:
                 board_name = board.get("name")
 
-                # Get closed sprints
-                closed_sprints = self.jira.get_closed_sprints(board_id, count=sprint_lookback)
-
-                for sprint in closed_sprints:
+                for sprint, sprint_issues in sprint_rows:
                     sprint_id = sprint.get("id")
                     sprint_name = sprint.get("name")
 
                     # JQL: Total issues in sprint
-                    jql_total = f"sprint = {sprint_id} AND type in (Story, Task, Bug)"
-                    if project_filter:
-                        jql_total += f" AND {project_filter}"
+                    jql_total = f"sprint = {sprint_id} AND type in (Story, Task, Bug){self._project_suffix}"
 
                     # JQL: Unplanned issues in sprint
                     jql_unplanned = (
                         f"sprint = {sprint_id} AND "
                         f"labels = unplanned AND "
-                        f"type in (Story, Task, Bug)"
+                        f"type in (Story, Task, Bug){self._project_suffix}"
                     )
-                    if project_filter:
-                        jql_unplanned += f" AND {project_filter}"
 
-                    total_count = self.jira.get_issue_count(jql_total)
-                    unplanned_count = self.jira.get_issue_count(jql_unplanned)
+                    total_count = len(sprint_issues)
+                    unplanned_count = sum(
+                        1 for issue in sprint_issues
+                        if "unplanned" in (issue.get("fields", {}).get("labels") or [])
+                    )
 
                     if total_count > 0:
                         unplanned_percentage = (unplanned_count / total_count) * 100
@@ -672,7 +1078,7 @@ class KPICalculator:
                         "jql_unplanned": jql_unplanned
                     }
 
-                    results["sprints"].append(sprint_data)
+                    sprints_append(sprint_data)
                     results["jql_queries"].append({
                         "sprint": sprint_name,
                         "jql_total": jql_total,
@@ -688,26 +1094,27 @@ class KPICalculator:
             self.logger.error(f"Error calculating unplanned work: {e}")
             results["error"] = str(e)
 
-        return results
+        return KpiResult("Unplanned Work Load", "% of stories labeled as unplanned", results)
 
     # ==================== KPI 6: Reopened Stories ====================
 
-    def calculate_reopened_stories(self, days_back: int = 90) -> Dict[str, Any]:
+    def calculate_reopened_stories(self, days_back: int = 90, issues: List[Dict] = None) -> KpiResult:
         """
         KPI 6: Reopened Stories
         Measures % of issues reopened after Done
 
         JQL: Issues that changed FROM Done status
 
+        Args:
+            days_back: Rolling window in days
+            issues: Optional shared dataset (see _fetch_unified_dataset)
+
         Returns:
-            Dictionary with reopened story metrics
+            KpiResult with reopened story metrics
         """
         self.logger.info("Calculating KPI 6: Reopened Stories")
 
-        project_filter = self.get_project_filter()
         results = {
-            "kpi_name": "Reopened Stories",
-            "description": "% of issues reopened after Done",
             "reopened_percentage": 0,
             "reopened_issues": [],
             "total_completed": 0,
@@ -716,40 +1123,60 @@ class KPICalculator:
         }
 
         try:
-            # Try to find issues that might be reopened
-            # Note: Advanced history queries may not work on all JIRA instances
-            # Using a simpler approach that doesn't rely on status history
-            jql_reopened_1 = (
-                f"statusCategory != Done AND "
-                f"type in (Story, Task, Bug) AND "
-                f"updated >= -{days_back}d"
+            # Issues whose status left a done state (DONE_STATES) within the
+            # window; the changelog is expanded so each one can be confirmed
+            # below, as the shared dataset's candidates are
+            jql_reopened = (
+                f'status CHANGED FROM ("Done", "Closed", "Resolved") AFTER -{days_back}d AND '
+                f"type in (Story, Task, Bug){self._project_suffix}"
             )
-            if project_filter:
-                jql_reopened_1 += f" AND {project_filter}"
 
             results["jql_queries"].append({
-                "purpose": "Find issues that are NOT currently Done",
-                "jql": jql_reopened_1,
-                "note": "This is a simplified query. Advanced status history features may not be available."
+                "purpose": "Find issues that moved out of Done/Closed/Resolved in the period",
+                "jql": jql_reopened,
+                "note": "Each match is confirmed against its changelog (done -> non-done transition)."
             })
 
             # Try to get issues with this query
             try:
-                reopened_issues = self.jira.search_issues(
-                    jql_reopened_1,
-                    fields=["key", "summary", "status", "updated"]
-                )
+                if issues is not None:
+                    candidates = self._select_issues(issues, {"Story", "Task", "Bug"})
+                else:
+                    candidates = self.jira.search_issues(
+                        jql_reopened,
+                        fields=list(_FIELDS_REOPENED),
+                        expand=["changelog"]
+                    )
+
+                cutoff = (datetime.now() - timedelta(days=days_back)).isoformat()[:19]
+                reopened_issues = []
+                for issue in candidates:
+                    changelog_page = issue.get("changelog") or {}
+                    changelog = changelog_page.get("histories", [])
+                    # Fetch the full history only when the inline one was truncated
+                    if changelog_page.get("total", 0) > len(changelog):
+                        try:
+                            changelog = self.jira.get_issue_changelog(issue.get("key"))
+                        except Exception as e:
+                            self.logger.warning(f"Error fetching changelog for {issue.get('key')}: {e}")
+                            continue
+                    if _reopened_since(changelog, cutoff):
+                        reopened_issues.append(issue)
 
                 # Get total completed issues in the period for context
                 jql_completed = (
                     f"statusCategory = Done AND "
                     f"type in (Story, Task, Bug) AND "
-                    f"resolved >= -{days_back}d"
+                    f"resolved >= -{days_back}d{self._project_suffix}"
                 )
-                if project_filter:
-                    jql_completed += f" AND {project_filter}"
 
-                total_completed = self.jira.get_issue_count(jql_completed)
+                if issues is not None:
+                    total_completed = len(self._select_issues(
+                        issues, {"Story", "Task", "Bug"}, done=True,
+                        date_field="resolutiondate", days_back=days_back
+                    ))
+                else:
+                    total_completed = self.jira.get_issue_count(jql_completed)
 
                 results["jql_queries"].append({
                     "purpose": "Get total completed issues for context",
@@ -786,84 +1213,158 @@ class KPICalculator:
             self.logger.error(f"Error calculating reopened stories: {e}")
             results["error"] = str(e)
 
-        return results
+        return KpiResult("Reopened Stories", "% of issues reopened after Done", results)
 
     # ==================== Master Calculate All KPIs ====================
 
-    def calculate_all_kpis(self) -> Dict[str, Any]:
+    def _enabled_kpis(self) -> Dict[str, bool]:
+        """Enabled flag per registered KPI, read once per run"""
+        kpi_config = self._kpi_config
+        return {
+            key: kpi_config.get(key, {}).get("enabled", True)
+            for key, _, _, _ in _KPI_REGISTRY
+        }
+
+    def _has_labels(self, enabled: Dict[str, bool]) -> bool:
+        """Whether labels are configured (only resolved when a KPI uses them)"""
+        if enabled["work_mix"] or enabled["unplanned_work"]:
+            return len(self._work_labels) > 0
+        return bool(self.global_labels or self.space_labels)
+
+    def iter_kpis(self) -> Iterator[Tuple[str, KpiResult]]:
+        """
+        Calculate enabled KPIs, yielding each result as soon as it is ready
+
+        KPIs run concurrently and are yielded in completion order, so a
+        consumer can render or write out each one without waiting for the
+        slowest.
+
+        Yields:
+            Tuples of (KPI key, KpiResult)
+        """
+        kpi_config = self._kpi_config
+        analysis_periods = kpi_config.get("analysis_periods", {})
+        sprint_lookback = analysis_periods.get("sprint_lookback", 3)
+        rolling_days = analysis_periods.get("rolling_days", [90])[0]
+
+        enabled = self._enabled_kpis()
+        has_labels = self._has_labels(enabled)
+
+        # KPIs 2, 3, 4 and 6 share one rolling-window fetch (spillover always
+        # looks back 90 days, so the window covers at least that)
+        dataset = None
+        window_kpis = [
+            name for name in _WINDOW_KPI_FIELDS
+            if enabled[name] and (name != "work_mix" or has_labels)
+        ]
+        if window_kpis:
+            window_days = max(rolling_days, 90) if "story_spillover" in window_kpis else rolling_days
+            try:
+                dataset = self._fetch_unified_dataset(window_days, window_kpis)
+            except Exception as e:
+                self.logger.warning(f"Shared issue fetch failed, KPIs will query individually: {e}")
+
+        # KPIs 1 and 5 walk the same boards and closed sprints
+        sprint_dataset = None
+        if enabled["sprint_predictability"] and enabled["unplanned_work"]:
+            try:
+                sprint_dataset = self._fetch_sprint_dataset(sprint_lookback)
+            except Exception as e:
+                self.logger.warning(f"Shared sprint fetch failed, KPIs will query individually: {e}")
+
+        params = {
+            "sprint_lookback": sprint_lookback,
+            "rolling_days": rolling_days,
+            "dataset": dataset,
+            "sprint_dataset": sprint_dataset
+        }
+
+        # Collect enabled KPIs first, then run them concurrently: each one is
+        # independent and spends its time waiting on JIRA
+        tasks = {}
+        for key, method_name, build_kwargs, requires_labels in _KPI_REGISTRY:
+            if not enabled[key]:
+                continue
+            if requires_labels and not has_labels:
+                self.logger.warning(f"KPI {key} skipped - no labels configured")
+                yield key, KpiResult(
+                    "Work Mix Distribution", "% of work by category (labels)",
+                    dict(_WORK_MIX_SKIPPED), skipped=True
+                )
+                continue
+            kwargs = build_kwargs(kpi_config.get(key, {}), params)
+            tasks[key] = partial(getattr(self, method_name), **kwargs)
+
+        if "unplanned_work" in tasks and not has_labels:
+            self.logger.info("KPI 5 (Unplanned Work) running without labels - will show 0%")
+
+        if not tasks:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(6, len(tasks))) as executor:
+            futures = {executor.submit(task): name for name, task in tasks.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                # One failing KPI must not take down the rest of the batch
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error calculating {name}: {e}")
+                    result = KpiResult("", "", error=str(e))
+                yield name, result
+
+    def _result_cache_key(self) -> str:
+        """Hash of the config and JIRA instance plus the current TTL bucket"""
+        raw = json.dumps(self.config, sort_keys=True, default=str)
+        digest = hashlib.sha1(f"{getattr(self.jira, 'jira_url', '')}|{raw}".encode()).hexdigest()
+        bucket = int(time.time() // max(RESULT_CACHE_TTL_SECONDS, 1))
+        return f"{digest}:{bucket}"
+
+    def calculate_all_kpis(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Calculate all enabled KPIs
 
+        Results are reused for repeated calls with the same config within
+        the same RESULT_CACHE_TTL_SECONDS window.
+
+        Args:
+            force_refresh: Recalculate even if a cached result is available
+
         Returns:
             Dictionary containing all KPI results
         """
+        cache_key = self._result_cache_key() if RESULT_CACHE_TTL_SECONDS > 0 else None
+        if cache_key and not force_refresh and cache_key in self._result_cache:
+            self.logger.info("Serving KPI results from cache")
+            return copy.deepcopy(self._result_cache[cache_key])
+
         self.logger.info("Calculating all Platform Engineering KPIs")
 
-        kpi_config = self.config.get("kpis", {})
-        analysis_periods = kpi_config.get("analysis_periods", {})
+        analysis_periods = self._kpi_config.get("analysis_periods", {})
         sprint_lookback = analysis_periods.get("sprint_lookback", 3)
         rolling_days = analysis_periods.get("rolling_days", [90])[0]
 
-        # Check if labels are configured
-        has_labels = len(self.get_labels_for_projects()) > 0
+        # One timezone-aware timestamp per run
+        now_iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        computed = dict(self.iter_kpis())
 
         results = {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now_iso,
             "projects": self.projects,
             "analysis_period": {
                 "sprint_lookback": sprint_lookback,
                 "rolling_days": rolling_days
             },
-            "labels_configured": has_labels,
-            "kpis": {}
+            "labels_configured": self._has_labels(self._enabled_kpis()),
+            # Keep the KPI order stable in the output
+            "kpis": {
+                key: computed[key].to_dict()
+                for key, _, _, _ in _KPI_REGISTRY if key in computed
+            }
         }
 
-        # KPI 1: Sprint Predictability (no labels needed)
-        if kpi_config.get("sprint_predictability", {}).get("enabled", True):
-            results["kpis"]["sprint_predictability"] = self.calculate_sprint_predictability(
-                sprint_lookback=sprint_lookback
-            )
-
-        # KPI 2: Story Spillover (no labels needed)
-        if kpi_config.get("story_spillover", {}).get("enabled", True):
-            max_sprints = kpi_config.get("story_spillover", {}).get("max_sprints", 2)
-            results["kpis"]["story_spillover"] = self.calculate_story_spillover(
-                max_sprints=max_sprints
-            )
-
-        # KPI 3: Cycle Time (no labels needed)
-        if kpi_config.get("cycle_time", {}).get("enabled", True):
-            results["kpis"]["cycle_time"] = self.calculate_cycle_time(
-                days_back=rolling_days
-            )
-
-        # KPI 4: Work Mix (REQUIRES labels - skipped if not configured)
-        if kpi_config.get("work_mix", {}).get("enabled", True):
-            if has_labels:
-                results["kpis"]["work_mix"] = self.calculate_work_mix(
-                    days_back=rolling_days
-                )
-            else:
-                self.logger.warning("KPI 4 (Work Mix) skipped - no labels configured")
-                results["kpis"]["work_mix"] = {
-                    "kpi_name": "Work Mix Distribution",
-                    "description": "% of work by category (labels)",
-                    "skipped": True,
-                    "reason": "No labels configured. To enable, add labels in config/config.yaml"
-                }
-
-        # KPI 5: Unplanned Work (optional labels - works without but shows 0%)
-        if kpi_config.get("unplanned_work", {}).get("enabled", True):
-            results["kpis"]["unplanned_work"] = self.calculate_unplanned_work(
-                sprint_lookback=sprint_lookback
-            )
-            if not has_labels:
-                self.logger.info("KPI 5 (Unplanned Work) running without labels - will show 0%")
-
-        # KPI 6: Reopened Stories (no labels needed)
-        if kpi_config.get("reopened_stories", {}).get("enabled", True):
-            results["kpis"]["reopened_stories"] = self.calculate_reopened_stories(
-                days_back=rolling_days
-            )
-
+        if cache_key:
+            # Only the current bucket can ever be hit again
+            self._result_cache = {cache_key: copy.deepcopy(results)}
         return results
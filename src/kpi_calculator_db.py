@@ -4,13 +4,63 @@ Calculates KPIs from data stored in the local database
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Dict, List, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, Counter
-import statistics
 import json
 
-from database import DatabaseService
+from database import DatabaseService, DONE_STATUSES, SECONDS_PER_DAY
+
+# Issue types each KPI looks at
+STORY_TYPES = frozenset({'Story', 'Task'})
+WORKMIX_TYPES = frozenset({'Epic', 'Story', 'Task'})
+DELIVERY_TYPES = frozenset({'Story', 'Task', 'Bug'})
+
+# Upper bound on KPI calculations running at once (each uses its own connection)
+MAX_KPI_WORKERS = 6
+
+
+def _duration_stats(durations: List[float]) -> tuple:
+    """Average, median, min and max of a non-empty list of durations
+
+    One sort and one summing pass; the median is read straight off the
+    sorted values instead of sorting again.
+    """
+    ordered = sorted(durations)
+    count = len(ordered)
+    mid = count // 2
+    median = ordered[mid] if count % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    return sum(ordered) / count, median, ordered[0], ordered[-1]
+
+
+class _ReportRun:
+    """
+    State of one report run, shared by every KPI calculated in it
+
+    Kept apart from the calculator, whose single instance serves overlapping
+    dashboard callbacks; see KPICalculatorDB._report_scope.
+    """
+
+    __slots__ = ("now", "date_range_days", "filter_projects",
+                 "issues", "issues_by_project", "project_changelogs", "lock")
+
+    def __init__(self, date_range_days: int = None, filter_projects: List[str] = None):
+        # Clock reading shared by every cutoff in the run, so KPIs agree on "now"
+        self.now = datetime.now()
+        self.date_range_days = date_range_days
+        self.filter_projects = filter_projects
+        # Full issue set, loaded at most once per run
+        self.issues = None
+        self.issues_by_project = None
+        # Status changelogs of every project's reopen candidates, fetched in one
+        # query by calculate_kpis_by_project
+        self.project_changelogs = None
+        # The run's KPIs execute concurrently and may race to fill the caches
+        self.lock = threading.Lock()
 
 
 class KPICalculatorDB:
@@ -29,12 +79,62 @@ class KPICalculatorDB:
         self.logger = logging.getLogger(__name__)
         self.projects = config.get("projects", {}).get("project_keys", [])
 
+        # Report run active on each thread (see _report_scope)
+        self._local = threading.local()
+        # Set once sprint_reports is known to exist; tables are never dropped
+        self._sprint_reports_exist = False
+
     def get_projects_from_db(self) -> List[str]:
         """Get list of unique projects from database"""
-        with self.db.get_connection() as conn:
+        with self.db.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT DISTINCT project FROM issues WHERE project IS NOT NULL ORDER BY project")
-            return [row['project'] for row in cursor.fetchall()]
+            return [row['project'] for row in cursor]
+
+    def _all_issues(self) -> List[Dict]:
+        """All issues, fetched once per report run"""
+        run = self._run()
+        if run is None:
+            return self.db.get_issues()
+        with run.lock:
+            if run.issues is None:
+                run.issues = self.db.get_issues()
+            return run.issues
+
+    def _project_issues(self, project: str) -> List[Dict]:
+        """Issues of one project, sliced from the per-run issue set"""
+        run = self._run()
+        if run is None:
+            return self.db.get_issues(project=project)
+        issues = self._all_issues()
+        with run.lock:
+            if run.issues_by_project is None:
+                by_project = defaultdict(list)
+                for issue in issues:
+                    by_project[issue['project']].append(issue)
+                run.issues_by_project = by_project
+            return run.issues_by_project.get(project, [])
+
+    def _has_sprint_reports(self, cursor) -> bool:
+        """Whether the sprint_reports table exists, probing sqlite_master until it does"""
+        if not self._sprint_reports_exist:
+            cursor.execute("""
+                SELECT 1 FROM sqlite_master
+                WHERE type='table' AND name='sprint_reports'
+            """)
+            self._sprint_reports_exist = cursor.fetchone() is not None
+        return self._sprint_reports_exist
+
+    def _cutoff(self, days: int) -> int:
+        """UNIX time `days` days before the current run started (or now, outside a run)"""
+        run = self._run()
+        now = int(run.now.timestamp()) if run else int(time.time())
+        return now - days * SECONDS_PER_DAY
+
+    @staticmethod
+    def _rollup_refreshed_at(rollup: Dict[int, Dict]) -> str:
+        """When the sprint roll-up behind a KPI was last rebuilt (None if unused)"""
+        return max((counts['refreshed_at'] for counts in rollup.values()), default=None)
 
     def _filter_issues_by_date(self, issues: List[Dict], date_range_days: int = None) -> List[Dict]:
         """
@@ -50,11 +150,11 @@ class KPICalculatorDB:
         if date_range_days is None:
             return issues
 
-        cutoff_date = (datetime.now() - timedelta(days=date_range_days)).isoformat()
+        cutoff = self._cutoff(date_range_days)
 
         return [
             issue for issue in issues
-            if issue.get('updated', '') >= cutoff_date or issue.get('resolved', '') >= cutoff_date
+            if (issue.get('updated_epoch') or 0) >= cutoff or (issue.get('resolved_epoch') or 0) >= cutoff
         ]
 
     def calculate_all_kpis(self, date_range_days: int = None, projects: List[str] = None) -> Dict:
@@ -70,11 +170,63 @@ class KPICalculatorDB:
         """
         self.logger.info(f"Calculating all Platform Engineering KPIs from database (date_range: {date_range_days}, projects: {projects})")
 
-        # Store filter params for use in individual calculations
-        self._date_range_days = date_range_days
-        self._filter_projects = projects
+        # The filter params travel with the run for use in individual calculations
+        with self._report_scope(date_range_days=date_range_days, filter_projects=projects) as run:
+            return self._calculate_all_kpis(run, projects)
 
-        kpis = {}
+    def calculate_date_range_kpis(self, date_ranges: List[int], projects: List[str] = None) -> Dict[int, Dict]:
+        """
+        Calculate the date-filtered KPIs (cycle time and work mix) for several ranges
+
+        Only the KPIs that depend on the date range are computed, each as one
+        indexed query per range, and every range shares one "now".
+
+        Args:
+            date_ranges: Date ranges in days (e.g., [30, 90, 365])
+            projects: Optional list of projects to filter
+
+        Returns:
+            Dictionary of date range to {"cycle_time": ..., "work_mix": ...}
+        """
+        results = {}
+        with self._report_scope(filter_projects=projects) as run:
+            for days in date_ranges:
+                run.date_range_days = days
+                results[days] = {
+                    "cycle_time": self.calculate_cycle_time(),
+                    "work_mix": self.calculate_work_mix()
+                }
+        return results
+
+    def _run(self) -> _ReportRun:
+        """The report run active on this thread, or None outside one"""
+        return getattr(self._local, 'run', None)
+
+    @contextmanager
+    def _report_scope(self, run: _ReportRun = None, **filters):
+        """
+        Make a report run current on this thread, enabling the per-run caches and clock
+
+        Worker threads pass the run they calculate for. Otherwise an enclosing
+        run on this thread is reused, or a new one is started with the given
+        filters. Each thread sees only its own run, so overlapping calls never
+        share a clock, filters or caches.
+
+        Yields:
+            The current _ReportRun
+        """
+        current = self._run()
+        if run is None:
+            run = current or _ReportRun(**filters)
+
+        self._local.run = run
+        try:
+            yield run
+        finally:
+            self._local.run = current
+
+    def _calculate_all_kpis(self, report: _ReportRun, projects: List[str] = None) -> Dict:
+        """Body of calculate_all_kpis, run with the per-run issue cache enabled"""
         kpi_config = self.config.get("kpis", {})
 
         # Get actual projects from database
@@ -86,59 +238,39 @@ class KPICalculatorDB:
             db_projects = [p for p in db_projects if p in projects]
             self.logger.info(f"Filtered to requested projects: {db_projects}")
 
-        # KPI 1: Sprint Predictability
-        if kpi_config.get("sprint_predictability", {}).get("enabled", True):
-            self.logger.info("Calculating KPI 1: Sprint Predictability")
-            try:
-                kpis["sprint_predictability"] = self.calculate_sprint_predictability()
-            except Exception as e:
-                self.logger.error(f"Error calculating sprint predictability: {e}")
-                kpis["sprint_predictability"] = self._empty_sprint_predictability()
-
-        # KPI 2: Story Spillover
-        if kpi_config.get("story_spillover", {}).get("enabled", True):
-            self.logger.info("Calculating KPI 2: Story Spillover")
-            try:
-                kpis["story_spillover"] = self.calculate_story_spillover()
-            except Exception as e:
-                self.logger.error(f"Error calculating story spillover: {e}")
-                kpis["story_spillover"] = self._empty_story_spillover()
-
-        # KPI 3: Cycle Time
-        if kpi_config.get("cycle_time", {}).get("enabled", True):
-            self.logger.info("Calculating KPI 3: Average Story Cycle Time")
-            try:
-                kpis["cycle_time"] = self.calculate_cycle_time()
-            except Exception as e:
-                self.logger.error(f"Error calculating cycle time: {e}")
-                kpis["cycle_time"] = self._empty_cycle_time()
-
-        # KPI 4: Work Mix
-        if kpi_config.get("work_mix", {}).get("enabled", True):
-            self.logger.info("Calculating KPI 4: Work Mix Distribution")
-            try:
-                kpis["work_mix"] = self.calculate_work_mix()
-            except Exception as e:
-                self.logger.error(f"Error calculating work mix: {e}")
-                kpis["work_mix"] = self._empty_work_mix()
+        # (config key, log label, calculation, placeholder on error), in output order
+        kpi_tasks = [
+            ("sprint_predictability", "KPI 1: Sprint Predictability",
+             self.calculate_sprint_predictability, self._empty_sprint_predictability),
+            ("story_spillover", "KPI 2: Story Spillover",
+             self.calculate_story_spillover, self._empty_story_spillover),
+            ("cycle_time", "KPI 3: Average Story Cycle Time",
+             self.calculate_cycle_time, self._empty_cycle_time),
+            ("work_mix", "KPI 4: Work Mix Distribution",
+             self.calculate_work_mix, self._empty_work_mix),
+            ("unplanned_work", "KPI 5: Unplanned Work Load",
+             self.calculate_unplanned_work, self._empty_unplanned_work),
+            ("reopened_stories", "KPI 6: Reopened Stories",
+             self.calculate_reopened_stories, self._empty_reopened_stories),
+        ]
+        kpi_tasks = [task for task in kpi_tasks if kpi_config.get(task[0], {}).get("enabled", True)]
 
-        # KPI 5: Unplanned Work
-        if kpi_config.get("unplanned_work", {}).get("enabled", True):
-            self.logger.info("Calculating KPI 5: Unplanned Work Load")
+        def run(task):
+            key, label, calculate, empty = task
+            self.logger.info(f"Calculating {label}")
             try:
-                kpis["unplanned_work"] = self.calculate_unplanned_work()
+                with self._report_scope(report):
+                    return calculate()
             except Exception as e:
-                self.logger.error(f"Error calculating unplanned work: {e}")
-                kpis["unplanned_work"] = self._empty_unplanned_work()
+                self.logger.error(f"Error calculating {key.replace('_', ' ')}: {e}")
+                return empty()
 
-        # KPI 6: Reopened Stories
-        if kpi_config.get("reopened_stories", {}).get("enabled", True):
-            self.logger.info("Calculating KPI 6: Reopened Stories")
-            try:
-                kpis["reopened_stories"] = self.calculate_reopened_stories()
-            except Exception as e:
-                self.logger.error(f"Error calculating reopened stories: {e}")
-                kpis["reopened_stories"] = self._empty_reopened_stories()
+        # The KPIs are independent reads, so run them side by side
+        kpis = {}
+        if kpi_tasks:
+            with ThreadPoolExecutor(max_workers=min(MAX_KPI_WORKERS, len(kpi_tasks))) as executor:
+                for (key, _, _, _), result in zip(kpi_tasks, executor.map(run, kpi_tasks)):
+                    kpis[key] = result
 
         # Get analysis periods
         analysis_periods = kpi_config.get("analysis_periods", {})
@@ -147,7 +279,7 @@ class KPICalculatorDB:
         kpis_by_project = self.calculate_kpis_by_project(db_projects)
 
         return {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": report.now.isoformat(),
             "projects": db_projects,
             "analysis_period": analysis_periods,
             "kpis": kpis,
@@ -167,40 +299,49 @@ class KPICalculatorDB:
         """
         self.logger.info(f"Calculating KPIs by project: {projects}")
 
-        project_kpis = {}
+        if not projects:
+            return {}
 
-        for project in projects:
-            self.logger.info(f"Calculating KPIs for project {project}")
+        # Every project's KPIs are aggregated from its slice of one issue set;
+        # the changelogs reopened stories needs come from one bulk query
+        with self._report_scope() as report:
+            report.project_changelogs = self._reopen_changelogs([
+                issue['key'] for project in projects for issue in self._reopen_candidates(project)
+            ])
+
+            def run(project):
+                with self._report_scope(report):
+                    return self._kpis_for_project(project)
 
             try:
-                project_kpis[project] = {
-                    "sprint_predictability": self.calculate_sprint_predictability_for_project(project),
-                    "story_spillover": self.calculate_story_spillover_for_project(project),
-                    "cycle_time": self.calculate_cycle_time_for_project(project),
-                    "work_mix": self.calculate_work_mix_for_project(project),
-                    "reopened_stories": self.calculate_reopened_stories_for_project(project)
-                }
-            except Exception as e:
-                self.logger.error(f"Error calculating KPIs for project {project}: {e}")
-                project_kpis[project] = {}
+                with ThreadPoolExecutor(max_workers=min(MAX_KPI_WORKERS, len(projects))) as executor:
+                    return dict(zip(projects, executor.map(run, projects)))
+            finally:
+                report.project_changelogs = None
 
-        return project_kpis
+    def _kpis_for_project(self, project: str) -> Dict:
+        """Calculate all per-project KPIs for one project"""
+        self.logger.info(f"Calculating KPIs for project {project}")
+
+        try:
+            return {
+                "sprint_predictability": self.calculate_sprint_predictability_for_project(project),
+                "story_spillover": self.calculate_story_spillover_for_project(project),
+                "cycle_time": self.calculate_cycle_time_for_project(project),
+                "work_mix": self.calculate_work_mix_for_project(project),
+                "reopened_stories": self.calculate_reopened_stories_for_project(project)
+            }
+        except Exception as e:
+            self.logger.error(f"Error calculating KPIs for project {project}: {e}")
+            return {}
 
     def calculate_sprint_predictability(self) -> Dict:
         """Calculate Sprint Predictability KPI using sprint reports"""
         # First try to get data from sprint_reports table (preferred method)
-        with self.db.get_connection() as conn:
+        with self.db.get_read_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if sprint_reports table exists
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name='sprint_reports'
-            """)
-
-            has_sprint_reports = cursor.fetchone() is not None
-
-            if has_sprint_reports:
+            if self._has_sprint_reports(cursor):
                 # Get sprint lookback period
                 sprint_lookback = self.config.get("kpis", {}).get("analysis_periods", {}).get("sprint_lookback", 10)
 
@@ -255,33 +396,32 @@ class KPICalculatorDB:
 
         sprint_data = []
         total_rate = 0
-        all_issues = self.db.get_issues()
+
+        # Method 1: Committed/completed counts from sprint membership (for Scrum teams)
+        rollup = self.db.get_sprint_rollup([s['id'] for s in recent_sprints])
 
         for sprint in recent_sprints:
             sprint_id = sprint['id']
             sprint_start = sprint.get('start_date', '')
             sprint_end = sprint.get('end_date', '')
 
-            # Method 1: Try using sprint_ids first (for Scrum teams)
-            sprint_issues = [
-                issue for issue in all_issues
-                if sprint_id in issue.get('sprint_ids', [])
-            ]
-
-            # Method 2: If no issues with sprint_ids, use issues completed during sprint timeframe (for Kanban teams)
-            if not sprint_issues and sprint_start and sprint_end:
+            counts = rollup.get(sprint_id)
+            if counts:
+                committed = counts['committed']
+                completed = counts['completed']
+            elif sprint_start and sprint_end:
+                # Method 2: If no issues with sprint_ids, use issues completed during sprint timeframe (for Kanban teams)
                 self.logger.info(f"No issues with sprint_id {sprint_id}, using timeframe-based calculation")
-                sprint_issues = [
-                    issue for issue in all_issues
+                # Every issue matched here is Done, so committed == completed
+                committed = completed = sum(
+                    1 for issue in self._all_issues()
                     if issue.get('resolved')
                     and sprint_start <= issue['resolved'] <= sprint_end
-                    and issue['status'] in ['Done', 'Closed', 'Resolved']
-                    and issue['issue_type'] in ['Story', 'Task', 'Bug']
-                ]
-
-            # Count committed (all issues in sprint) vs completed (Done status)
-            committed = len(sprint_issues)
-            completed = len([i for i in sprint_issues if i['status'] in ['Done', 'Closed', 'Resolved']])
+                    and issue['status'] in DONE_STATUSES
+                    and issue['issue_type'] in DELIVERY_TYPES
+                )
+            else:
+                committed = completed = 0
 
             completion_rate = round((completed / committed * 100) if committed > 0 else 0, 1)
             total_rate += completion_rate
@@ -299,22 +439,20 @@ class KPICalculatorDB:
 
         return {
             "overall_average": overall_average,
-            "sprints": sprint_data
+            "sprints": sprint_data,
+            "refreshed_at": self._rollup_refreshed_at(rollup)
         }
 
     def calculate_story_spillover(self) -> Dict:
         """Calculate Story Spillover KPI"""
-        # Get all issues
-        issues = self.db.get_issues()
-
-        # Filter to stories and tasks
-        story_issues = [i for i in issues if i['issue_type'] in ['Story', 'Task']]
-
         spillover_threshold = self.config.get("kpis", {}).get("story_spillover", {}).get("max_sprints", 2)
 
-        # Find issues that spanned more than N sprints
+        # Find issues that spanned more than N sprints, streaming stories and
+        # tasks rather than holding them all in memory
         spillover_issues = []
-        for issue in story_issues:
+        total_analyzed = 0
+        for issue in self.db.iter_issues(types=STORY_TYPES):
+            total_analyzed += 1
             sprint_count = len(issue.get('sprint_ids', []))
             if sprint_count > spillover_threshold:
                 spillover_issues.append({
@@ -324,7 +462,6 @@ class KPICalculatorDB:
                     "status": issue['status']
                 })
 
-        total_analyzed = len(story_issues)
         spillover_count = len(spillover_issues)
         spillover_percentage = round((spillover_count / total_analyzed * 100) if total_analyzed > 0 else 0, 1)
 
@@ -337,64 +474,33 @@ class KPICalculatorDB:
 
     def calculate_cycle_time(self) -> Dict:
         """Calculate Average Cycle Time KPI"""
-        # Use filter date range if available, otherwise default to 365 days
-        date_range = getattr(self, '_date_range_days', None) or 365
-        cutoff_date = (datetime.now() - timedelta(days=date_range)).isoformat()
-
-        issues = self.db.get_issues()
+        # Use the run's filter date range if available, otherwise default to 365 days
+        run = self._run()
+        date_range = (run and run.date_range_days) or 365
+        cutoff = self._cutoff(date_range)
 
         # Filter by projects if specified
-        filter_projects = getattr(self, '_filter_projects', None)
-        if filter_projects:
-            issues = [i for i in issues if i['project'] in filter_projects]
-
-        completed_issues = [
-            i for i in issues
-            if i['status'] in ['Done', 'Closed', 'Resolved']
-            and i['resolved']
-            and i['resolved'] >= cutoff_date
-            and i['issue_type'] in ['Story', 'Task']
+        filter_projects = run.filter_projects if run else None
+
+        # Measured from the first move to "In Progress" (derived from the
+        # changelog at sync time; created date if never) to resolution
+        cycle_times = [
+            {"issue_key": key, "cycle_time_days": days}
+            for key, days in self.db.get_cycle_times(
+                statuses=DONE_STATUSES,
+                types=STORY_TYPES,
+                projects=filter_projects,
+                resolved_after=cutoff
+            )
         ]
 
-        cycle_times = []
-
-        for issue in completed_issues:
-            try:
-                # Get changelog to find when issue moved to "In Progress"
-                changelog = self.db.get_issue_changelog(issue['key'])
-
-                in_progress_date = None
-                for entry in changelog:
-                    if entry['field'] == 'status' and entry['to_value'] in ['In Progress', 'In Development']:
-                        in_progress_date = entry['created']
-                        break
-
-                # If no "In Progress" date found, use created date
-                if not in_progress_date:
-                    in_progress_date = issue['created']
-
-                resolved_date = issue['resolved']
-
-                # Calculate cycle time
-                start = datetime.fromisoformat(in_progress_date.replace('Z', '+00:00'))
-                end = datetime.fromisoformat(resolved_date.replace('Z', '+00:00'))
-                cycle_time_days = (end - start).days
-
-                if cycle_time_days >= 0:  # Ignore negative values
-                    cycle_times.append({
-                        "issue_key": issue['key'],
-                        "cycle_time_days": cycle_time_days
-                    })
-            except Exception as e:
-                self.logger.warning(f"Could not calculate cycle time for {issue['key']}: {e}")
-
         # Calculate statistics
         if cycle_times:
-            times = [ct['cycle_time_days'] for ct in cycle_times]
-            avg_cycle_time = round(statistics.mean(times), 1)
-            median_cycle_time = round(statistics.median(times), 1)
-            min_cycle_time = min(times)
-            max_cycle_time = max(times)
+            avg_cycle_time, median_cycle_time, min_cycle_time, max_cycle_time = _duration_stats(
+                [ct['cycle_time_days'] for ct in cycle_times]
+            )
+            avg_cycle_time = round(avg_cycle_time, 1)
+            median_cycle_time = round(median_cycle_time, 1)
         else:
             avg_cycle_time = median_cycle_time = min_cycle_time = max_cycle_time = 0
 
@@ -409,44 +515,31 @@ class KPICalculatorDB:
 
     def calculate_work_mix(self) -> Dict:
         """Calculate Work Mix Distribution KPI"""
-        # Use filter date range if available, otherwise default to 365 days
-        date_range = getattr(self, '_date_range_days', None) or 365
-        cutoff_date = (datetime.now() - timedelta(days=date_range)).isoformat()
-
-        issues = self.db.get_issues()
+        # Use the run's filter date range if available, otherwise default to 365 days
+        run = self._run()
+        date_range = (run and run.date_range_days) or 365
+        cutoff = self._cutoff(date_range)
 
         # Filter by projects if specified
-        filter_projects = getattr(self, '_filter_projects', None)
-        if filter_projects:
-            issues = [i for i in issues if i['project'] in filter_projects]
-
-        recent_issues = [
-            i for i in issues
-            if i['created'] >= cutoff_date
-            and i['issue_type'] in ['Epic', 'Story', 'Task']
-        ]
+        filter_projects = run.filter_projects if run else None
 
-        # Count issues by label
-        label_counts = Counter()
-        for issue in recent_issues:
-            labels = issue.get('labels', [])
-            if labels:
-                # Take first label as primary category
-                primary_label = labels[0]
-                label_counts[primary_label] += 1
-            else:
-                label_counts['unlabeled'] += 1
+        # Count issues by primary (first) label as category
+        label_counts = self.db.count_issues_by_primary_label(
+            types=WORKMIX_TYPES,
+            projects=filter_projects,
+            created_after=cutoff
+        )
 
-        total_issues = len(recent_issues)
+        total_issues = sum(count for _, count in label_counts)
 
         # Build distribution
-        distribution = {}
-        for label, count in label_counts.items():
-            percentage = round((count / total_issues * 100) if total_issues > 0 else 0, 1)
-            distribution[label] = {
+        distribution = {
+            label: {
                 "count": count,
-                "percentage": percentage
+                "percentage": round(count / total_issues * 100, 1)
             }
+            for label, count in label_counts
+        }
 
         return {
             "total_issues": total_issues,
@@ -464,24 +557,14 @@ class KPICalculatorDB:
         sprint_data = []
         total_pct = 0
 
-        for sprint in recent_sprints:
-            sprint_id = sprint['id']
-
-            # Get issues in this sprint
-            all_issues = self.db.get_issues()
-            sprint_issues = [
-                issue for issue in all_issues
-                if sprint_id in issue.get('sprint_ids', [])
-            ]
-
-            total_issues = len(sprint_issues)
+        # Issue counts per sprint, including unplanned issues (issues with
+        # "unplanned" or "interrupt" labels), from the sync-time roll-up
+        rollup = self.db.get_sprint_rollup([s['id'] for s in recent_sprints])
 
-            # Count unplanned issues (issues with "unplanned" or "interrupt" labels)
-            unplanned_issues = len([
-                i for i in sprint_issues
-                if any(label.lower() in ['unplanned', 'interrupt', 'urgent', 'incident']
-                      for label in i.get('labels', []))
-            ])
+        for sprint in recent_sprints:
+            counts = rollup.get(sprint['id'], {})
+            total_issues = counts.get('committed', 0)
+            unplanned_issues = counts.get('unplanned', 0)
 
             unplanned_pct = round((unplanned_issues / total_issues * 100) if total_issues > 0 else 0, 1)
             total_pct += unplanned_pct
@@ -499,40 +582,62 @@ class KPICalculatorDB:
 
         return {
             "overall_average": overall_average,
-            "sprints": sprint_data
+            "sprints": sprint_data,
+            "refreshed_at": self._rollup_refreshed_at(rollup)
         }
 
+    def _reopen_changelogs(self, issue_keys: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Status changelogs of the given issues that ever reached a done status
+
+        Issues never marked done cannot have been reopened, so their history
+        is neither fetched nor scanned
+        """
+        return self.db.get_changelogs_for_keys(issue_keys, reached_statuses=DONE_STATUSES)
+
+    @staticmethod
+    def _scan_reopen(changelog: List[Dict]) -> tuple:
+        """
+        Walk an issue's status changes, oldest first, until it is reopened
+
+        Args:
+            changelog: Status changelog entries ordered by created
+
+        Returns:
+            Tuple of (was_done, reopened) booleans
+        """
+        was_done = False
+        for entry in changelog:
+            if entry['to_value'] in DONE_STATUSES:
+                was_done = True
+            elif was_done:
+                return True, True
+        return was_done, False
+
     def calculate_reopened_stories(self) -> Dict:
         """Calculate Reopened Stories KPI"""
         # Get issues updated in last 365 days (to capture all data)
-        cutoff_date = (datetime.now() - timedelta(days=365)).isoformat()
+        cutoff = self._cutoff(365)
 
-        issues = self.db.get_issues()
-        recent_issues = [
-            i for i in issues
-            if i['updated'] >= cutoff_date
-            and i['issue_type'] in ['Story', 'Task', 'Bug']
-        ]
+        recent_issues = self.db.query_issues(
+            types=DELIVERY_TYPES,
+            updated_after=cutoff
+        )
 
         # Find reopened issues by checking changelog
         reopened_issues = []
         completed_count = 0
 
+        # One bulk changelog query instead of one per issue
+        changelogs = self._reopen_changelogs([i['key'] for i in recent_issues])
+
         for issue in recent_issues:
+            changelog = changelogs.get(issue['key'])
+            if not changelog:
+                continue  # Never reached a done status
             try:
-                changelog = self.db.get_issue_changelog(issue['key'])
-
-                was_done = False
-                reopened = False
-
-                for entry in sorted(changelog, key=lambda e: e['created']):
-                    if entry['field'] == 'status':
-                        if entry['to_value'] in ['Done', 'Closed', 'Resolved']:
-                            was_done = True
-                            completed_count += 1
-                        elif was_done and entry['to_value'] not in ['Done', 'Closed', 'Resolved']:
-                            reopened = True
-                            break
+                was_done, reopened = self._scan_reopen(changelog)
+                completed_count += was_done
 
                 if reopened:
                     reopened_issues.append({
@@ -558,18 +663,10 @@ class KPICalculatorDB:
     def calculate_sprint_predictability_for_project(self, project: str) -> Dict:
         """Calculate Sprint Predictability for a specific project using sprint reports"""
         # First try to get data from sprint_reports table
-        with self.db.get_connection() as conn:
+        with self.db.get_read_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if sprint_reports table exists
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name='sprint_reports'
-            """)
-
-            has_sprint_reports = cursor.fetchone() is not None
-
-            if has_sprint_reports:
+            if self._has_sprint_reports(cursor):
                 sprint_lookback = self.config.get("kpis", {}).get("analysis_periods", {}).get("sprint_lookback", 10)
 
                 # Get sprint reports for this project
@@ -607,16 +704,15 @@ class KPICalculatorDB:
         sprint_data = []
         total_rate = 0
 
-        for sprint in recent_sprints:
-            sprint_id = sprint['id']
-            all_issues = self.db.get_issues(project=project)
-            sprint_issues = [i for i in all_issues if sprint_id in i.get('sprint_ids', [])]
+        rollup = self.db.get_sprint_rollup([s['id'] for s in recent_sprints], project=project)
 
-            if not sprint_issues:
+        for sprint in recent_sprints:
+            counts = rollup.get(sprint['id'])
+            if not counts:
                 continue
 
-            committed = len(sprint_issues)
-            completed = len([i for i in sprint_issues if i['status'] in ['Done', 'Closed', 'Resolved']])
+            committed = counts['committed']
+            completed = counts['completed']
             completion_rate = round((completed / committed * 100) if committed > 0 else 0, 1)
             total_rate += completion_rate
 
@@ -628,27 +724,22 @@ class KPICalculatorDB:
             })
 
         overall_average = round(total_rate / len(sprint_data), 1) if sprint_data else 0
-        return {"overall_average": overall_average, "sprints": sprint_data}
+        return {
+            "overall_average": overall_average,
+            "sprints": sprint_data,
+            "refreshed_at": self._rollup_refreshed_at(rollup)
+        }
 
     def calculate_story_spillover_for_project(self, project: str) -> Dict:
         """Calculate Story Spillover for a specific project"""
-        issues = self.db.get_issues(project=project)
-        story_issues = [i for i in issues if i['issue_type'] in ['Story', 'Task']]
         spillover_threshold = self.config.get("kpis", {}).get("story_spillover", {}).get("max_sprints", 2)
 
-        spillover_issues = []
-        for issue in story_issues:
-            sprint_count = len(issue.get('sprint_ids', []))
-            if sprint_count > spillover_threshold:
-                spillover_issues.append({
-                    "key": issue['key'],
-                    "summary": issue['summary'],
-                    "sprint_count": sprint_count,
-                    "status": issue['status']
-                })
-
-        total_analyzed = len(story_issues)
-        spillover_count = len(spillover_issues)
+        # Only counts are reported per project, so no issue lists are built
+        total_analyzed = spillover_count = 0
+        for issue in self._project_issues(project):
+            if issue['issue_type'] in STORY_TYPES:
+                total_analyzed += 1
+                spillover_count += len(issue.get('sprint_ids', [])) > spillover_threshold
         spillover_percentage = round((spillover_count / total_analyzed * 100) if total_analyzed > 0 else 0, 1)
 
         return {
@@ -659,95 +750,73 @@ class KPICalculatorDB:
 
     def calculate_cycle_time_for_project(self, project: str) -> Dict:
         """Calculate Cycle Time for a specific project"""
-        cutoff_date = (datetime.now() - timedelta(days=365)).isoformat()
-        issues = self.db.get_issues(project=project)
-        completed_issues = [
-            i for i in issues
-            if i['status'] in ['Done', 'Closed', 'Resolved']
-            and i['resolved']
-            and i['resolved'] >= cutoff_date
-            and i['issue_type'] in ['Story', 'Task']
-        ]
+        cutoff = self._cutoff(365)
 
+        # Same rules as DatabaseService.get_cycle_times, over the project slice
         cycle_times = []
-        for issue in completed_issues:
-            try:
-                changelog = self.db.get_issue_changelog(issue['key'])
-                in_progress_date = None
-                for entry in changelog:
-                    if entry['field'] == 'status' and entry['to_value'] in ['In Progress', 'In Development']:
-                        in_progress_date = entry['created']
-                        break
-
-                if not in_progress_date:
-                    in_progress_date = issue['created']
-
-                start = datetime.fromisoformat(in_progress_date.replace('Z', '+00:00'))
-                end = datetime.fromisoformat(issue['resolved'].replace('Z', '+00:00'))
-                cycle_time_days = (end - start).days
-
-                if cycle_time_days >= 0:
-                    cycle_times.append(cycle_time_days)
-            except:
-                pass
+        for issue in self._project_issues(project):
+            end = issue['resolved_epoch']
+            if (issue['status'] not in DONE_STATUSES or issue['issue_type'] not in STORY_TYPES
+                    or end is None or end < cutoff):
+                continue
+            start = issue['first_in_progress_epoch']
+            if start is None:
+                start = issue['created_epoch']
+            if start is not None and end >= start:
+                cycle_times.append((end - start) // SECONDS_PER_DAY)
 
         if cycle_times:
+            average, median, _, _ = _duration_stats(cycle_times)
             return {
-                "average_cycle_time_days": round(statistics.mean(cycle_times), 1),
-                "median_cycle_time_days": round(statistics.median(cycle_times), 1),
+                "average_cycle_time_days": round(average, 1),
+                "median_cycle_time_days": round(median, 1),
                 "issues_analyzed": len(cycle_times)
             }
         return {"average_cycle_time_days": 0, "median_cycle_time_days": 0, "issues_analyzed": 0}
 
     def calculate_work_mix_for_project(self, project: str) -> Dict:
         """Calculate Work Mix for a specific project"""
-        cutoff_date = (datetime.now() - timedelta(days=365)).isoformat()
-        issues = self.db.get_issues(project=project)
-        recent_issues = [
-            i for i in issues
-            if i['created'] >= cutoff_date and i['issue_type'] in ['Epic', 'Story', 'Task']
-        ]
-
-        label_counts = Counter()
-        for issue in recent_issues:
-            labels = issue.get('labels', [])
-            if labels:
-                label_counts[labels[0]] += 1
-            else:
-                label_counts['unlabeled'] += 1
-
-        total_issues = len(recent_issues)
-        distribution = {}
-        for label, count in label_counts.items():
-            percentage = round((count / total_issues * 100) if total_issues > 0 else 0, 1)
-            distribution[label] = {"count": count, "percentage": percentage}
+        cutoff = self._cutoff(365)
+        label_counts = Counter(
+            issue['primary_label'] for issue in self._project_issues(project)
+            if issue['issue_type'] in WORKMIX_TYPES and (issue['created_epoch'] or 0) >= cutoff
+        )
+
+        total_issues = sum(label_counts.values())
+        distribution = {
+            label: {"count": count, "percentage": round(count / total_issues * 100, 1)}
+            for label, count in sorted(label_counts.items(), key=lambda item: (-item[1], item[0]))
+        }
 
         return {"total_issues": total_issues, "distribution": distribution}
 
+    def _reopen_candidates(self, project: str) -> List[Dict]:
+        """Issues of a project checked for reopens: delivery types updated in the last year"""
+        cutoff = self._cutoff(365)
+        return [
+            issue for issue in self._project_issues(project)
+            if issue['issue_type'] in DELIVERY_TYPES and (issue['updated_epoch'] or 0) >= cutoff
+        ]
+
     def calculate_reopened_stories_for_project(self, project: str) -> Dict:
         """Calculate Reopened Stories for a specific project"""
-        cutoff_date = (datetime.now() - timedelta(days=365)).isoformat()
-        issues = self.db.get_issues(project=project)
-        recent_issues = [
-            i for i in issues
-            if i['updated'] >= cutoff_date and i['issue_type'] in ['Story', 'Task', 'Bug']
-        ]
+        recent_issues = self._reopen_candidates(project)
 
         reopened_count = 0
         completed_count = 0
+        run = self._run()
+        changelogs = run.project_changelogs if run else None
+        if changelogs is None:
+            changelogs = self._reopen_changelogs([i['key'] for i in recent_issues])
 
         for issue in recent_issues:
+            changelog = changelogs.get(issue['key'])
+            if not changelog:
+                continue
             try:
-                changelog = self.db.get_issue_changelog(issue['key'])
-                was_done = False
-                for entry in sorted(changelog, key=lambda e: e['created']):
-                    if entry['field'] == 'status':
-                        if entry['to_value'] in ['Done', 'Closed', 'Resolved']:
-                            was_done = True
-                            completed_count += 1
-                        elif was_done:
-                            reopened_count += 1
-                            break
+                was_done, reopened = self._scan_reopen(changelog)
+                completed_count += was_done
+                reopened_count += reopened
             except:
                 pass
 
@@ -11,17 +11,38 @@ import argparse
 import json
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING
+
+try:
+    # Faster export/import of KPI data when available
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Streaming parser for large KPI exports
+    import ijson
+except ImportError:
+    ijson = None
+
+# Exports larger than this are streamed, keeping only DASHBOARD_SECTIONS
+STREAMING_LOAD_BYTES = 10 * 1024 * 1024
+
+# Top-level sections of a KPI export the dashboard reads
+DASHBOARD_SECTIONS = ("generated_at", "projects", "database_stats", "kpis", "kpis_by_project")
+
+# Where a .env file is looked for: the project root, then the working directory
+ENV_FILES = (Path(__file__).parent.parent / ".env", Path(".env"))
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config_loader import ConfigLoader
-from jira_client import JiraClient
-from kpi_calculator import KPICalculator
-from kpi_calculator_db import KPICalculatorDB
-from database import DatabaseService
-from dashboard import KPIDashboard
+# JIRA clients, calculators, the database layer and the dashboard (Dash,
+# plotly, pandas) are imported in the code paths that use them to keep CLI
+# startup fast
+if TYPE_CHECKING:
+    from jira_client import JiraClient
 
 
 def setup_logging(config: dict):
@@ -47,7 +68,7 @@ def setup_logging(config: dict):
     return logging.getLogger(__name__)
 
 
-def test_jira_connection(jira_client: JiraClient) -> bool:
+def test_jira_connection(jira_client: "JiraClient") -> bool:
     """
     Test JIRA connection
 
@@ -73,7 +94,7 @@ def test_jira_connection(jira_client: JiraClient) -> bool:
         return False
 
 
-def collect_kpi_data(config: dict, jira_client: JiraClient) -> dict:
+def collect_kpi_data(config: dict, jira_client: "JiraClient") -> dict:
     """
     Collect KPI data from JIRA
 
@@ -88,6 +109,8 @@ def collect_kpi_data(config: dict, jira_client: JiraClient) -> dict:
     print("Collecting KPI Data from JIRA...")
     print("="*60)
 
+    from kpi_calculator import KPICalculator
+
     calculator = KPICalculator(jira_client, config)
 
     print("\nCalculating KPIs...")
@@ -116,8 +139,17 @@ def save_kpi_data(kpi_data: dict, output_path: str = None):
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w') as f:
-        json.dump(kpi_data, f, indent=2, default=str)
+    if orjson is not None:
+        # datetimes are written as ISO strings; anything else unknown falls back to str()
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                kpi_data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(kpi_data, f, indent=2, default=str)
 
     print(f"\n✓ KPI data saved to: {output_path}")
 
@@ -132,10 +164,49 @@ def load_kpi_data(input_path: str) -> dict:
     Returns:
         KPI data dictionary
     """
+    if orjson is not None:
+        with open(input_path, 'rb') as f:
+            return orjson.loads(f.read())
+
     with open(input_path, 'r') as f:
         return json.load(f)
 
 
+def load_kpi_data_streaming(input_path: str, sections=DASHBOARD_SECTIONS) -> dict:
+    """
+    Load selected top-level sections of a KPI JSON file with ijson
+
+    Sections not requested are parsed past without building Python objects,
+    so memory use follows what is kept rather than the file size.
+
+    Args:
+        input_path: Input file path
+        sections: Top-level keys to keep
+
+    Returns:
+        KPI data dictionary holding only the requested sections
+    """
+    wanted = set(sections)
+    kpi_data = {}
+    key = None
+    builder = None
+
+    with open(input_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == '':
+                # Events of the top-level object itself
+                if builder is not None and event in ('map_key', 'end_map'):
+                    kpi_data[key] = builder.value
+                    builder = None
+                if event == 'map_key':
+                    key = value
+                    builder = ijson.ObjectBuilder() if key in wanted else None
+            elif builder is not None:
+                builder.event(event, value)
+
+    return kpi_data
+
+
 def run_dashboard(config: dict, kpi_data: dict = None, db=None, calculator=None):
     """
     Run the dashboard application
@@ -157,10 +228,49 @@ def run_dashboard(config: dict, kpi_data: dict = None, db=None, calculator=None)
     print(f"\nDashboard URL: http://{host}:{port}")
     print("\nPress CTRL+C to stop the dashboard\n")
 
+    from dashboard import KPIDashboard
+
     dashboard = KPIDashboard(config, kpi_data=kpi_data, db=db, calculator=calculator)
     dashboard.run(host=host, port=port, debug=debug)
 
 
+class _SummaryFields(dict):
+    """KPI fields for summary templates; missing fields read as 0"""
+
+    def __missing__(self, key):
+        return 0
+
+
+# print_kpi_summary layout: (KPI key, header/detail line templates, optional
+# (collection field, per-entry template)). "sprint_count" is len(sprints).
+_SUMMARY_SPEC = (
+    ("sprint_predictability", (
+        "\n📊 Sprint Predictability: {overall_average}%",
+        "   Sprints analyzed: {sprint_count}",
+    ), None),
+    ("story_spillover", (
+        "\n📈 Story Spillover: {spillover_percentage}%",
+        "   Spillover issues: {spillover_count} / {total_analyzed}",
+    ), None),
+    ("cycle_time", (
+        "\n⏱️  Average Cycle Time: {average_cycle_time_days} days",
+        "   Median: {median_cycle_time_days} days",
+        "   Issues analyzed: {issues_analyzed}",
+    ), None),
+    ("work_mix", (
+        "\n🔀 Work Mix Distribution (Total: {total_issues} issues):",
+    ), ("distribution", "   {category}: {percentage}% ({count} issues)")),
+    ("unplanned_work", (
+        "\n⚠️  Unplanned Work: {overall_average}%",
+        "   Sprints analyzed: {sprint_count}",
+    ), None),
+    ("reopened_stories", (
+        "\n🔄 Reopened Stories: {reopened_percentage}%",
+        "   Reopened: {reopened_count} / {total_completed}",
+    ), None),
+)
+
+
 def print_kpi_summary(kpi_data: dict):
     """
     Print KPI summary to console
@@ -174,52 +284,162 @@ def print_kpi_summary(kpi_data: dict):
 
     kpis = kpi_data.get("kpis", {})
 
-    # Sprint Predictability
-    if "sprint_predictability" in kpis:
-        sp = kpis["sprint_predictability"]
-        print(f"\n📊 Sprint Predictability: {sp.get('overall_average', 0)}%")
-        print(f"   Sprints analyzed: {len(sp.get('sprints', []))}")
-
-    # Story Spillover
-    if "story_spillover" in kpis:
-        ss = kpis["story_spillover"]
-        print(f"\n📈 Story Spillover: {ss.get('spillover_percentage', 0)}%")
-        print(f"   Spillover issues: {ss.get('spillover_count', 0)} / {ss.get('total_analyzed', 0)}")
-
-    # Cycle Time
-    if "cycle_time" in kpis:
-        ct = kpis["cycle_time"]
-        print(f"\n⏱️  Average Cycle Time: {ct.get('average_cycle_time_days', 0)} days")
-        print(f"   Median: {ct.get('median_cycle_time_days', 0)} days")
-        print(f"   Issues analyzed: {ct.get('issues_analyzed', 0)}")
-
-    # Work Mix
-    if "work_mix" in kpis:
-        wm = kpis["work_mix"]
-        print(f"\n🔀 Work Mix Distribution (Total: {wm.get('total_issues', 0)} issues):")
-        for category, data in wm.get("distribution", {}).items():
-            print(f"   {category}: {data.get('percentage', 0)}% ({data.get('count', 0)} issues)")
-
-    # Unplanned Work
-    if "unplanned_work" in kpis:
-        uw = kpis["unplanned_work"]
-        print(f"\n⚠️  Unplanned Work: {uw.get('overall_average', 0)}%")
-        print(f"   Sprints analyzed: {len(uw.get('sprints', []))}")
-
-    # Reopened Stories
-    if "reopened_stories" in kpis:
-        rs = kpis["reopened_stories"]
-        print(f"\n🔄 Reopened Stories: {rs.get('reopened_percentage', 0)}%")
-        print(f"   Reopened: {rs.get('reopened_count', 0)} / {rs.get('total_completed', 0)}")
+    for key, lines, rows in _SUMMARY_SPEC:
+        data = kpis.get(key)
+        if data is None:
+            continue
+
+        fields = _SummaryFields(data, sprint_count=len(data.get("sprints", [])))
+        for line in lines:
+            print(line.format_map(fields))
+
+        if rows:
+            collection, template = rows
+            for category, entry in data.get(collection, {}).items():
+                print(template.format_map(_SummaryFields(entry, category=category)))
 
     print("\n" + "="*60 + "\n")
 
 
+def create_jira_client(config: dict) -> "JiraClient":
+    """Build the (optionally caching) JIRA client for the first configured URL"""
+    jira_config = config.get("jira", {})
+    jira_urls = jira_config.get("urls", [])
+
+    if not jira_urls:
+        print("\n❌ No JIRA URLs configured!")
+        sys.exit(1)
+
+    # Use first JIRA URL
+    jira_url = jira_urls[0]
+    jira_email = jira_config.get("email")
+    jira_token = jira_config.get("token")
+    requests_per_second = jira_config.get("requests_per_second", 10)
+    burst = jira_config.get("burst")
+
+    cache_config = config.get("cache", {})
+    if cache_config.get("enabled", False):
+        from jira_cache import CachedJiraClient
+
+        return CachedJiraClient(
+            jira_url, jira_email, jira_token,
+            cache_dir=cache_config.get("cache_dir", "./data/cache"),
+            ttl_minutes=cache_config.get("ttl_minutes", 30),
+            closed_sprint_ttl_hours=cache_config.get("closed_sprint_ttl_hours", 12),
+            requests_per_second=requests_per_second,
+            burst=burst
+        )
+
+    from jira_client import JiraClient
+
+    return JiraClient(jira_url, jira_email, jira_token, requests_per_second, burst)
+
+
+def run_test_connection(args, config: dict, logger):
+    """--test-connection: check JIRA access and exit"""
+    success = test_jira_connection(create_jira_client(config))
+    sys.exit(0 if success else 1)
+
+
+def load_from_db(args, config: dict, logger):
+    """--use-db: calculate KPIs from the local database"""
+    print(f"\n📊 Loading KPI data from database: {args.db}")
+    try:
+        from database import DatabaseService
+        from kpi_calculator_db import KPICalculatorDB
+
+        db = DatabaseService(args.db)
+        stats = db.get_stats()
+
+        if stats['issues_count'] == 0:
+            print("\n⚠️  Database is empty!")
+            print("Please run the sync script first:")
+            print("  python sync_data.py --full")
+            sys.exit(1)
+
+        print(f"✓ Database loaded")
+        print(f"  - Issues: {stats['issues_count']}")
+        print(f"  - Sprints: {stats['sprints_count']}")
+        print(f"  - Projects: {stats['projects_count']}")
+
+        if stats['last_sync']:
+            print(f"  - Last sync: {stats['last_sync']['completed_at']}")
+
+        print("\n🔄 Calculating KPIs from database...")
+        calculator = KPICalculatorDB(db, config)
+        kpi_data = calculator.calculate_all_kpis()
+        print("✓ KPI calculation complete!")
+
+    except Exception as e:
+        logger.error(f"Error loading from database: {e}", exc_info=True)
+        print(f"\n❌ Error loading from database: {e}")
+        sys.exit(1)
+
+    return kpi_data, db, calculator
+
+
+def load_from_file(args, config: dict, logger):
+    """--load-data: read a previously saved KPI export"""
+    print(f"\n📂 Loading KPI data from: {args.load_data}")
+    try:
+        if ijson is not None and os.path.getsize(args.load_data) > STREAMING_LOAD_BYTES:
+            kpi_data = load_kpi_data_streaming(args.load_data)
+        else:
+            kpi_data = load_kpi_data(args.load_data)
+        print(f"✓ KPI data loaded successfully!")
+    except Exception as e:
+        print(f"❌ Error loading KPI data: {e}")
+        sys.exit(1)
+
+    return kpi_data, None, None
+
+
+def collect_from_jira(args, config: dict, logger):
+    """Default mode: collect KPI data live from JIRA"""
+    jira_client = create_jira_client(config)
+    try:
+        if not test_jira_connection(jira_client):
+            print("\n❌ Cannot proceed without JIRA connection!")
+            print("\n💡 Tip: Use --use-db to load from local database instead")
+            print("   First run: python sync_data.py --full")
+            sys.exit(1)
+
+        kpi_data = collect_kpi_data(config, jira_client)
+
+        # Save data if requested
+        if args.collect_only or args.output:
+            save_kpi_data(kpi_data, args.output)
+
+    except Exception as e:
+        logger.error(f"Error collecting KPI data: {e}", exc_info=True)
+        print(f"\n❌ Error collecting KPI data: {e}")
+        print("\n💡 Tip: Use --use-db to load from local database instead")
+        sys.exit(1)
+
+    return kpi_data, None, None
+
+
+# Data source handlers; each returns (kpi_data, db, calculator)
+MODE_HANDLERS = {
+    "test": run_test_connection,
+    "db": load_from_db,
+    "file": load_from_file,
+    "jira": collect_from_jira,
+}
+
+
 def main():
     """Main application entry point"""
 
-    # Load environment variables from .env file
-    load_dotenv()
+    # Load environment variables from .env file, when there is one
+    env_file = next((path for path in ENV_FILES if path.is_file()), None)
+    if env_file is not None:
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            pass
+        else:
+            load_dotenv(env_file)
 
     # Parse command line arguments
     parser = argparse.ArgumentParser(
@@ -293,91 +513,17 @@ def main():
     logger = setup_logging(config)
     logger.info("Platform Engineering KPI Dashboard starting...")
 
-    # Initialize JIRA client
-    jira_config = config.get("jira", {})
-    jira_urls = jira_config.get("urls", [])
-
-    if not jira_urls:
-        print("\n❌ No JIRA URLs configured!")
-        sys.exit(1)
-
-    # Use first JIRA URL
-    jira_url = jira_urls[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
-
-    # Test connection mode
+    # Only the selected mode runs; the database and file modes never build
+    # a JIRA client or import the live calculator
     if args.test_connection:
-        success = test_jira_connection(jira_client)
-        sys.exit(0 if success else 1)
-
-    # Load or collect KPI data
-    kpi_data = None
-    db = None
-    calculator = None
-
-    if args.use_db:
-        # Use database
-        print(f"\n📊 Loading KPI data from database: {args.db}")
-        try:
-            db = DatabaseService(args.db)
-            stats = db.get_stats()
-
-            if stats['issues_count'] == 0:
-                print("\n⚠️  Database is empty!")
-                print("Please run the sync script first:")
-                print("  python sync_data.py --full")
-                sys.exit(1)
-
-            print(f"✓ Database loaded")
-            print(f"  - Issues: {stats['issues_count']}")
-            print(f"  - Sprints: {stats['sprints_count']}")
-            print(f"  - Projects: {stats['projects_count']}")
-
-            if stats['last_sync']:
-                print(f"  - Last sync: {stats['last_sync']['completed_at']}")
-
-            print("\n🔄 Calculating KPIs from database...")
-            calculator = KPICalculatorDB(db, config)
-            kpi_data = calculator.calculate_all_kpis()
-            print("✓ KPI calculation complete!")
-
-        except Exception as e:
-            logger.error(f"Error loading from database: {e}", exc_info=True)
-            print(f"\n❌ Error loading from database: {e}")
-            sys.exit(1)
-
+        mode = "test"
+    elif args.use_db:
+        mode = "db"
     elif args.load_data:
-        # Load from file
-        print(f"\n📂 Loading KPI data from: {args.load_data}")
-        try:
-            kpi_data = load_kpi_data(args.load_data)
-            print(f"✓ KPI data loaded successfully!")
-        except Exception as e:
-            print(f"❌ Error loading KPI data: {e}")
-            sys.exit(1)
+        mode = "file"
     else:
-        # Collect from JIRA
-        try:
-            if not test_jira_connection(jira_client):
-                print("\n❌ Cannot proceed without JIRA connection!")
-                print("\n💡 Tip: Use --use-db to load from local database instead")
-                print("   First run: python sync_data.py --full")
-                sys.exit(1)
-
-            kpi_data = collect_kpi_data(config, jira_client)
-
-            # Save data if requested
-            if args.collect_only or args.output:
-                save_kpi_data(kpi_data, args.output)
-
-        except Exception as e:
-            logger.error(f"Error collecting KPI data: {e}", exc_info=True)
-            print(f"\n❌ Error collecting KPI data: {e}")
-            print("\n💡 Tip: Use --use-db to load from local database instead")
-            sys.exit(1)
+        mode = "jira"
+    kpi_data, db, calculator = MODE_HANDLERS[mode](args, config, logger)
 
     # Print summary if requested
     if args.summary and kpi_data:
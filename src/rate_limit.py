@@ -0,0 +1,86 @@
+"""
+Rate limiting for JIRA API calls
+Token bucket shared by every thread using a client
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Tokens refill continuously at `rate` per second up to `capacity`, so
+    short bursts run at full speed while the sustained request rate stays
+    within the budget. The rate can be changed and the bucket paused while
+    in use, e.g. from the server's rate-limit headers.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Largest burst allowed (default: one second's worth)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        # A default capacity follows later rate changes
+        self._capacity_from_rate = capacity is None
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last update (lock held)"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Take one token, sleeping until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Reserve the token now and sleep outside the lock, so waiting
+            # threads queue up behind each other instead of spinning
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+            wait = max(wait, self._paused_until - now)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def set_rate(self, rate: float):
+        """
+        Change the refill rate; tokens already accrued are kept up to the
+        (possibly new) capacity
+
+        Args:
+            rate: Tokens added per second
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            if self._capacity_from_rate:
+                self.capacity = float(max(rate, 1))
+                self._tokens = min(self._tokens, self.capacity)
+
+    def pause(self, seconds: float):
+        """
+        Hold every acquire() for at least this long and drop saved tokens
+
+        Args:
+            seconds: Delay from now, e.g. a Retry-After value
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._paused_until = max(self._paused_until, now + seconds)
@@ -0,0 +1,291 @@
+"""
+Shared setup and steps for the standalone sync scripts
+Loads configuration, builds the JIRA client, opens the local database and
+runs the board sync and result reports the scripts have in common
+"""
+
+import atexit
+import logging
+import sys
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+from config_loader import ConfigLoader
+from jira_client import JiraClient, updated_since_jql
+from jira_cache import CachedJiraClient
+from database import DatabaseService, ISSUE_FIELDS
+from tqdm import tqdm
+
+DEFAULT_DB_PATH = "./data/kpi_data.db"
+
+# Projects shown in the result breakdowns
+REPORT_PROJECTS = ("CCT", "CCEN", "SCPX")
+
+
+class ErrorSummary(logging.Handler):
+    """
+    Logging handler that counts records and keeps the first few messages
+
+    Only kept records are formatted, so a run where every call fails does
+    not render a message per failure; the count and kept messages feed the
+    script's closing summary and sync_metadata.
+    """
+
+    def __init__(self, keep: int = 10):
+        """
+        Initialize handler
+
+        Args:
+            keep: Number of messages to keep
+        """
+        super().__init__(logging.WARNING)
+        self.keep = keep
+        self.count = 0
+        self.messages = []
+
+    def emit(self, record: logging.LogRecord):
+        self.count += 1
+        if len(self.messages) < self.keep:
+            self.messages.append(record.getMessage())
+
+
+def error_log(name: str, keep: int = 10) -> Tuple[logging.Logger, ErrorSummary]:
+    """
+    Logger whose warnings are only collected into an ErrorSummary
+
+    Args:
+        name: Logger name
+        keep: Number of messages the summary keeps
+
+    Returns:
+        Tuple of (logger, summary)
+    """
+    summary = ErrorSummary(keep)
+    log = logging.getLogger(name)
+    log.setLevel(logging.WARNING)
+    log.propagate = False
+    log.addHandler(summary)
+    return log, summary
+
+
+def create_jira_client(config: Dict[str, Any], use_cache: bool = False) -> JiraClient:
+    """
+    Build a rate-limited client for the first configured JIRA URL
+
+    Args:
+        config: Loaded configuration
+        use_cache: Return a CachedJiraClient when the cache is enabled in config
+
+    Returns:
+        JiraClient instance
+    """
+    jira_config = config.get("jira", {})
+    jira_urls = jira_config.get("urls", [])
+
+    if not jira_urls:
+        print("\n❌ No JIRA URLs configured!")
+        sys.exit(1)
+
+    jira_url = jira_urls[0]
+    jira_email = jira_config.get("email")
+    jira_token = jira_config.get("token")
+    # Shared by every thread using the client, instead of fixed sleeps
+    requests_per_second = jira_config.get("requests_per_second", 10)
+    burst = jira_config.get("burst")
+
+    cache_config = config.get("cache", {})
+    if use_cache and cache_config.get("enabled", False):
+        return CachedJiraClient(
+            jira_url, jira_email, jira_token,
+            cache_dir=cache_config.get("cache_dir", "./data/cache"),
+            ttl_minutes=cache_config.get("ttl_minutes", 30),
+            closed_sprint_ttl_hours=cache_config.get("closed_sprint_ttl_hours", 12),
+            requests_per_second=requests_per_second,
+            burst=burst
+        )
+    return JiraClient(jira_url, jira_email, jira_token, requests_per_second, burst)
+
+
+def load_config() -> Dict[str, Any]:
+    """Load .env (when python-dotenv is installed) and the YAML configuration"""
+    if load_dotenv is not None:
+        load_dotenv()
+    return ConfigLoader().load()
+
+
+def connect_jira(title: str, config: Dict[str, Any], use_cache: bool = False) -> JiraClient:
+    """
+    Print the script banner and connect to JIRA
+
+    Exits if JIRA cannot be reached. The client's session is closed at exit.
+
+    Args:
+        title: Banner heading
+        config: Loaded configuration
+        use_cache: Use the disk-cached client when enabled in config
+
+    Returns:
+        JiraClient instance
+    """
+    jira_client = create_jira_client(config, use_cache)
+    atexit.register(jira_client.close)
+
+    print("\n" + "="*60)
+    print(title)
+    print("="*60)
+
+    if not jira_client.test_connection():
+        print("\n❌ Cannot connect to JIRA!")
+        sys.exit(1)
+
+    print("\n✓ Connected to JIRA")
+
+    return jira_client
+
+
+def init(title: str, use_cache: bool = False,
+         db_path: str = DEFAULT_DB_PATH) -> Tuple[JiraClient, DatabaseService, Dict[str, Any]]:
+    """
+    Load configuration, print the script banner, connect to JIRA and open
+    the database
+
+    Exits if JIRA cannot be reached.
+
+    Args:
+        title: Banner heading
+        use_cache: Use the disk-cached client when enabled in config
+        db_path: Path to database file
+
+    Returns:
+        Tuple of (jira_client, db, config)
+    """
+    config = load_config()
+    jira_client = connect_jira(title, config, use_cache)
+    return jira_client, DatabaseService(db_path), config
+
+
+def fetch_sprint_issues(jira_client: JiraClient, sprint_id: int, updated_since: int = None,
+                        page_size: int = 500, fields: Iterable[str] = ISSUE_FIELDS) -> List[Dict]:
+    """
+    Fetch all of a sprint's issues via the Agile API
+
+    Pages are requested until the sprint's total is reached, stepping by
+    what JIRA returned when it caps the page size. Safe to call from
+    worker threads; the client is shared.
+
+    Args:
+        jira_client: JIRA client
+        sprint_id: Sprint ID
+        updated_since: Only issues updated since this epoch (None = all)
+        page_size: Issues requested per page
+        fields: Fields to return (default: the ones stored by upserts)
+
+    Returns:
+        List of issue dictionaries
+    """
+    endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
+    params = {"fields": ",".join(fields)}
+    if updated_since is not None:
+        params["jql"] = updated_since_jql(updated_since)
+
+    issues = []
+    for page in jira_client.iter_agile_pages(endpoint, page_size=page_size, params=params):
+        issues.extend(page)
+    return issues
+
+
+def sync_board_issues(jira_client: JiraClient, db: DatabaseService, board_id: int,
+                      sync_type: str, projects: List[str], params: Dict = None,
+                      limit: int = None, workers: int = 1, desc: str = "Issues") -> int:
+    """
+    Page through a board's issues into the database as one recorded sync
+
+    Pages after the first are fetched concurrently and each is stored in a
+    single transaction. A failed fetch ends the sync with what was stored.
+
+    Args:
+        jira_client: JIRA client
+        db: Database service
+        board_id: Agile board ID
+        sync_type: Type recorded in sync_metadata
+        projects: Project keys recorded in sync_metadata
+        params: Extra query parameters (e.g., fields)
+        limit: Stop after this many issues (None = all)
+        workers: Threads used to fetch pages after the first
+        desc: Progress bar label
+
+    Returns:
+        Number of issues stored
+    """
+    sync_id = db.start_sync(sync_type, projects)
+    issues_synced = 0
+    endpoint = f"/rest/agile/1.0/board/{board_id}/issue"
+
+    try:
+        with tqdm(total=limit, desc=desc, unit=" issues", mininterval=1.0) as progress:
+            for issues in jira_client.iter_agile_pages(endpoint, page_size=1000, params=params,
+                                                       limit=limit, workers=workers):
+                issues_synced += db.upsert_issues_bulk(issues)
+                progress.update(len(issues))
+
+    except Exception as e:
+        print(f"❌ Error fetching board issues: {str(e)[:200]}")
+
+    db.complete_sync(sync_id, issues_synced, 0)
+    return issues_synced
+
+
+def project_breakdown(db: DatabaseService, projects: Iterable[str] = REPORT_PROJECTS):
+    """
+    Count issues per project and status in one grouped scan
+
+    Args:
+        db: Database service
+        projects: Project keys to include
+
+    Returns:
+        Tuple of (issues per project, issues with sprints per project,
+        [(status, count)] per project ordered by count)
+    """
+    projects = list(projects)
+    project_totals = Counter()
+    with_sprints_by_project = Counter()
+    statuses_by_project = defaultdict(list)
+    with db.get_read_connection() as conn:
+        for row in conn.execute(f"""
+            SELECT project, status, COUNT(*) as count,
+                   SUM(CASE WHEN sprint_ids != '[]' THEN 1 ELSE 0 END) as with_sprints
+            FROM issues
+            WHERE project IN ({', '.join('?' * len(projects))})
+            GROUP BY project, status
+            ORDER BY project, count DESC
+        """, projects):
+            project_totals[row['project']] += row['count']
+            with_sprints_by_project[row['project']] += row['with_sprints']
+            statuses_by_project[row['project']].append((row['status'], row['count']))
+    return project_totals, with_sprints_by_project, statuses_by_project
+
+
+def print_project_counts(db: DatabaseService):
+    """Print the number of issues stored for every project, largest first"""
+    with db.get_read_connection() as conn:
+        print("\nProjects in database:")
+        for row in conn.execute("""
+            SELECT project, COUNT(*) as count
+            FROM issues
+            GROUP BY project
+            ORDER BY count DESC
+        """):
+            print(f"  {row['project']}: {row['count']} issues")
+
+
+def print_restart_hint(what: str = None):
+    """Print how to restart the dashboard on the synced data"""
+    print(f"\n✓ Restart dashboard to see {what}:" if what else "\n✓ Restart dashboard:")
+    print("  lsof -ti:8050 | xargs kill -9")
+    print("  python src/main.py --use-db")
@@ -5,45 +5,68 @@ Get current/active sprints with in-progress issues from CCT board
 and CCEN Kanban board issues
 """
 
+import logging
+import queue
 import sys
-from pathlib import Path
-from dotenv import load_dotenv
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Dict
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
 from jira_client import JiraClient
-from database import DatabaseService
+from sync_common import init, print_restart_hint, project_breakdown
 from tqdm import tqdm
 
+# Progress lines from inside the fetch loops; see queued_log
+logger = logging.getLogger("sync_active_sprints")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+@contextmanager
+def queued_log(log: logging.Logger):
+    """
+    Write the logger's records from a background thread for the duration
+
+    Loop iterations only enqueue their messages instead of waiting on a
+    slow terminal. Leaving the block drains the queue, so the output stays
+    in order with the prints that follow.
+    """
+    log_queue = queue.Queue(-1)
+    handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log.addHandler(handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        log.removeHandler(handler)
+        listener.stop()
 
-def main():
-    """Sync active sprints and current issues"""
-
-    load_dotenv()
-
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
 
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
+def fetch_board_page(jira_client: JiraClient, board_id: int, start_at: int, max_results: int) -> Dict:
+    """Fetch one page of a board's issues"""
+    endpoint = f"/rest/agile/1.0/board/{board_id}/issue"
+    params = {
+        "startAt": start_at,
+        "maxResults": max_results
+    }
+    # Increase timeout for CCEN board
+    return jira_client._make_request(endpoint, params=params, timeout=60)
 
-    print("\n" + "="*60)
-    print("SYNC ACTIVE SPRINTS & CURRENT ISSUES")
-    print("="*60)
 
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
+def main():
+    """Sync active sprints and current issues"""
 
-    print("\n✓ Connected to JIRA")
+    jira_client, db, config = init("SYNC ACTIVE SPRINTS & CURRENT ISSUES", use_cache=True)
 
-    db = DatabaseService("./data/kpi_data.db")
+    # Concurrent JIRA requests; only HTTP runs in the workers, database
+    # writes stay on the main thread
+    workers = config.get("sync", {}).get("workers", 5)
 
     sync_id = db.start_sync("target_sprints", ["CCT", "CCEN"])
     total_issues = 0
@@ -89,49 +112,41 @@ def main():
             # Sync these sprints
             for sprint in target_sprints:
                 sprint['originBoardName'] = 'CCT Sprint Board'
-                db.upsert_sprint(sprint)
-                total_sprints += 1
+            total_sprints += db.upsert_sprints_bulk(target_sprints)
 
             # Sync issues from active sprints
             print(f"\n📝 Syncing issues from active sprints...")
 
-            for sprint in tqdm(target_sprints, desc="CCT sprints"):
-                sprint_id = sprint['id']
-                sprint_name = sprint.get('name', 'Unknown')
-
-                try:
-                    endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
-
-                    # Get all pages
-                    start_at = 0
-                    max_results = 100
-
-                    while True:
-                        params = {
-                            "startAt": start_at,
-                            "maxResults": max_results
-                        }
-
-                        result = jira_client._make_request(endpoint, params=params)
-                        issues = result.get('issues', [])
-                        total_issues_in_sprint = result.get('total', 0)
-
-                        if not issues:
-                            break
-
-                        for issue in issues:
-                            db.upsert_issue(issue)
-                            total_issues += 1
-
-                        start_at += len(issues)
-
-                        if start_at >= total_issues_in_sprint:
-                            break
-
-                    time.sleep(0.3)
-
-                except Exception as e:
-                    print(f"\n⚠️  Error syncing sprint {sprint_name}: {str(e)[:100]}")
+            # Closed sprints fetched before only need issues updated since;
+            # active and future sprints are always fetched in full
+            cursors = db.get_sprint_sync_cursors()
+            fetch_started = int(time.time())
+            synced_sprints = {}
+
+            with queued_log(logger), ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for sprint in target_sprints:
+                    closed = sprint.get('state') == 'closed'
+                    updated_since = cursors.get(sprint['id']) if closed else None
+                    future = executor.submit(jira_client.get_agile_sprint_issues, sprint['id'],
+                                             closed=closed, updated_since=updated_since)
+                    futures[future] = sprint
+
+                for future in tqdm(as_completed(futures), total=len(futures), desc="CCT sprints",
+                                   mininterval=1.0):
+                    sprint_name = futures[future].get('name', 'Unknown')
+
+                    try:
+                        # One transaction per sprint
+                        issues = future.result()
+                        db.upsert_issues_bulk(issues)
+                        total_issues += len(issues)
+                        synced_sprints[futures[future]['id']] = fetch_started
+
+                    except Exception as e:
+                        logger.info(f"\n⚠️  Error syncing sprint {sprint_name}: {str(e)[:100]}")
+
+            db.set_sprint_sync_cursors(synced_sprints)
 
         else:
             print(f"⚠️  No sprints found on CCT board")
@@ -151,53 +166,47 @@ def main():
     print(f"\n📝 Fetching issues from Kanban board (with pagination)...")
 
     try:
-        endpoint = f"/rest/agile/1.0/board/{board_id}/issue"
-
         # Get all pages with smaller batches
-        start_at = 0
         max_results = 50  # Smaller batches to avoid timeouts
         ccen_issues = 0
 
-        while True:
-            params = {
-                "startAt": start_at,
-                "maxResults": max_results
-            }
-
-            print(f"  Fetching batch starting at {start_at}...")
-
-            try:
-                # Increase timeout for CCEN board
-                result = jira_client._make_request(endpoint, params=params, timeout=60)
-
-                issues = result.get('issues', [])
-                total = result.get('total', 0)
-
-                if not issues:
-                    break
-
-                print(f"  ✓ Got {len(issues)} issues (total: {total})")
-
-                for issue in tqdm(issues, desc="CCEN issues"):
-                    db.upsert_issue(issue)
-                    total_issues += 1
-                    ccen_issues += 1
-
-                start_at += len(issues)
-
-                if start_at >= total:
-                    break
-
-                time.sleep(0.5)  # Be gentle with API
-
-            except Exception as e:
-                error_msg = str(e)
-                if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
-                    print(f"  ⚠️  Timeout at position {start_at}, saving what we got...")
-                    break
-                else:
-                    print(f"  ⚠️  Error: {error_msg[:100]}")
-                    break
+        # The first page reveals the total; the rest are fetched concurrently
+        print(f"  Fetching batch starting at 0...")
+        result = fetch_board_page(jira_client, board_id, 0, max_results)
+        issues = result.get('issues', [])
+        total = result.get('total', 0)
+        print(f"  ✓ Got {len(issues)} issues (total: {total})")
+
+        db.upsert_issues_bulk(issues)
+        total_issues += len(issues)
+        ccen_issues += len(issues)
+
+        # Step by what JIRA actually returned, which may be less than asked for
+        step = len(issues)
+        if 0 < step < total:
+            with queued_log(logger), ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(fetch_board_page, jira_client, board_id, start_at, step): start_at
+                    for start_at in range(step, total, step)
+                }
+
+                for future in as_completed(futures):
+                    start_at = futures[future]
+
+                    try:
+                        issues = future.result().get('issues', [])
+                        logger.info(f"  ✓ Got {len(issues)} issues at position {start_at}")
+
+                        db.upsert_issues_bulk(issues)
+                        total_issues += len(issues)
+                        ccen_issues += len(issues)
+
+                    except Exception as e:
+                        error_msg = str(e)
+                        if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
+                            logger.info(f"  ⚠️  Timeout at position {start_at}, skipping batch...")
+                        else:
+                            logger.info(f"  ⚠️  Error at position {start_at}: {error_msg[:100]}")
 
         print(f"\n✓ CCEN issues synced: {ccen_issues}")
 
@@ -213,70 +222,35 @@ def main():
     print(f"✓ Total issues synced: {total_issues}")
     print(f"✓ Total sprints synced: {total_sprints}")
 
-    # Show detailed project breakdown
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-
-        # Overall project stats
-        cursor.execute("""
-            SELECT project, COUNT(*) as count
-            FROM issues
-            WHERE project IN ('CCT', 'CCEN', 'SCPX')
-            GROUP BY project
-            ORDER BY project
-        """)
-
-        print("\nProject totals:")
-        for row in cursor.fetchall():
-            print(f"  {row['project']}: {row['count']} issues")
-
-        # CCT status breakdown
-        cursor.execute("""
-            SELECT status, COUNT(*) as count
-            FROM issues
-            WHERE project = 'CCT'
-            GROUP BY status
-            ORDER BY count DESC
-        """)
-
-        print("\nCCT status breakdown:")
-        cct_total = 0
-        for row in cursor.fetchall():
-            print(f"  {row['status']}: {row['count']}")
-            cct_total += row['count']
-        print(f"  TOTAL: {cct_total}")
-
-        # CCEN status breakdown
-        cursor.execute("""
-            SELECT status, COUNT(*) as count
-            FROM issues
-            WHERE project = 'CCEN'
-            GROUP BY status
-            ORDER BY count DESC
-        """)
-
-        print("\nCCEN status breakdown:")
-        ccen_total = 0
-        for row in cursor.fetchall():
-            print(f"  {row['status']}: {row['count']}")
-            ccen_total += row['count']
-        if ccen_total > 0:
-            print(f"  TOTAL: {ccen_total}")
-        else:
-            print("  (No CCEN data)")
-
-        # Check sprint assignments for CCT
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN sprint_ids != '[]' THEN 1 ELSE 0 END) as with_sprints
-            FROM issues
-            WHERE project = 'CCT'
-        """)
+    # Show detailed project breakdown, aggregated in one pass over issues
+    project_totals, with_sprints_by_project, statuses_by_project = project_breakdown(db)
+
+    # Overall project stats
+    print("\nProject totals:")
+    for project, count in project_totals.items():
+        print(f"  {project}: {count} issues")
+
+    # CCT status breakdown
+    print("\nCCT status breakdown:")
+    for status, count in statuses_by_project['CCT']:
+        print(f"  {status}: {count}")
+    cct_total = project_totals['CCT']
+    print(f"  TOTAL: {cct_total}")
+
+    # CCEN status breakdown
+    print("\nCCEN status breakdown:")
+    for status, count in statuses_by_project['CCEN']:
+        print(f"  {status}: {count}")
+    ccen_total = project_totals['CCEN']
+    if ccen_total > 0:
+        print(f"  TOTAL: {ccen_total}")
+    else:
+        print("  (No CCEN data)")
 
-        row = cursor.fetchone()
-        print(f"\nCCT sprint assignments:")
-        print(f"  Issues with sprints: {row['with_sprints']}/{row['total']}")
+    # Check sprint assignments for CCT
+    with_sprints = with_sprints_by_project['CCT']
+    print(f"\nCCT sprint assignments:")
+    print(f"  Issues with sprints: {with_sprints}/{cct_total}")
 
     stats = db.get_stats()
     print(f"\nDatabase totals:")
@@ -286,9 +260,7 @@ def main():
 
     if total_issues > 0:
         print("\n✅ Sync complete!")
-        print("\n✓ Restart dashboard to see updated data:")
-        print("  lsof -ti:8050 | xargs kill -9")
-        print("  python src/main.py --use-db")
+        print_restart_hint("updated data")
     else:
         print("\n⚠️  No new issues synced.")
 
@@ -4,49 +4,42 @@ Sync All Sprint Issues
 Syncs issues from all sprints with better timeout handling
 """
 
+import logging
 import sys
-from pathlib import Path
-from dotenv import load_dotenv
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
 from database import DatabaseService
+from sync_common import error_log, fetch_sprint_issues, init, print_restart_hint
 from tqdm import tqdm
 
 
-def main():
-    """Sync issues from all sprints"""
-
-    load_dotenv()
+# Issues written per transaction; batches span sprints
+UPSERT_BATCH_SIZE = 500
 
-    # Load configuration
-    config_loader = ConfigLoader()
-    config = config_loader.load()
 
-    # Initialize JIRA client
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
+def flush_issues(db: DatabaseService, batch: List[Dict], log: logging.Logger) -> int:
+    """
+    Upsert a batch of issues, falling back to one at a time if it fails
 
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
+    Issues that cannot be stored are logged as warnings.
 
-    print("\n" + "="*60)
-    print("SYNC ALL SPRINT ISSUES")
-    print("="*60)
+    Returns:
+        Number of issues stored
+    """
+    return db.upsert_issues_bulk(
+        batch, on_error=lambda issue, e: log.warning("%s: %.150s", issue.get('key'), e)
+    )
 
-    # Test connection
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
 
-    print("\n✓ Connected to JIRA")
+def main():
+    """Sync issues from all sprints"""
 
-    # Initialize database
-    db = DatabaseService("./data/kpi_data.db")
+    jira_client, db, config = init("SYNC ALL SPRINT ISSUES")
 
     # Get sprints from database
     sprints = db.get_sprints()
@@ -57,44 +50,56 @@ def main():
 
     issues_synced = 0
     sprints_processed = 0
-    errors = []
-
-    # Process all sprints
-    print("\n🔄 Fetching issues from all sprints...")
-
-    for sprint in tqdm(sprints, desc="Processing sprints"):
-        sprint_id = sprint['id']
-        sprint_name = sprint['name']
+    # Failures are counted; only the first few messages are built
+    log, errors = error_log("sync_all_sprints")
+    batch = []
 
-        try:
-            # Use Agile API to get sprint issues
-            endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
-            result = jira_client._make_request(endpoint, params={"maxResults": 100})
+    # Closed sprints fetched before only need issues updated since
+    cursors = db.get_sprint_sync_cursors()
+    fetch_started = int(time.time())
+    synced_sprints = {}
 
-            issues = result.get('issues', [])
-
-            if issues:
-                for issue in issues:
-                    try:
-                        db.upsert_issue(issue)
-                        issues_synced += 1
-                    except Exception as e:
-                        pass  # Silently handle duplicates
-
-                sprints_processed += 1
-
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.5)
+    # Process all sprints; workers only make HTTP requests, the database is
+    # written from this thread
+    print("\n🔄 Fetching issues from all sprints...")
 
-        except Exception as e:
-            error_msg = str(e)[:150]
-            if "timeout" in error_msg.lower():
-                errors.append(f"Timeout: {sprint_name}")
-            else:
-                errors.append(f"{sprint_name}: {error_msg}")
+    workers = config.get("sync", {}).get("workers", 5)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                fetch_sprint_issues, jira_client, sprint['id'],
+                cursors.get(sprint['id']) if sprint.get('state') == 'closed' else None
+            ): sprint
+            for sprint in sprints
+        }
+
+        for future in tqdm(as_completed(futures), total=len(futures),
+                           desc="Processing sprints", mininterval=1.0):
+            sprint_name = futures[future]['name']
+
+            try:
+                issues = future.result()
+                synced_sprints[futures[future]['id']] = fetch_started
+
+                if issues:
+                    batch.extend(issues)
+                    if len(batch) >= UPSERT_BATCH_SIZE:
+                        issues_synced += flush_issues(db, batch, log)
+                        batch = []
+                    sprints_processed += 1
+
+            except Exception as e:
+                error_msg = str(e)[:150]
+                if "timeout" in error_msg.lower():
+                    log.warning("Timeout: %s", sprint_name)
+                else:
+                    log.warning("%s: %s", sprint_name, error_msg)
+
+    issues_synced += flush_issues(db, batch, log)
+    db.set_sprint_sync_cursors(synced_sprints)
 
     # Complete sync
-    error_message = "\n".join(errors[:10]) if errors else None
+    error_message = "\n".join(errors.messages) if errors.count else None
     db.complete_sync(sync_id, issues_synced, sprints_processed, error_message)
 
     # Show results
@@ -103,8 +108,8 @@ def main():
     print("="*60)
     print(f"✓ Sprints processed: {sprints_processed}/{len(sprints)}")
     print(f"✓ Issues synced: {issues_synced}")
-    if errors:
-        print(f"⚠️  Errors/Timeouts: {len(errors)}")
+    if errors.count:
+        print(f"⚠️  Errors/Timeouts: {errors.count}")
 
     # Show database stats
     stats = db.get_stats()
@@ -118,9 +123,7 @@ def main():
     print("="*60)
 
     print("\n✅ Sync complete!")
-    print("\n✓ Restart dashboard to see updated data:")
-    print("  lsof -ti:8050 | xargs kill -9")
-    print("  python src/main.py --use-db")
+    print_restart_hint("updated data")
     print()
 
 
@@ -5,47 +5,19 @@ Specifically sync sprints and issues from CCEN boards
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dotenv import load_dotenv
-import time
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
-from database import DatabaseService
+from sync_common import fetch_sprint_issues, init, print_project_counts, print_restart_hint
 from tqdm import tqdm
 
 
 def main():
     """Sync CCEN data"""
 
-    load_dotenv()
-
-    # Load configuration
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    # Initialize JIRA client
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
-
-    print("\n" + "="*60)
-    print("SYNC CCEN DATA")
-    print("="*60)
-
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
-
-    print("\n✓ Connected to JIRA")
-
-    # Initialize database
-    db = DatabaseService("./data/kpi_data.db")
+    jira_client, db, config = init("SYNC CCEN DATA")
 
     # Get CCEN boards from database
     with db.get_connection() as conn:
@@ -82,8 +54,7 @@ def main():
                 print(f"  ✓ Found {len(sprints)} sprints")
                 for sprint in sprints:
                     sprint['originBoardName'] = board_name
-                    db.upsert_sprint(sprint)
-                    sprints_synced += 1
+                sprints_synced += db.upsert_sprints_bulk(sprints)
             else:
                 print(f"  ⚠️  No sprints found")
 
@@ -114,22 +85,25 @@ def main():
     issues_synced = 0
     sync_id = db.start_sync("ccen_issues", ["CCEN", "CCT"])
 
-    for sprint in tqdm(ccen_sprints, desc="Syncing CCEN issues"):
-        sprint_id = sprint['id']
-
-        try:
-            endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
-            result = jira_client._make_request(endpoint, params={"maxResults": 100})
-
-            issues = result.get('issues', [])
-            for issue in issues:
-                db.upsert_issue(issue)
-                issues_synced += 1
-
-            time.sleep(0.5)
-
-        except Exception as e:
-            pass  # Continue on errors
+    # Sprint requests run concurrently (paced by the client's rate limit);
+    # issues are written from this thread as each sprint completes. Every
+    # page of each sprint is fetched, with only the stored fields.
+    workers = config.get("sync", {}).get("workers", 5)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(fetch_sprint_issues, jira_client, sprint['id'])
+            for sprint in ccen_sprints
+        ]
+
+        for future in tqdm(as_completed(futures), total=len(futures),
+                           desc="Syncing CCEN issues", mininterval=1.0):
+            try:
+                issues = future.result()
+                db.upsert_issues_bulk(issues)
+                issues_synced += len(issues)
+
+            except Exception as e:
+                pass  # Continue on errors
 
     db.complete_sync(sync_id, issues_synced, sprints_synced)
 
@@ -141,18 +115,7 @@ def main():
     print(f"✓ Issues synced: {issues_synced}")
 
     # Show updated stats
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT project, COUNT(*) as count
-            FROM issues
-            GROUP BY project
-            ORDER BY count DESC
-        """)
-
-        print("\nProjects in database:")
-        for row in cursor.fetchall():
-            print(f"  {row['project']}: {row['count']} issues")
+    print_project_counts(db)
 
     stats = db.get_stats()
     print(f"\nTotal Issues:  {stats['issues_count']}")
@@ -161,9 +124,7 @@ def main():
 
     if issues_synced > 0:
         print("\n✅ CCEN data synced successfully!")
-        print("\n✓ Restart dashboard to see CCEN data:")
-        print("  lsof -ti:8050 | xargs kill -9")
-        print("  python src/main.py --use-db")
+        print_restart_hint("CCEN data")
     else:
         print("\n⚠️  No CCEN issues found.")
         print("CCEN boards may not have issues in sprints yet.")
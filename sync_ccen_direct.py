@@ -5,43 +5,19 @@ Try to get CCEN issues directly without going through sprints
 """
 
 import sys
+import time
 from pathlib import Path
-from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
-from database import DatabaseService
-from tqdm import tqdm
+from jira_client import updated_since_jql
+from sync_common import init, print_project_counts, print_restart_hint
 
 
 def main():
     """Sync CCEN issues directly"""
 
-    load_dotenv()
-
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
-
-    print("\n" + "="*60)
-    print("SYNC CCEN ISSUES DIRECTLY")
-    print("="*60)
-
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
-
-    print("\n✓ Connected to JIRA")
-
-    db = DatabaseService("./data/kpi_data.db")
+    jira_client, db, config = init("SYNC CCEN ISSUES DIRECTLY")
 
     # Try different project keys for CCEN
     project_keys = ["CCEN", "CCT"]
@@ -50,23 +26,37 @@ def main():
 
     sync_id = db.start_sync("ccen_direct", project_keys)
     issues_synced = 0
+    max_results = 500
+
+    # Projects searched before only need issues updated since that search
+    cursors = db.get_project_sync_cursors()
+    synced_projects = {}
 
     for project in project_keys:
         print(f"\n  Trying project: {project}")
 
         # Try simple project query
         try:
-            jql = f"project = {project} ORDER BY updated DESC"
+            since = cursors.get(project)
+            if since is not None:
+                jql = f"project = {project} AND {updated_since_jql(since)} ORDER BY updated DESC"
+            else:
+                jql = f"project = {project} ORDER BY updated DESC"
             print(f"  JQL: {jql}")
 
-            issues = jira_client.search_issues(jql, max_results=500)
+            fetch_started = int(time.time())
+            issues = jira_client.search_issues(jql, max_results=max_results)
+
+            # A truncated delta would skip the older updates on the next
+            # run, so only a complete incremental result advances the cursor
+            if since is None or len(issues) < max_results:
+                synced_projects[project] = fetch_started
 
             if issues:
                 print(f"  ✓ Found {len(issues)} issues in {project}")
 
-                for issue in tqdm(issues, desc=f"Syncing {project}"):
-                    db.upsert_issue(issue)
-                    issues_synced += 1
+                # One transaction for the whole result set
+                issues_synced += db.upsert_issues_bulk(issues)
             else:
                 print(f"  ⚠️  No issues found for {project}")
 
@@ -78,6 +68,7 @@ def main():
             if "does not exist" in error_msg.lower():
                 print(f"  ℹ️  Project {project} does not exist in JIRA")
 
+    db.set_project_sync_cursors(synced_projects)
     db.complete_sync(sync_id, issues_synced, 0)
 
     # Show results
@@ -86,18 +77,7 @@ def main():
     print("="*60)
     print(f"✓ Issues synced: {issues_synced}")
 
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT project, COUNT(*) as count
-            FROM issues
-            GROUP BY project
-            ORDER BY count DESC
-        """)
-
-        print("\nProjects in database:")
-        for row in cursor.fetchall():
-            print(f"  {row['project']}: {row['count']} issues")
+    print_project_counts(db)
 
     stats = db.get_stats()
     print(f"\nTotal Issues:  {stats['issues_count']}")
@@ -105,9 +85,7 @@ def main():
 
     if issues_synced > 0:
         print("\n✅ CCEN/CCT issues synced!")
-        print("\n✓ Restart dashboard:")
-        print("  lsof -ti:8050 | xargs kill -9")
-        print("  python src/main.py --use-db")
+        print_restart_hint()
     else:
         print("\n⚠️  No CCEN/CCT issues found.")
         print("\nPossible reasons:")
@@ -5,44 +5,20 @@ Get historical changelog for issues to reconstruct sprint history
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dotenv import load_dotenv
-import time
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
-from database import DatabaseService
+from database import DONE_STATUSES
+from sync_common import init, print_restart_hint
 from tqdm import tqdm
 
 
 def main():
     """Sync issue changelogs"""
 
-    load_dotenv()
-
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
-
-    print("\n" + "="*60)
-    print("SYNC ISSUE CHANGELOGS")
-    print("="*60)
-
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
-
-    print("\n✓ Connected to JIRA")
-
-    db = DatabaseService("./data/kpi_data.db")
+    jira_client, db, config = init("SYNC ISSUE CHANGELOGS")
 
     # Get all issues
     issues = db.get_issues()
@@ -52,67 +28,63 @@ def main():
     target_issues = [
         i for i in issues
         if i['project'] in ['CCT', 'SCPX']
-        and i['status'] in ['Done', 'Closed', 'Resolved']
+        and i['status'] in DONE_STATUSES
     ]
 
     print(f"✓ Targeting {len(target_issues)} closed CCT/SCPX issues for changelog sync")
     print("  (These are most relevant for Sprint Predictability calculations)")
 
+    # Issues not updated since their changelog was last fetched are skipped
+    # without a request. This makes conditional (ETag) requests pointless:
+    # every issue still pending has a new 'updated' value, which is part
+    # of the payload, so JIRA could never answer 304 Not Modified.
+    sync_state = db.get_changelog_sync_state()
+    pending = [i for i in target_issues if sync_state.get(i['key']) != i['updated']]
+    print(f"✓ Skipping {len(target_issues) - len(pending)} issues unchanged since their last changelog sync")
+
     changelogs_synced = 0
     errors = 0
+    synced = {}
 
     # Sync changelogs
     print("\n🔄 Syncing changelogs...")
 
-    for issue in tqdm(target_issues[:500], desc="Syncing changelogs"):  # Limit to 500 to avoid long runtime
-        try:
-            # Get issue with full changelog
-            endpoint = f"/rest/api/3/issue/{issue['key']}"
-            params = {"expand": "changelog"}
-
-            result = jira_client._make_request(endpoint, params=params, timeout=30)
-
-            # Extract and store changelog
-            changelog = result.get('changelog', {})
-            histories = changelog.get('histories', [])
-
-            if histories:
-                # Store changelog entries
-                for history in histories:
-                    changelog_data = {
-                        'issue_key': issue['key'],
-                        'created': history.get('created'),
-                        'author': history.get('author', {}).get('displayName', 'Unknown'),
-                        'items': history.get('items', [])
-                    }
-
-                    # Store in database
-                    with db.get_connection() as conn:
-                        cursor = conn.cursor()
-
-                        for item in changelog_data['items']:
-                            cursor.execute("""
-                                INSERT OR REPLACE INTO issue_changelog
-                                (issue_key, changed_at, author, field, from_value, to_value)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            """, (
-                                changelog_data['issue_key'],
-                                changelog_data['created'],
-                                changelog_data['author'],
-                                item.get('field'),
-                                item.get('fromString'),
-                                item.get('toString')
-                            ))
-
-                changelogs_synced += 1
-
-            # Rate limiting
-            time.sleep(0.1)
-
-        except Exception as e:
-            errors += 1
-            if errors < 5:  # Only print first few errors
-                print(f"\n⚠️  Error syncing {issue['key']}: {str(e)[:100]}")
+    # Issues with full changelog are fetched concurrently (paced by the
+    # client's rate limit); entries are stored from this thread
+    workers = config.get("sync", {}).get("workers", 5)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(jira_client._make_request, f"/rest/api/3/issue/{issue['key']}",
+                            params={"expand": "changelog"}, timeout=30): issue
+            for issue in pending[:500]  # Limit to 500 to avoid long runtime
+        }
+
+        for future in tqdm(as_completed(futures), total=len(futures),
+                           desc="Syncing changelogs", mininterval=1.0):
+            issue = futures[future]
+            try:
+                result = future.result()
+
+                # Extract and store changelog
+                changelog = result.get('changelog', {})
+                histories = changelog.get('histories', [])
+
+                if histories:
+                    # Replace the stored changelog in one transaction (also
+                    # keeps the issue's derived first in-progress timestamp
+                    # up to date)
+                    db.insert_changelog_entries(issue['key'], histories, replace=True)
+
+                    changelogs_synced += 1
+
+                synced[issue['key']] = issue['updated']
+
+            except Exception as e:
+                errors += 1
+                if errors < 5:  # Only print first few errors
+                    print(f"\n⚠️  Error syncing {issue['key']}: {str(e)[:100]}")
+
+    db.mark_changelogs_synced(synced)
 
     # Show results
     print("\n" + "="*60)
@@ -142,22 +114,20 @@ def main():
         # Sample sprint changes
         if sprint_changes > 0:
             cursor.execute("""
-                SELECT issue_key, changed_at, from_value, to_value
+                SELECT issue_key, created, from_value, to_value
                 FROM issue_changelog
                 WHERE field = 'Sprint'
-                ORDER BY changed_at DESC
+                ORDER BY created DESC
                 LIMIT 5
             """)
 
             print("\nSample sprint changes:")
-            for row in cursor.fetchall():
+            for row in cursor:
                 print(f"  {row['issue_key']}: {row['from_value']} → {row['to_value']}")
 
     print("\n✅ Changelog sync complete!")
     print("\n✓ Sprint Predictability calculations can now use historical sprint data")
-    print("\n✓ Restart dashboard to see updated KPIs:")
-    print("  lsof -ti:8050 | xargs kill -9")
-    print("  python src/main.py --use-db")
+    print_restart_hint("updated KPIs")
     print()
 
 
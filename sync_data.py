@@ -13,9 +13,9 @@ from dotenv import load_dotenv
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config_loader import ConfigLoader
-from jira_client import JiraClient
 from database import DatabaseService
 from data_collector import DataCollector
+from sync_common import create_jira_client
 
 
 def main():
@@ -123,24 +123,13 @@ Examples:
         sys.exit(0)
 
     # Initialize JIRA client
-    jira_config = config.get("jira", {})
-    jira_urls = jira_config.get("urls", [])
-
-    if not jira_urls:
-        print("\n❌ No JIRA URLs configured!")
-        sys.exit(1)
-
-    jira_url = jira_urls[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
+    jira_client = create_jira_client(config)
 
     # Test JIRA connection
     print("\n" + "="*60)
     print("JIRA Data Sync")
     print("="*60)
-    print(f"\nJIRA URL: {jira_url}")
+    print(f"\nJIRA URL: {jira_client.jira_url}")
     print(f"Database: {args.db}")
 
     if not jira_client.test_connection():
@@ -1,93 +1,142 @@
 #!/usr/bin/env python3
 """
 Sync Issues from Sprints
-Alternative approach - get issues from sprint API instead of JQL search
+Alternative approach - get issues by sprint: one JQL search across the
+sprints, falling back to the per-sprint Agile API when search fails
 """
 
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
-from database import DatabaseService
+from database import ISSUE_FIELDS
+from jira_client import updated_since_jql
+from sync_common import error_log, fetch_sprint_issues, init
 from tqdm import tqdm
 
+# Runs between full sweeps only fetch issues updated since each sprint's
+# cursor; a full re-read of every sprint happens at least this often
+FULL_SWEEP_SECONDS = 24 * 60 * 60
 
-def main():
-    """Sync issues from sprints"""
+# Upper bound on one bulk sprint search; a result this large is stored but
+# does not advance the sprint cursors
+MAX_BULK_ISSUES = 20000
 
-    load_dotenv()
 
-    # Load configuration
-    config_loader = ConfigLoader()
-    config = config_loader.load()
+def sprint_search_jql(sprint_ids, cursors) -> str:
+    """
+    JQL matching the issues of several sprints in one search
 
-    # Initialize JIRA client
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
+    Args:
+        sprint_ids: Sprint IDs to search
+        cursors: Sprint ID to epoch; those sprints match only issues updated since
 
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
+    Returns:
+        JQL query string
+    """
+    full = [str(sprint_id) for sprint_id in sprint_ids if sprint_id not in cursors]
+    clauses = [f"sprint in ({', '.join(full)})"] if full else []
+    clauses += [
+        f"(sprint = {sprint_id} AND {updated_since_jql(cursors[sprint_id])})"
+        for sprint_id in sprint_ids if sprint_id in cursors
+    ]
+    return " OR ".join(clauses)
 
-    print("\n" + "="*60)
-    print("SYNC ISSUES FROM SPRINTS")
-    print("="*60)
 
-    # Test connection
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
-
-    print("\n✓ Connected to JIRA")
+def main():
+    """Sync issues from sprints"""
 
-    # Initialize database
-    db = DatabaseService("./data/kpi_data.db")
+    jira_client, db, config = init("SYNC ISSUES FROM SPRINTS")
 
     # Get sprints from database
     sprints = db.get_sprints()
     print(f"\n📊 Found {len(sprints)} sprints in database")
 
+    # Full sweeps are recorded as "sprint_issues", deltas separately so the
+    # last full sweep can be found
+    fetch_started = int(time.time())
+    last_full = db.get_last_sync_epoch("sprint_issues")
+    delta = last_full is not None and fetch_started - last_full < FULL_SWEEP_SECONDS
+    cursors = db.get_sprint_sync_cursors() if delta else {}
+    synced_sprints = {}
+    if delta:
+        print("\n♻️  Delta sync: only issues updated since each sprint's last fetch")
+
     # Start sync
-    sync_id = db.start_sync("sprint_issues", ["SCPX", "CCEN"])
+    sync_id = db.start_sync("sprint_issues_delta" if delta else "sprint_issues", ["SCPX", "CCEN"])
 
     issues_synced = 0
-    errors = []
-
-    # Try to get issues from each sprint
-    print("\n🔄 Fetching issues from sprints...")
-
-    for sprint in tqdm(sprints[:10], desc="Processing sprints"):  # Try first 10 sprints
-        sprint_id = sprint['id']
-        sprint_name = sprint['name']
-
+    # Failures are counted; only the first few messages are built
+    log, errors = error_log("sync_from_sprints", keep=5)
+
+    # Try first 10 sprints
+    target_sprints = sprints[:10]
+    workers = config.get("sync", {}).get("workers", 5)
+    bulk_done = False
+
+    # One search covers every sprint; sprint membership comes back in the
+    # sprint field, which upserts store
+    if target_sprints:
+        print("\n🔄 Searching issues across sprints...")
         try:
-            # Use Agile API to get sprint issues
-            endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
-            result = jira_client._make_request(endpoint, params={"maxResults": 100})
-
-            issues = result.get('issues', [])
-
-            if issues:
-                print(f"\n✓ Found {len(issues)} issues in sprint {sprint_name}")
-
-                for issue in issues:
-                    try:
-                        db.upsert_issue(issue)
-                        issues_synced += 1
-                    except Exception as e:
-                        errors.append(f"Error saving {issue.get('key')}: {e}")
+            issues = jira_client.search_issues(
+                sprint_search_jql([sprint['id'] for sprint in target_sprints], cursors),
+                fields=list(ISSUE_FIELDS), max_results=MAX_BULK_ISSUES, workers=workers
+            )
+            print(f"✓ Found {len(issues)} issues in {len(target_sprints)} sprints")
+
+            issues_synced += db.upsert_issues_bulk(
+                issues, on_error=lambda issue, e: log.warning("Error saving %s: %s", issue.get('key'), e)
+            )
+            if len(issues) < MAX_BULK_ISSUES:
+                synced_sprints = {sprint['id']: fetch_started for sprint in target_sprints}
+            # An empty full sweep may mean search is not permitted for this
+            # account, so the Agile API is tried as well
+            bulk_done = bool(issues) or delta
 
         except Exception as e:
-            error_msg = f"Error fetching sprint {sprint_name}: {str(e)[:100]}"
-            errors.append(error_msg)
-            print(f"  ⚠️  {error_msg}")
+            print(f"⚠️  Sprint search failed ({str(e)[:100]}), fetching sprints one by one")
+
+    # Per-sprint Agile API requests, run concurrently (paced by the client's
+    # rate limit) with issues stored from this thread
+    if not bulk_done:
+        print("\n🔄 Fetching issues from sprints...")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(fetch_sprint_issues, jira_client, sprint['id'],
+                                updated_since=cursors.get(sprint['id'])): sprint
+                for sprint in target_sprints
+            }
+
+            for future in tqdm(as_completed(futures), total=len(futures),
+                               desc="Processing sprints", mininterval=1.0):
+                sprint_name = futures[future]['name']
+
+                try:
+                    issues = future.result()
+
+                    if issues:
+                        # tqdm.write keeps the progress bar intact below the message
+                        tqdm.write(f"\n✓ Found {len(issues)} issues in sprint {sprint_name}")
+
+                        issues_synced += db.upsert_issues_bulk(
+                            issues,
+                            on_error=lambda issue, e: log.warning("Error saving %s: %s", issue.get('key'), e)
+                        )
+                    synced_sprints[futures[future]['id']] = fetch_started
+
+                except Exception as e:
+                    error_msg = f"Error fetching sprint {sprint_name}: {str(e)[:100]}"
+                    log.warning(error_msg)
+                    tqdm.write(f"  ⚠️  {error_msg}")
+
+    db.set_sprint_sync_cursors(synced_sprints)
 
     # Complete sync
-    error_message = "\n".join(errors[:5]) if errors else None
+    error_message = "\n".join(errors.messages) if errors.count else None
     db.complete_sync(sync_id, issues_synced, 0, error_message)
 
     # Show results
@@ -95,10 +144,10 @@ def main():
     print("SYNC RESULTS")
     print("="*60)
     print(f"✓ Issues synced: {issues_synced}")
-    if errors:
-        print(f"⚠️  Errors: {len(errors)}")
+    if errors.count:
+        print(f"⚠️  Errors: {errors.count}")
         print("\nFirst few errors:")
-        for error in errors[:3]:
+        for error in errors.messages[:3]:
             print(f"  - {error}")
 
     # Show database stats
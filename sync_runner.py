@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Board Sync Runner
+Table-driven sync of whole-board issue listings into the local database
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from database import ISSUE_FIELDS
+from sync_common import init, print_restart_hint, project_breakdown, sync_board_issues
+
+# One entry per board sync; the sync_ccen_kanban.py / sync_cct_backlog.py
+# scripts run their entry by name
+BOARD_SYNCS = {
+    "ccen-kanban": {
+        "title": "SYNC CCEN KANBAN BOARD",
+        "board_id": 13644,
+        "board_name": "CCEN Kanban Board",
+        "project": "CCEN",
+        "sync_type": "ccen_kanban",
+        "fields": ISSUE_FIELDS,
+        "limit": None,
+    },
+    "cct-backlog": {
+        # All issues on the board: backlog, active sprints, etc.
+        "title": "SYNC CCT BACKLOG & ACTIVE ISSUES",
+        "board_id": 13679,
+        "board_name": "CCT Sprint Board",
+        "project": "CCT",
+        "sync_type": "cct_backlog",
+        "fields": (
+            "key", "summary", "status", "issuetype", "priority", "assignee", "reporter",
+            "created", "updated", "resolutiondate", "labels", "components", "project",
+            "customfield_10016", "customfield_10020",
+        ),
+        "limit": 500,
+    },
+}
+
+
+def run_board_sync(name: str):
+    """
+    Sync one board from BOARD_SYNCS and print the results
+
+    Args:
+        name: Key into BOARD_SYNCS
+    """
+    spec = BOARD_SYNCS[name]
+    project = spec["project"]
+
+    jira_client, db, config = init(spec["title"])
+
+    workers = config.get("sync", {}).get("workers", 5)
+
+    print(f"\n📋 Board: {spec['board_name']} (ID: {spec['board_id']})")
+    print(f"\n📝 Fetching issues from {spec['board_name']}...")
+
+    issues_synced = sync_board_issues(
+        jira_client, db, spec["board_id"], spec["sync_type"], [project],
+        params={"fields": ",".join(spec["fields"])}, limit=spec["limit"],
+        workers=workers, desc=f"{project} issues"
+    )
+
+    # Show results
+    print("\n" + "="*60)
+    print("SYNC RESULTS")
+    print("="*60)
+    print(f"✓ {project} issues synced: {issues_synced}")
+
+    project_totals, with_sprints_by_project, statuses_by_project = project_breakdown(db)
+
+    print(f"\n{project} status breakdown:")
+    for status, count in statuses_by_project[project]:
+        print(f"  {status}: {count}")
+    print(f"  TOTAL: {project_totals[project]}")
+
+    print(f"\n{project} issues in sprints: {with_sprints_by_project[project]}")
+
+    print("\nAll projects:")
+    for key, count in project_totals.items():
+        print(f"  {key}: {count} issues")
+
+    stats = db.get_stats()
+    print(f"\nTotal Issues:  {stats['issues_count']}")
+    print(f"Total Sprints: {stats['sprints_count']}")
+    print("="*60)
+
+    if issues_synced > 0:
+        print(f"\n✅ {project} data synced successfully!")
+        print_restart_hint(f"updated {project} data")
+    else:
+        print(f"\n⚠️  No {project} issues found on board.")
+
+    print()
+
+
+def main():
+    """Run the board sync named on the command line"""
+    parser = argparse.ArgumentParser(description="Sync a JIRA board's issues to the local database")
+    parser.add_argument("board", choices=sorted(BOARD_SYNCS), help="Board sync to run")
+    args = parser.parse_args()
+
+    run_board_sync(args.board)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,44 +5,23 @@ Sync data from CCT sprint board and CCEN Kanban board
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dotenv import load_dotenv
-import time
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
-from database import DatabaseService
+from database import ISSUE_FIELDS
+from sync_common import fetch_sprint_issues, init, print_restart_hint
 from tqdm import tqdm
 
 
 def main():
     """Sync specific boards"""
 
-    load_dotenv()
+    jira_client, db, config = init("SYNC CCT AND CCEN BOARDS")
 
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
-
-    print("\n" + "="*60)
-    print("SYNC CCT AND CCEN BOARDS")
-    print("="*60)
-
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
-
-    print("\n✓ Connected to JIRA")
-
-    db = DatabaseService("./data/kpi_data.db")
+    # Concurrent sprint requests, paced by the client's rate limit
+    workers = config.get("sync", {}).get("workers", 5)
 
     # Specific board IDs from user
     boards_to_sync = [
@@ -85,28 +64,26 @@ def main():
 
                 for sprint in sprints:
                     sprint['originBoardName'] = board_name
-                    db.upsert_sprint(sprint)
-                    total_sprints += 1
+                total_sprints += db.upsert_sprints_bulk(sprints)
 
                 # Sync issues from each sprint
                 print(f"\n📝 Syncing issues from sprints...")
 
-                for sprint in tqdm(sprints[:10], desc=f"{project} sprints"):  # First 10 sprints
-                    sprint_id = sprint['id']
-
-                    try:
-                        endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
-                        result = jira_client._make_request(endpoint, params={"maxResults": 200})
+                # First 10 sprints, fetched concurrently; issues are stored
+                # from this thread as each sprint completes
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(fetch_sprint_issues, jira_client, sprint['id'])
+                        for sprint in sprints[:10]
+                    ]
 
-                        issues = result.get('issues', [])
-                        for issue in issues:
-                            db.upsert_issue(issue)
-                            total_issues += 1
+                    for future in tqdm(as_completed(futures), total=len(futures),
+                                       desc=f"{project} sprints", mininterval=1.0):
+                        try:
+                            total_issues += db.upsert_issues_bulk(future.result())
 
-                        time.sleep(0.3)
-
-                    except Exception as e:
-                        pass  # Continue on errors
+                        except Exception as e:
+                            pass  # Continue on errors
 
             else:
                 print(f"⚠️  No sprints found on this board")
@@ -114,16 +91,18 @@ def main():
                 # For Kanban boards (no sprints), try to get issues directly from board
                 print(f"\n📝 Trying to get issues from board (Kanban)...")
                 try:
+                    # Every page of the board, each stored as it arrives; the
+                    # first page's total lets the rest be fetched concurrently
                     endpoint = f"/rest/agile/1.0/board/{board_id}/issue"
-                    result = jira_client._make_request(endpoint, params={"maxResults": 500})
-
-                    issues = result.get('issues', [])
-                    if issues:
-                        print(f"✓ Found {len(issues)} issues on board")
+                    board_issues = 0
+                    for issues in jira_client.iter_agile_pages(endpoint, page_size=500,
+                                                               params={"fields": ",".join(ISSUE_FIELDS)},
+                                                               workers=workers):
+                        board_issues += db.upsert_issues_bulk(issues)
+                    total_issues += board_issues
 
-                        for issue in tqdm(issues, desc=f"{project} issues"):
-                            db.upsert_issue(issue)
-                            total_issues += 1
+                    if board_issues:
+                        print(f"✓ Found {board_issues} issues on board")
 
                 except Exception as e:
                     print(f"❌ Could not get board issues: {str(e)[:150]}")
@@ -153,7 +132,7 @@ def main():
 
         current_project = None
         print("\nProject breakdown:")
-        for row in cursor.fetchall():
+        for row in cursor:
             if row['project'] != current_project:
                 current_project = row['project']
                 print(f"\n  {current_project}:")
@@ -165,9 +144,7 @@ def main():
     print("="*60)
 
     print("\n✅ Sync complete!")
-    print("\n✓ Restart dashboard to see updated data:")
-    print("  lsof -ti:8050 | xargs kill -9")
-    print("  python src/main.py --use-db")
+    print_restart_hint("updated data")
     print()
 
 
@@ -5,63 +5,33 @@ Get completed vs committed data from sprint reports for Sprint Predictability
 """
 
 import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dotenv import load_dotenv
-import time
-import json
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
-from database import DatabaseService
+from sync_common import init, print_restart_hint
 from tqdm import tqdm
 
 
-def main():
-    """Sync sprint reports for closed sprints"""
-
-    load_dotenv()
-
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
-
-    print("\n" + "="*60)
-    print("SYNC SPRINT REPORTS")
-    print("="*60)
+def fetch_sprint_report(jira_client, board_id: int, sprint_id: int):
+    """Fetch the greenhopper sprint report for one sprint as (dict, body text)"""
+    endpoint = "/rest/greenhopper/1.0/rapid/charts/sprintreport"
+    params = {
+        "rapidViewId": board_id,
+        "sprintId": sprint_id
+    }
+    return jira_client._make_request(endpoint, params=params, timeout=30, return_raw=True)
 
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
 
-    print("\n✓ Connected to JIRA")
+def main():
+    """Sync sprint reports for closed sprints"""
 
-    db = DatabaseService("./data/kpi_data.db")
+    jira_client, db, config = init("SYNC SPRINT REPORTS")
 
-    # Create sprint_reports table if it doesn't exist
-    with db.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sprint_reports (
-                sprint_id INTEGER PRIMARY KEY,
-                board_id INTEGER,
-                sprint_name TEXT,
-                project TEXT,
-                committed_count INTEGER,
-                completed_count INTEGER,
-                punted_count INTEGER,
-                completion_rate REAL,
-                report_data TEXT,
-                synced_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+    # Concurrent report requests, paced by the client's rate limit
+    workers = config.get("sync", {}).get("workers", 5)
 
     # Get closed sprints for CCT and SCPX boards
     # Filter by sprint name patterns
@@ -71,6 +41,7 @@ def main():
     ]
 
     reports_synced = 0
+    reports_unchanged = 0
     errors = 0
 
     for board in boards_to_sync:
@@ -83,64 +54,58 @@ def main():
         print(f"Project: {project}")
         print('='*60)
 
-        # Get ALL closed sprints and filter by sprint name pattern
-        all_sprints = db.get_sprints(state="closed")
-        sprint_pattern = board.get('sprint_pattern', '')
-        # Filter to sprints from this project based on sprint name pattern
-        sprints = [
-            s for s in all_sprints
-            if sprint_pattern.lower() in s.get('name', '').lower()
-        ]
+        # The 15 most recently ended closed sprints from this project,
+        # matched on sprint name pattern; filtering, sorting and the limit
+        # all run in the query
+        sprints = db.get_sprints(state="closed", name_contains=board.get('sprint_pattern', ''),
+                                 order_by="end_date", limit=15)
 
         if not sprints:
             print(f"⚠️  No closed sprints found for {board_name}")
             continue
 
-        # Sort by end date and get recent ones
-        sprints = sorted(sprints, key=lambda s: s.get('end_date', ''), reverse=True)[:15]
-
         print(f"✓ Found {len(sprints)} closed sprints to sync")
 
         # Sync sprint reports
         print(f"\n📊 Syncing sprint reports...")
 
-        for sprint in tqdm(sprints, desc=f"{project} sprints"):
-            sprint_id = sprint['id']
-            sprint_name = sprint.get('name', 'Unknown')
+        # Reports are fetched concurrently and processed here as each one
+        # arrives; rows are stored together once the board's requests are
+        # done, so no write transaction is held open across HTTP calls
+        report_rows = []
 
-            try:
-                # Get sprint report
-                endpoint = f"/rest/greenhopper/1.0/rapid/charts/sprintreport"
-                params = {
-                    "rapidViewId": board_id,
-                    "sprintId": sprint_id
-                }
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(fetch_sprint_report, jira_client, board_id, sprint['id']): sprint
+                for sprint in sprints
+            }
 
-                result = jira_client._make_request(endpoint, params=params, timeout=30)
+            for future in tqdm(as_completed(futures), total=len(futures), desc=f"{project} sprints",
+                               mininterval=1.0):
+                sprint = futures[future]
+                sprint_id = sprint['id']
+                sprint_name = sprint.get('name', 'Unknown')
 
-                if result and 'contents' in result:
-                    contents = result['contents']
+                try:
+                    # The body is stored as received rather than re-serialized,
+                    # zlib-compressed (see DatabaseService.get_sprint_report)
+                    result, report_text = future.result()
 
-                    # Extract metrics
-                    completed_issues = contents.get('completedIssues', [])
-                    not_completed = contents.get('issuesNotCompletedInCurrentSprint', [])
-                    punted = contents.get('puntedIssues', [])
+                    if result and 'contents' in result:
+                        contents = result['contents']
 
-                    committed_count = len(completed_issues) + len(not_completed)
-                    completed_count = len(completed_issues)
-                    punted_count = len(punted)
+                        # Extract metrics
+                        completed_issues = contents.get('completedIssues', [])
+                        not_completed = contents.get('issuesNotCompletedInCurrentSprint', [])
+                        punted = contents.get('puntedIssues', [])
 
-                    # Store sprint report data in database
-                    with db.get_connection() as conn:
-                        cursor = conn.cursor()
+                        committed_count = len(completed_issues) + len(not_completed)
+                        completed_count = len(completed_issues)
+                        punted_count = len(punted)
 
                         completion_rate = round((completed_count / committed_count * 100) if committed_count > 0 else 0, 1)
 
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO sprint_reports
-                            (sprint_id, board_id, sprint_name, project, committed_count, completed_count, punted_count, completion_rate, report_data)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
+                        report_rows.append((
                             sprint_id,
                             board_id,
                             sprint_name,
@@ -149,24 +114,52 @@ def main():
                             completed_count,
                             punted_count,
                             completion_rate,
-                            json.dumps(result)
+                            zlib.compress(report_text.encode())
                         ))
 
-                    reports_synced += 1
-
-                time.sleep(0.3)  # Rate limiting
-
-            except Exception as e:
-                errors += 1
-                error_msg = str(e)
-                if errors < 5:
-                    print(f"\n⚠️  Error syncing {sprint_name}: {error_msg[:100]}")
+                except Exception as e:
+                    errors += 1
+                    error_msg = str(e)
+                    if errors < 5:
+                        tqdm.write(f"\n⚠️  Error syncing {sprint_name}: {error_msg[:100]}")
+
+        # Store the board's sprint reports in one transaction; a report
+        # identical to the stored one is left alone instead of rewritten
+        if report_rows:
+            with db.get_connection() as conn:
+                cursor = conn.executemany("""
+                    INSERT INTO sprint_reports
+                    (sprint_id, board_id, sprint_name, project, committed_count, completed_count, punted_count, completion_rate, report_data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(sprint_id) DO UPDATE SET
+                        board_id = excluded.board_id,
+                        sprint_name = excluded.sprint_name,
+                        project = excluded.project,
+                        committed_count = excluded.committed_count,
+                        completed_count = excluded.completed_count,
+                        punted_count = excluded.punted_count,
+                        completion_rate = excluded.completion_rate,
+                        report_data = excluded.report_data,
+                        synced_at = CURRENT_TIMESTAMP
+                    WHERE (sprint_reports.board_id, sprint_reports.sprint_name, sprint_reports.project,
+                           sprint_reports.committed_count, sprint_reports.completed_count,
+                           sprint_reports.punted_count, sprint_reports.completion_rate,
+                           sprint_reports.report_data)
+                       IS NOT (excluded.board_id, excluded.sprint_name, excluded.project,
+                               excluded.committed_count, excluded.completed_count,
+                               excluded.punted_count, excluded.completion_rate,
+                               excluded.report_data)
+                """, report_rows)
+            # rowcount only counts the rows actually inserted or updated
+            reports_synced += cursor.rowcount
+            reports_unchanged += len(report_rows) - cursor.rowcount
 
     # Show results
     print("\n" + "="*60)
     print("SYNC RESULTS")
     print("="*60)
     print(f"✓ Sprint reports synced: {reports_synced}")
+    print(f"✓ Sprint reports unchanged: {reports_unchanged}")
     print(f"⚠️  Errors: {errors}")
 
     # Show sprint report summary
@@ -187,7 +180,7 @@ def main():
         """)
 
         print("\nSprint Predictability by Project:")
-        for row in cursor.fetchall():
+        for row in cursor:
             print(f"\n  {row['project']}:")
             print(f"    Sprints Analyzed: {row['sprint_count']}")
             print(f"    Avg Completion Rate: {row['avg_completion_rate']:.1f}%")
@@ -203,14 +196,12 @@ def main():
         """)
 
         print("\nSample Sprint Reports (10 most recent):")
-        for row in cursor.fetchall():
+        for row in cursor:
             print(f"  {row['project']} - {row['sprint_name']}: {row['completed_count']}/{row['committed_count']} ({row['completion_rate']}%)")
 
     print("\n✅ Sprint report sync complete!")
     print("\n✓ Sprint Predictability calculations can now use sprint report data")
-    print("\n✓ Restart dashboard to see updated KPIs:")
-    print("  lsof -ti:8050 | xargs kill -9")
-    print("  python src/main.py --use-db")
+    print_restart_hint("updated KPIs")
     print()
 
 
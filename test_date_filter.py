@@ -6,24 +6,19 @@ Verify date range filtering produces different results
 
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
 from database import DatabaseService
+from sync_common import DEFAULT_DB_PATH, load_config
 from kpi_calculator_db import KPICalculatorDB
 
 
 def main():
     """Test date range filtering"""
 
-    load_dotenv()
-
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    db = DatabaseService("./data/kpi_data.db")
+    config = load_config()
+    db = DatabaseService(DEFAULT_DB_PATH)
     calculator = KPICalculatorDB(db, config)
 
     print("\n" + "="*60)
@@ -36,17 +31,15 @@ def main():
     print(f"\nTesting date ranges for project: {project}")
     print("-"*60)
 
+    # Only the date-filtered KPIs, for every range in one pass
+    kpis_by_range = calculator.calculate_date_range_kpis(date_ranges, projects=[project])
+
     results = []
     for days in date_ranges:
         print(f"\n📅 Date Range: {days} days")
-        kpi_data = calculator.calculate_all_kpis(
-            date_range_days=days,
-            projects=[project]
-        )
-
-        kpis = kpi_data.get('kpis', {})
-        cycle_time = kpis.get('cycle_time', {})
-        work_mix = kpis.get('work_mix', {})
+        kpis = kpis_by_range[days]
+        cycle_time = kpis['cycle_time']
+        work_mix = kpis['work_mix']
 
         result = {
             'days': days,
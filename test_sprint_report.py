@@ -6,39 +6,18 @@ Check if we can get sprint reports with completed vs committed data
 
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 import json
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config_loader import ConfigLoader
-from jira_client import JiraClient
+from sync_common import connect_jira, load_config
 
 
 def main():
     """Test sprint report API"""
 
-    load_dotenv()
-
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    jira_config = config.get("jira", {})
-    jira_url = jira_config.get("urls", [])[0]
-    jira_email = jira_config.get("email")
-    jira_token = jira_config.get("token")
-
-    jira_client = JiraClient(jira_url, jira_email, jira_token)
-
-    print("\n" + "="*60)
-    print("TEST SPRINT REPORT API")
-    print("="*60)
-
-    if not jira_client.test_connection():
-        print("\n❌ Cannot connect to JIRA!")
-        sys.exit(1)
-
-    print("\n✓ Connected to JIRA")
+    # Pooled, rate-limited client shared with the sync scripts
+    jira_client = connect_jira("TEST SPRINT REPORT API", load_config())
 
     # Try closed CCT sprint
     board_id = 13679